@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 import json
+import asyncio
 
 from ..config import Config
 
@@ -61,6 +62,7 @@ class PaperBroker:
         # Market data simulation
         self.market_data = {}
         self.subscriptions = set()
+        self.quote_queue: Optional[asyncio.Queue] = None
         
         # State persistence
         self.state_file = "data/paper_broker_state.json"
@@ -243,21 +245,52 @@ class PaperBroker:
         for symbol in symbols:
             current_price = self._get_current_price(symbol)
             if current_price is not None:
-                quotes[symbol] = {
-                    'close': current_price,
-                    'bid': current_price * 0.999,  # Simulate bid-ask spread
-                    'ask': current_price * 1.001,
-                    'volume': np.random.randint(1000, 10000),
-                    'open_interest': np.random.randint(100, 1000),
-                    'timestamp': datetime.now()
-                }
+                quotes[symbol] = self._make_quote(current_price)
         
         return quotes
     
-    def subscribe_quotes(self, symbol: str):
-        """Subscribe to quotes for a symbol."""
-        self.subscriptions.add(symbol)
-        logger.info(f"Subscribed to quotes for {symbol}")
+    def _make_quote(self, price: float) -> Dict[str, Any]:
+        """Build a simulated quote around a price."""
+        return {
+            'close': price,
+            'bid': price * 0.999,  # Simulate bid-ask spread
+            'ask': price * 1.001,
+            'volume': np.random.randint(1000, 10000),
+            'open_interest': np.random.randint(100, 1000),
+            'timestamp': datetime.now()
+        }
+    
+    def subscribe_quotes(self, symbol: str) -> asyncio.Queue:
+        """
+        Subscribe to quotes for a symbol.
+        
+        Returns:
+            Quote queue receiving (symbol, quote) tuples for subscribed symbols
+        """
+        return self.subscribe_quotes_batch([symbol])
+    
+    def subscribe_quotes_batch(self, symbols: List[str]) -> asyncio.Queue:
+        """
+        Subscribe to quotes for several symbols in a single call.
+        
+        Returns:
+            Quote queue receiving (symbol, quote) tuples for subscribed symbols
+        """
+        self.subscriptions.update(symbols)
+        if self.quote_queue is None:
+            self.quote_queue = asyncio.Queue()
+        logger.info(f"Subscribed to quotes for {len(symbols)} symbols")
+        return self.quote_queue
+    
+    def publish_quote(self, symbol: str, quote: Dict[str, Any]):
+        """Push a quote to the quote queue if the symbol is subscribed."""
+        self.market_data[symbol] = quote['close']
+        if self.quote_queue is not None and symbol in self.subscriptions:
+            self.quote_queue.put_nowait((symbol, quote))
+    
+    def update_price(self, symbol: str, price: float):
+        """Set the current price of a symbol and publish it to subscribers."""
+        self.publish_quote(symbol, self._make_quote(price))
     
     def get_historical_data(
         self,
@@ -355,7 +388,7 @@ class PaperBroker:
         base_price = 100 + (hash(symbol) % 1000)
         price = base_price * (1 + np.random.normal(0, 0.01))
         
-        self.market_data[symbol] = price
+        self.update_price(symbol, price)
         return price
     
     def _can_execute_order(self, symbol: str, side: str, quantity: int, price: float) -> bool:
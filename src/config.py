@@ -162,6 +162,13 @@ class Settings(BaseSettings):
     log_level: str = Field("INFO", env="LOG_LEVEL")
     log_file: str = Field("logs/trading.log", env="LOG_FILE")
     
+    # Directory for fills evicted from the order manager's in-memory ring
+    # (Parquet); unset discards them
+    fill_spill_dir: Optional[str] = Field(None, env="FILL_SPILL_DIR")
+    
+    # Seconds the paper engine waits for a pushed quote before polling
+    quote_idle_timeout: float = Field(1.0, env="QUOTE_IDLE_TIMEOUT")
+    
     # Market hours
     market_open: str = Field("09:15", env="MARKET_OPEN")
     market_close: str = Field("15:30", env="MARKET_CLOSE")
@@ -240,6 +247,16 @@ class Config:
         """Check if equity trading is disabled."""
         return self.settings.disable_equity
     
+    @property
+    def fill_spill_dir(self) -> Optional[str]:
+        """Directory for fills spilled from the order manager, if any."""
+        return self.settings.fill_spill_dir
+    
+    @property
+    def quote_idle_timeout(self) -> float:
+        """Seconds without a pushed quote before the paper engine polls."""
+        return self.settings.quote_idle_timeout
+    
     def get_market_hours(self) -> MarketHoursConfig:
         """Get market hours configuration."""
         return MarketHoursConfig(
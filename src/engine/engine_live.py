@@ -57,7 +57,7 @@ class LiveTradingEngine:
         self.risk_manager = RiskManager(config)
         self.risk_monitor = RiskMonitor(self.risk_manager)
         self.broker = DhanAdapter(config)
-        self.order_manager = OrderManager()
+        self.order_manager = OrderManager(fill_spill_dir=getattr(config, 'fill_spill_dir', None))
         
         # Trading state
         self.positions: Dict[str, LivePosition] = {}
@@ -8,7 +8,11 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
-import json
+import asyncio
+import time
+import os
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 
 from ..config import Config
 from ..risk.manager import RiskManager
@@ -19,6 +23,108 @@ from .order_manager import OrderManager
 
 logger = logging.getLogger(__name__)
 
+# Time without a pushed quote before falling back to polling market data
+# (seconds); the default keeps the old once-per-second loop cadence
+DEFAULT_QUOTE_IDLE_TIMEOUT = 1.0
+
+# Minimum wall-clock interval between metric updates and state saves (seconds)
+METRICS_INTERVAL = 1.0
+
+# Minimum wall-clock interval between state file writes (seconds)
+STATE_SAVE_INTERVAL = 1.0
+
+# Initial number of symbol slots in the position arrays (grows by doubling)
+INITIAL_SYMBOL_CAPACITY = 64
+
+# Number of samples per equity curve chunk
+EQUITY_CHUNK_SIZE = 4096
+
+# Initial number of rows in the columnar fill buffer (grows by doubling)
+INITIAL_FILL_CAPACITY = 1 << 14
+
+
+# Integer side codes; the sign of a side is 1 - 2 * side
+SIDE_BUY = 0
+SIDE_SELL = 1
+SIDE_NAMES = ('BUY', 'SELL')
+
+# Number of standard normal draws generated per refill of the noise batch
+NORMAL_BATCH_SIZE = 65536
+
+
+def _slippage_kernel(sign, quantity, price, base_slippage, hour, noise):
+    """
+    Apply volume, time-of-day and random slippage to a price.
+    
+    Works elementwise on scalars or arrays of equal shape. ``sign`` is +1 for
+    buys and -1 for sells, ``noise`` is a standard normal draw.
+    """
+    # Volume-based slippage
+    volume_factor = np.minimum(quantity / 1000, 2.0)
+    
+    # Time-based slippage (higher during market open/close)
+    time_factor = 1.5 if hour in (9, 15) else 1.0
+    
+    # Random slippage component, N(1.0, 0.1)
+    random_factor = 1.0 + 0.1 * noise
+    
+    total_slippage = base_slippage * volume_factor * time_factor * random_factor
+    return price * (1 + sign * total_slippage)
+
+
+def _apply_trade(qty, avg_px, realized, idx, side, quantity, price):
+    """
+    Apply a fill to the position arrays in place.
+    
+    Reads and writes each array slot once and uses only scalar arithmetic.
+    Returns the realized P&L and the change in cost basis (quantity * avg_price).
+    """
+    position_qty = qty[idx]
+    avg_price = avg_px[idx]
+    
+    if side == SIDE_BUY:
+        new_quantity = position_qty + quantity
+        avg_px[idx] = (avg_price * position_qty + price * quantity) / new_quantity
+        qty[idx] = new_quantity
+        return 0.0, quantity * price
+    
+    qty[idx] = position_qty - quantity
+    realized_pnl = (price - avg_price) * quantity
+    realized[idx] += realized_pnl
+    return realized_pnl, -quantity * avg_price
+
+
+def _performance_kernel(equity: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Compute (total return, annualized volatility, Sharpe, max drawdown) of an
+    equity curve with at least one sample.
+    """
+    total_return = float((equity[-1] - equity[0]) / equity[0])
+    
+    # Step returns and their deviation, reusing one temporary
+    if equity.size > 1:
+        returns = np.diff(equity)
+        returns /= equity[:-1]
+        volatility = float(returns.std() * np.sqrt(252))
+    else:
+        volatility = 0.0
+    sharpe_ratio = total_return / volatility if volatility > 0 else 0.0
+    
+    # Drawdown against the running peak
+    peak = np.maximum.accumulate(equity)
+    drawdown = peak - equity
+    drawdown /= peak
+    max_drawdown = float(drawdown.max())
+    
+    return total_return, volatility, sharpe_ratio, max_drawdown
+
+
+def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+    """Return a zero-padded copy of ``array`` with the given capacity."""
+    grown = np.zeros(capacity, dtype=array.dtype)
+    grown[:array.size] = array
+    return grown
+
 
 @dataclass
 class PaperPosition:
@@ -32,19 +138,6 @@ class PaperPosition:
     entry_time: datetime
 
 
-@dataclass
-class PaperFill:
-    """Paper trading fill."""
-    timestamp: datetime
-    symbol: str
-    side: str
-    quantity: int
-    price: float
-    commission: float
-    slippage: float
-    order_id: str
-
-
 class PaperTradingEngine:
     """
     Paper trading engine with realistic execution simulation.
@@ -55,19 +148,26 @@ class PaperTradingEngine:
         self.risk_manager = RiskManager(config)
         self.risk_monitor = RiskMonitor(self.risk_manager)
         self.broker = PaperBroker(config)
-        self.order_manager = OrderManager()
+        self.order_manager = OrderManager(fill_spill_dir=getattr(config, 'fill_spill_dir', None))
+        
+        # Execution cost constants derived from config
+        self._base_slip = config.slippage_bps / 10000.0
+        self._opt_comm = float(config.options_commission)
+        self._eq_comm_rate = float(config.equity_commission) / 100.0
+        self._quote_idle_timeout = float(
+            getattr(config, 'quote_idle_timeout', DEFAULT_QUOTE_IDLE_TIMEOUT)
+        )
         
         # Trading state
-        self.positions: Dict[str, PaperPosition] = {}
-        self.fills: List[PaperFill] = []
         self.cash = config.initial_capital
         self.margin_used = 0.0
         self.daily_pnl = 0.0
         self.total_pnl = 0.0
         
         # Performance tracking
-        self.equity_curve = []
-        self.daily_returns = []
+        self._equity_chunks = [np.empty(EQUITY_CHUNK_SIZE, dtype=np.float64)]
+        self._equity_n = 0
+        self._equity_flushed = 0
         self.max_drawdown = 0.0
         self.peak_equity = config.initial_capital
         
@@ -75,276 +175,539 @@ class PaperTradingEngine:
         self.daily_loss = 0.0
         self.consecutive_losses = 0
         self.last_trade_time = None
+        self._order_seq = 0
+        
+        # Pregenerated standard normals, consumed one at a time by _randn
+        self._rng = np.random.default_rng()
+        self._nrm = self._rng.standard_normal(NORMAL_BATCH_SIZE)
+        self._nrm_i = 0
+        
+        # Latest quote per symbol, merged from the quote queue
+        self._latest_quotes: Dict[str, Any] = {}
+        
+        # Position state as parallel arrays indexed by symbol id
+        self._sym_idx: Dict[str, int] = {}
+        self._sym_list: List[str] = []
+        self._qty = np.zeros(INITIAL_SYMBOL_CAPACITY, dtype=np.int64)
+        self._avg_px = np.zeros(INITIAL_SYMBOL_CAPACITY, dtype=np.float64)
+        self._unrealized = np.zeros(INITIAL_SYMBOL_CAPACITY, dtype=np.float64)
+        self._realized = np.zeros(INITIAL_SYMBOL_CAPACITY, dtype=np.float64)
+        self._margin = np.zeros(INITIAL_SYMBOL_CAPACITY, dtype=np.float64)
+        self._entry_ns = np.zeros(INITIAL_SYMBOL_CAPACITY, dtype=np.int64)
+        
+        # Commission lookup: quantity * per-unit charge + notional * rate
+        self._comm_per_unit = np.zeros(INITIAL_SYMBOL_CAPACITY, dtype=np.float64)
+        self._comm_rate_px = np.zeros(INITIAL_SYMBOL_CAPACITY, dtype=np.float64)
+        
+        # Running totals of quantity * avg_price and unrealized P&L over all slots
+        self._cost_basis_sum = 0.0
+        self._unrealized_sum = 0.0
+        
+        # Append-only columnar fill buffer
+        self._fill_n = 0
+        self._fill_ts = np.zeros(INITIAL_FILL_CAPACITY, dtype=np.int64)
+        self._fill_oid = np.zeros(INITIAL_FILL_CAPACITY, dtype=np.int64)
+        self._fill_sid = np.zeros(INITIAL_FILL_CAPACITY, dtype=np.int64)
+        self._fill_side = np.zeros(INITIAL_FILL_CAPACITY, dtype=np.int8)
+        self._fill_qty = np.zeros(INITIAL_FILL_CAPACITY, dtype=np.int64)
+        self._fill_px = np.zeros(INITIAL_FILL_CAPACITY, dtype=np.float64)
+        self._fill_comm = np.zeros(INITIAL_FILL_CAPACITY, dtype=np.float64)
+        
+        # Subscribed universe, frozen at subscribe time
+        self._universe: Tuple[str, ...] = ()
+        self._universe_idx: Dict[str, int] = {}
+        self._universe_ids = np.empty(0, dtype=np.int64)
         
         # State persistence
         self.state_file = "data/paper_trading_state.json"
+        self.equity_file = "data/paper_trading_equity.f64"
+        
+        # Performance statistics keyed by the number of equity samples they cover
+        self._perf_cache: Tuple[int, Tuple[float, float, float, float]] = (0, ())
+        self._last_save = 0.0
         self._load_state()
     
+    @property
+    def positions(self) -> Dict[str, PaperPosition]:
+        """Open positions, materialized from the position arrays."""
+        return {
+            symbol: PaperPosition(
+                symbol=symbol,
+                quantity=int(self._qty[idx]),
+                avg_price=float(self._avg_px[idx]),
+                unrealized_pnl=float(self._unrealized[idx]),
+                realized_pnl=float(self._realized[idx]),
+                margin_used=float(self._margin[idx]),
+                entry_time=datetime.fromtimestamp(self._entry_ns[idx] / 1e9)
+            )
+            for idx, symbol in enumerate(self._sym_list)
+            if self._qty[idx] != 0
+        }
+    
+    @property
+    def equity_curve(self) -> np.ndarray:
+        """Recorded portfolio equity samples, concatenated from the chunks."""
+        full_chunks, tail = divmod(self._equity_n, EQUITY_CHUNK_SIZE)
+        parts = self._equity_chunks[:full_chunks]
+        if tail:
+            parts = parts + [self._equity_chunks[full_chunks][:tail]]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.float64)
+    
+    def _append_equity(self, value: float):
+        """Append an equity sample, starting a new chunk when the last is full."""
+        pos = self._equity_n % EQUITY_CHUNK_SIZE
+        if pos == 0 and self._equity_n > 0:
+            self._equity_chunks.append(np.empty(EQUITY_CHUNK_SIZE, dtype=np.float64))
+        self._equity_chunks[-1][pos] = value
+        self._equity_n += 1
+    
+    def get_fills_df(self) -> pd.DataFrame:
+        """Fills recorded this session as a DataFrame."""
+        n = self._fill_n
+        return pd.DataFrame({
+            'timestamp': self._fill_ts[:n].view('datetime64[ns]'),
+            'order_id': self._fill_oid[:n],
+            'symbol': np.asarray(self._sym_list, dtype=object)[self._fill_sid[:n]],
+            'side': np.asarray(SIDE_NAMES)[self._fill_side[:n]],
+            'quantity': self._fill_qty[:n],
+            'price': self._fill_px[:n],
+            'commission': self._fill_comm[:n]
+        })
+    
+    def _record_fill(
+        self,
+        timestamp_ns: int,
+        idx: int,
+        side: int,
+        quantity: int,
+        price: float,
+        commission: float
+    ):
+        """Append a fill to the columnar fill buffer."""
+        i = self._fill_n
+        if i == self._fill_ts.size:
+            capacity = 2 * self._fill_ts.size
+            self._fill_ts = _grow(self._fill_ts, capacity)
+            self._fill_oid = _grow(self._fill_oid, capacity)
+            self._fill_sid = _grow(self._fill_sid, capacity)
+            self._fill_side = _grow(self._fill_side, capacity)
+            self._fill_qty = _grow(self._fill_qty, capacity)
+            self._fill_px = _grow(self._fill_px, capacity)
+            self._fill_comm = _grow(self._fill_comm, capacity)
+        
+        self._order_seq += 1
+        self._fill_ts[i] = timestamp_ns
+        self._fill_oid[i] = self._order_seq
+        self._fill_sid[i] = idx
+        self._fill_side[i] = side
+        self._fill_qty[i] = quantity
+        self._fill_px[i] = price
+        self._fill_comm[i] = commission
+        self._fill_n = i + 1
+    
+    def _randn(self) -> float:
+        """Next standard normal draw from the pregenerated batch."""
+        if self._nrm_i == NORMAL_BATCH_SIZE:
+            self._rng.standard_normal(out=self._nrm)
+            self._nrm_i = 0
+        value = self._nrm[self._nrm_i]
+        self._nrm_i += 1
+        return value
+    
+    def _symbol_id(self, symbol: str) -> int:
+        """Get the array index for a symbol, registering it if needed."""
+        idx = self._sym_idx.get(symbol)
+        if idx is not None:
+            return idx
+        
+        idx = len(self._sym_list)
+        if idx == self._qty.size:
+            capacity = 2 * self._qty.size
+            self._qty = _grow(self._qty, capacity)
+            self._avg_px = _grow(self._avg_px, capacity)
+            self._unrealized = _grow(self._unrealized, capacity)
+            self._realized = _grow(self._realized, capacity)
+            self._margin = _grow(self._margin, capacity)
+            self._entry_ns = _grow(self._entry_ns, capacity)
+            self._comm_per_unit = _grow(self._comm_per_unit, capacity)
+            self._comm_rate_px = _grow(self._comm_rate_px, capacity)
+        
+        is_option = 'OPT' in symbol
+        self._comm_per_unit[idx] = self._opt_comm if is_option else 0.0
+        self._comm_rate_px[idx] = 0.0 if is_option else self._eq_comm_rate
+        self._sym_idx[symbol] = idx
+        self._sym_list.append(symbol)
+        return idx
+    
     def start_trading(self, strategy: BaseStrategy, universe: List[str]):
-        """Start paper trading with a strategy."""
+        """
+        Start paper trading with a strategy.
+        
+        Blocks until trading stops; callers already inside an event loop
+        should await ``start_trading_async`` instead.
+        """
+        asyncio.run(self.start_trading_async(strategy, universe))
+    
+    async def start_trading_async(self, strategy: BaseStrategy, universe: List[str]):
+        """Start paper trading with a strategy on the running event loop."""
         logger.info(f"Starting paper trading with {strategy.__class__.__name__}")
         
         # Initialize strategy
         strategy.initialize(universe, self.config)
         
         # Start market data subscription
-        self._subscribe_to_market_data(universe)
+        quote_queue = self._subscribe_to_market_data(universe)
+        
+        # Generate signals off the event loop so quote intake is never blocked.
+        # A thread rather than a process: strategies carry state from initialize()
+        signal_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="paper-signals")
         
         # Start trading loop
-        self._trading_loop(strategy)
+        try:
+            await self._trading_loop(strategy, quote_queue, signal_executor)
+        finally:
+            signal_executor.shutdown(wait=False, cancel_futures=True)
     
-    def _subscribe_to_market_data(self, universe: List[str]):
+    def _subscribe_to_market_data(self, universe: List[str]) -> asyncio.Queue:
         """Subscribe to market data for universe symbols."""
         logger.info(f"Subscribing to market data for {len(universe)} symbols")
         
+        # Register universe symbols so quotes can be indexed by symbol id
+        self._universe = tuple(universe)
+        self._universe_idx = {symbol: self._symbol_id(symbol) for symbol in self._universe}
+        self._universe_ids = np.fromiter(
+            self._universe_idx.values(), dtype=np.int64, count=len(self._universe_idx)
+        )
+        
         # This would integrate with your market data provider
         # For now, simulate subscription
-        for symbol in universe:
-            self.broker.subscribe_quotes(symbol)
+        return self.broker.subscribe_quotes_batch(list(self._universe))
+    
+    async def _next_ticks(self, quote_queue: asyncio.Queue) -> Dict[str, Any]:
+        """Wait for the next quotes, falling back to polling when the feed is idle."""
+        try:
+            symbol, quote = await asyncio.wait_for(
+                quote_queue.get(), timeout=self._quote_idle_timeout
+            )
+        except asyncio.TimeoutError:
+            return self._get_market_data()
+        
+        # Coalesce quotes that queued up behind the first one
+        ticks = {symbol: quote}
+        while not quote_queue.empty():
+            symbol, quote = quote_queue.get_nowait()
+            ticks[symbol] = quote
+        
+        return ticks
     
-    def _trading_loop(self, strategy: BaseStrategy):
-        """Main trading loop."""
+    def _merge_quotes(self, ticks: Dict[str, Any]) -> bool:
+        """Merge ticks into the latest quotes; returns whether any price changed."""
+        latest = self._latest_quotes
+        changed = False
+        for symbol, quote in ticks.items():
+            previous = latest.get(symbol)
+            if previous is None or previous['close'] != quote['close']:
+                changed = True
+            latest[symbol] = quote
+        return changed
+    
+    async def _trading_loop(
+        self,
+        strategy: BaseStrategy,
+        quote_queue: asyncio.Queue,
+        signal_executor: ThreadPoolExecutor
+    ):
+        """Main trading loop, driven by quote updates."""
         logger.info("Starting trading loop")
         
+        loop = asyncio.get_running_loop()
+        pending_signals: Optional[asyncio.Future] = None
+        last_metrics_time = 0.0
+        
         while True:
             try:
-                # Get current market data
-                market_data = self._get_market_data()
+                # Wait for at least one tracked symbol to tick
+                ticks = await self._next_ticks(quote_queue)
                 
-                if not market_data:
-                    logger.warning("No market data available")
+                # Quotes repeating the last prices leave nothing to re-evaluate
+                if not self._merge_quotes(ticks):
                     continue
                 
+                market_data = self._latest_quotes
+                now = datetime.now()
+                hour = now.hour
+                
                 # Update positions with current prices
                 self._update_positions(market_data)
                 
-                # Generate strategy signals
-                signals = strategy.generate_signals(
-                    datetime.now(),
-                    market_data,
-                    self.positions
-                )
+                # Process signals from the previous generation once it completes
+                if pending_signals is not None and pending_signals.done():
+                    completed, pending_signals = pending_signals, None
+                    signals = completed.result()
+                    if signals:
+                        self._process_signals_batch(signals, market_data, now, hour)
                 
-                # Process signals
-                for signal in signals:
-                    self._process_signal(signal, market_data)
+                # Generate strategy signals on a snapshot of the current state
+                if pending_signals is None:
+                    pending_signals = loop.run_in_executor(
+                        signal_executor,
+                        strategy.generate_signals,
+                        now,
+                        dict(market_data),
+                        self.positions
+                    )
                 
                 # Check risk limits
+                positions = self.positions
                 is_safe, violations = self.risk_manager.check_limits(
-                    self.positions, self.cash, self.margin_used, market_data
+                    positions, self.cash, self.margin_used, market_data
                 )
                 
                 if not is_safe:
                     logger.warning(f"Risk limits violated: {violations}")
                     self._handle_risk_violations(violations)
+                    positions = self.positions
                 
                 # Monitor risk and generate alerts
                 alerts = self.risk_monitor.monitor_risk(
-                    self.positions, self.cash, self.margin_used, market_data
+                    positions, self.cash, self.margin_used, market_data
                 )
                 
                 if alerts:
                     logger.info(f"Generated {len(alerts)} risk alerts")
                 
-                # Update performance metrics
-                self._update_performance_metrics()
-                
-                # Save state
-                self._save_state()
-                
-                # Sleep until next update
-                import time
-                time.sleep(1)  # 1 second update frequency
+                # Update performance metrics and save state at most once per interval
+                monotonic_now = time.monotonic()
+                if monotonic_now - last_metrics_time >= METRICS_INTERVAL:
+                    self._update_performance_metrics()
+                    self._save_state()
+                    last_metrics_time = monotonic_now
                 
             except KeyboardInterrupt:
                 logger.info("Trading stopped by user")
                 break
+            except asyncio.CancelledError:
+                # Flush the latest state, then let the cancellation propagate
+                logger.info("Trading loop cancelled")
+                self._update_performance_metrics()
+                self._save_state(force=True)
+                raise
             except Exception as e:
                 logger.error(f"Error in trading loop: {e}")
                 continue
+        
+        # Flush the latest state on shutdown
+        self._update_performance_metrics()
+        self._save_state(force=True)
     
     def _get_market_data(self) -> Dict[str, Any]:
         """Get current market data for all positions and universe."""
         # This would integrate with your market data provider
         # For now, return mock data
-        market_data = {}
+        now = datetime.now()
+        held = np.flatnonzero(self._qty[:len(self._sym_list)])
+        active = np.union1d(self._universe_ids, held)
         
-        for symbol in self.positions.keys():
-            # Mock market data
-            market_data[symbol] = {
-                'close': 100.0 + np.random.normal(0, 1),
+        # Mock market data, one vectorized draw for all symbols
+        closes = 100.0 + self._rng.standard_normal(active.size)
+        
+        return {
+            self._sym_list[idx]: {
+                'close': close,
                 'volume': 1000000,
                 'bid': 99.5,
                 'ask': 100.5,
-                'timestamp': datetime.now()
+                'timestamp': now
             }
-        
-        return market_data
+            for idx, close in zip(active.tolist(), closes.tolist())
+        }
     
     def _update_positions(self, market_data: Dict[str, Any]):
         """Update positions with current market data."""
-        for symbol, position in self.positions.items():
-            if symbol in market_data:
-                current_price = market_data[symbol]['close']
-                position.unrealized_pnl = (current_price - position.avg_price) * position.quantity
-    
-    def _process_signal(self, signal: Dict[str, Any], market_data: Dict[str, Any]):
-        """Process a trading signal."""
-        symbol = signal['symbol']
-        side = signal['side']
-        quantity = signal['quantity']
-        
-        if symbol not in market_data:
-            logger.warning(f"No market data for {symbol}")
+        n = len(self._sym_list)
+        if n == 0:
             return
         
-        # Get current market price
-        current_price = market_data[symbol]['close']
-        
-        # Simulate execution with slippage and commission
-        execution_price = self._simulate_execution(symbol, side, quantity, current_price)
-        commission = self._calculate_commission(symbol, quantity, execution_price)
+        # Symbols without a quote keep their last unrealized P&L
+        prices = np.fromiter(
+            (
+                market_data[symbol]['close'] if symbol in market_data else np.nan
+                for symbol in self._sym_list
+            ),
+            dtype=np.float64,
+            count=n
+        )
+        has_price = ~np.isnan(prices)
         
-        # Check if we can execute the trade
-        if not self._can_execute_trade(symbol, side, quantity, execution_price):
-            logger.warning(f"Cannot execute trade: {symbol} {side} {quantity}")
+        unrealized = self._unrealized[:n]
+        new_unrealized = (prices - self._avg_px[:n]) * self._qty[:n]
+        self._unrealized_sum += float(
+            np.subtract(new_unrealized, unrealized, where=has_price, out=np.zeros(n)).sum()
+        )
+        np.copyto(unrealized, new_unrealized, where=has_price)
+    
+    def _process_signals_batch(
+        self,
+        signals: List[Dict[str, Any]],
+        market_data: Dict[str, Any],
+        now: datetime,
+        hour: int
+    ):
+        """Process a batch of trading signals with vectorized pricing."""
+        tradable = []
+        for signal in signals:
+            if signal['symbol'] in market_data:
+                tradable.append(signal)
+            else:
+                logger.warning(f"No market data for {signal['symbol']}")
+        
+        n = len(tradable)
+        if n == 0:
             return
         
-        # Execute the trade
-        self._execute_trade(symbol, side, quantity, execution_price, commission)
+        symbols = [signal['symbol'] for signal in tradable]
+        symbol_ids = [self._symbol_id(symbol) for symbol in symbols]
+        sides = np.fromiter(
+            (signal['side'] != 'BUY' for signal in tradable), dtype=np.int64, count=n
+        )
+        is_buy = sides == SIDE_BUY
+        quantities = np.fromiter(
+            (signal['quantity'] for signal in tradable), dtype=np.int64, count=n
+        )
+        prices = np.fromiter(
+            (market_data[symbol]['close'] for symbol in symbols), dtype=np.float64, count=n
+        )
+        
+        # Simulate execution with slippage and commission for the whole batch
+        signs = 1 - 2 * sides
+        execution_prices = _slippage_kernel(
+            signs, quantities, prices, self._base_slip, hour, self._rng.standard_normal(n)
+        )
+        notionals = quantities * execution_prices
+        commissions = (
+            quantities * self._comm_per_unit[symbol_ids]
+            + notionals * self._comm_rate_px[symbol_ids]
+        )
         
-        logger.info(f"Executed {side} {quantity} {symbol} at {execution_price:.2f}")
+        # Lower bound on cash before each signal, assuming every earlier buy fills
+        # and no earlier sell adds cash; buys clearing it skip the exact check
+        cash_deltas = np.where(is_buy, -(notionals + commissions), notionals - commissions)
+        worst_deltas = np.minimum(cash_deltas, 0.0)
+        cash_floor = self.cash + np.cumsum(worst_deltas) - worst_deltas
+        surely_affordable = is_buy & (cash_floor >= notionals)
+        
+        for symbol, side, sure, quantity, price, commission in zip(
+            symbols,
+            sides.tolist(),
+            surely_affordable.tolist(),
+            quantities.tolist(),
+            execution_prices.tolist(),
+            commissions.tolist()
+        ):
+            # Check if we can execute the trade
+            if not sure and not self._can_execute_trade(symbol, side, quantity, price):
+                logger.warning(f"Cannot execute trade: {symbol} {SIDE_NAMES[side]} {quantity}")
+                continue
+            
+            # Execute the trade
+            self._execute_trade(symbol, side, quantity, price, commission, now)
+            
+            logger.info(f"Executed {SIDE_NAMES[side]} {quantity} {symbol} at {price:.2f}")
     
     def _simulate_execution(
         self, 
         symbol: str, 
-        side: str, 
+        side: int, 
         quantity: int, 
-        current_price: float
+        current_price: float,
+        hour: int
     ) -> float:
         """Simulate realistic execution with slippage."""
-        
-        # Base slippage from config
-        base_slippage = self.config.slippage_bps / 10000
-        
-        # Volume-based slippage
-        volume_factor = min(quantity / 1000, 2.0)
-        
-        # Time-based slippage (higher during market open/close)
-        hour = datetime.now().hour
-        time_factor = 1.5 if hour in [9, 15] else 1.0
-        
-        # Random slippage component
-        random_factor = np.random.normal(1.0, 0.1)
-        
-        total_slippage = base_slippage * volume_factor * time_factor * random_factor
-        
-        if side == 'BUY':
-            return current_price * (1 + total_slippage)
-        else:
-            return current_price * (1 - total_slippage)
+        sign = 1 - 2 * side
+        return float(_slippage_kernel(
+            sign, quantity, current_price, self._base_slip, hour, self._randn()
+        ))
     
     def _calculate_commission(self, symbol: str, quantity: int, price: float) -> float:
         """Calculate commission for a trade."""
-        notional = quantity * price
-        
-        if 'OPT' in symbol:
-            return quantity * self.config.options_commission
-        else:
-            return notional * self.config.equity_commission / 100
+        idx = self._symbol_id(symbol)
+        return float(
+            quantity * self._comm_per_unit[idx] + quantity * price * self._comm_rate_px[idx]
+        )
     
     def _can_execute_trade(
         self, 
         symbol: str, 
-        side: str, 
+        side: int, 
         quantity: int, 
         price: float
     ) -> bool:
         """Check if we can execute a trade."""
         
-        if side == 'BUY':
+        if side == SIDE_BUY:
             # Check if we have enough cash
             required_cash = quantity * price
             return self.cash >= required_cash
         else:
             # Check if we have the position
-            if symbol in self.positions:
-                return self.positions[symbol].quantity >= quantity
+            idx = self._sym_idx.get(symbol)
+            if idx is not None:
+                return self._qty[idx] >= quantity
             return False
     
     def _execute_trade(
         self, 
         symbol: str, 
-        side: str, 
+        side: int, 
         quantity: int, 
         price: float, 
-        commission: float
+        commission: float,
+        now: Optional[datetime] = None
     ):
         """Execute a trade and update positions."""
+        if now is None:
+            now = datetime.now()
         
-        # Create fill
-        fill = PaperFill(
-            timestamp=datetime.now(),
-            symbol=symbol,
-            side=side,
-            quantity=quantity,
-            price=price,
-            commission=commission,
-            slippage=0.0,  # Would calculate actual slippage
-            order_id=f"{symbol}_{side}_{datetime.now().timestamp()}"
-        )
+        idx = self._symbol_id(symbol)
         
-        # Update position
-        if symbol not in self.positions:
-            self.positions[symbol] = PaperPosition(
-                symbol=symbol,
-                quantity=0,
-                avg_price=0.0,
-                unrealized_pnl=0.0,
-                realized_pnl=0.0,
-                margin_used=0.0,
-                entry_time=datetime.now()
-            )
+        # Open a fresh position in a flat slot
+        if side == SIDE_BUY and self._qty[idx] == 0:
+            self._avg_px[idx] = 0.0
+            self._unrealized_sum -= float(self._unrealized[idx])
+            self._unrealized[idx] = 0.0
+            self._realized[idx] = 0.0
+            self._margin[idx] = 0.0
+            self._entry_ns[idx] = time.time_ns()
         
-        position = self.positions[symbol]
+        # Update position
+        realized_pnl, cost_basis_delta = _apply_trade(
+            self._qty, self._avg_px, self._realized, idx, side, quantity, price
+        )
+        self._cost_basis_sum += float(cost_basis_delta)
         
-        if side == 'BUY':
-            # Add to position
-            new_quantity = position.quantity + quantity
-            new_avg_price = (
-                (position.avg_price * position.quantity + price * quantity) 
-                / new_quantity
-            )
-            position.quantity = new_quantity
-            position.avg_price = new_avg_price
-            
+        if side == SIDE_BUY:
             # Update cash
             self.cash -= (quantity * price + commission)
             
-        else:  # SELL
-            # Reduce position
-            position.quantity -= quantity
-            
-            # Calculate realized P&L
-            realized_pnl = (price - position.avg_price) * quantity
-            position.realized_pnl += realized_pnl
+        elif side == SIDE_SELL:
+            # Book realized P&L
+            realized_pnl = float(realized_pnl)
             self.total_pnl += realized_pnl
+            self.daily_pnl += realized_pnl
             
             # Update cash
             self.cash += (quantity * price - commission)
             
-            # Remove position if quantity is zero
-            if position.quantity == 0:
-                del self.positions[symbol]
+            # Flat positions keep their slot (fills reference it) with zero quantity
+            if self._qty[idx] == 0:
+                self._unrealized_sum -= float(self._unrealized[idx])
+                self._unrealized[idx] = 0.0
         
         # Store fill
-        self.fills.append(fill)
-        
-        # Update daily P&L
-        self.daily_pnl += realized_pnl if side == 'SELL' else 0
+        self._record_fill(time.time_ns(), idx, side, quantity, price, commission)
         
         # Update last trade time
-        self.last_trade_time = datetime.now()
+        self.last_trade_time = now
     
     def _handle_risk_violations(self, violations: List[str]):
         """Handle risk limit violations."""
@@ -365,37 +728,42 @@ class PaperTradingEngine:
         """Reduce position sizes to manage risk."""
         logger.info("Reducing position sizes")
         
-        for symbol, position in self.positions.items():
-            if position.quantity > 0:
-                # Reduce position by 50%
-                reduce_qty = position.quantity // 2
-                if reduce_qty > 0:
-                    self._execute_trade(symbol, 'SELL', reduce_qty, position.avg_price, 0.0)
+        # Trades only zero out slots, so a snapshot of long indices stays valid
+        for idx in np.flatnonzero(self._qty[:len(self._sym_list)] > 0).tolist():
+            # Reduce position by 50%
+            reduce_qty = int(self._qty[idx]) // 2
+            if reduce_qty > 0:
+                self._execute_trade(
+                    self._sym_list[idx], SIDE_SELL, reduce_qty, float(self._avg_px[idx]), 0.0
+                )
     
     def _close_risky_positions(self):
         """Close positions with highest risk."""
         logger.info("Closing risky positions")
         
-        # Sort positions by risk (simplified - would use proper risk metrics)
-        risky_positions = sorted(
-            self.positions.items(),
-            key=lambda x: abs(x[1].unrealized_pnl),
-            reverse=True
-        )
+        # Rank long positions by risk (simplified - would use proper risk metrics)
+        active = np.flatnonzero(self._qty[:len(self._sym_list)] > 0)
+        k = min(3, active.size)
+        if k == 0:
+            return
         
-        # Close top 3 riskiest positions
-        for symbol, position in risky_positions[:3]:
-            if position.quantity > 0:
-                self._execute_trade(symbol, 'SELL', position.quantity, position.avg_price, 0.0)
+        # Close top 3 riskiest positions, partially selected without a full sort
+        risk = np.abs(self._unrealized[active])
+        riskiest = active[np.argpartition(risk, active.size - k)[active.size - k:]]
+        for idx in riskiest.tolist():
+            self._execute_trade(
+                self._sym_list[idx], SIDE_SELL, int(self._qty[idx]), float(self._avg_px[idx]), 0.0
+            )
     
     def _reduce_leverage(self):
         """Reduce leverage by closing positions."""
         logger.info("Reducing leverage")
         
         # Close positions to reduce margin usage
-        for symbol, position in self.positions.items():
-            if position.quantity > 0:
-                self._execute_trade(symbol, 'SELL', position.quantity, position.avg_price, 0.0)
+        for idx in np.flatnonzero(self._qty[:len(self._sym_list)] > 0).tolist():
+            self._execute_trade(
+                self._sym_list[idx], SIDE_SELL, int(self._qty[idx]), float(self._avg_px[idx]), 0.0
+            )
     
     def _hedge_exposures(self):
         """Hedge Greek exposures."""
@@ -407,12 +775,10 @@ class PaperTradingEngine:
     
     def _update_performance_metrics(self):
         """Update performance metrics."""
-        # Calculate total portfolio value
-        total_value = self.cash
-        for position in self.positions.values():
-            total_value += position.quantity * position.avg_price + position.unrealized_pnl
+        # Calculate total portfolio value from the running totals
+        total_value = self.cash + self._cost_basis_sum + self._unrealized_sum
         
-        self.equity_curve.append(total_value)
+        self._append_equity(total_value)
         
         # Update peak equity and drawdown
         if total_value > self.peak_equity:
@@ -420,14 +786,16 @@ class PaperTradingEngine:
         
         current_drawdown = (self.peak_equity - total_value) / self.peak_equity
         self.max_drawdown = max(self.max_drawdown, current_drawdown)
-        
-        # Update daily returns
-        if len(self.equity_curve) > 1:
-            daily_return = (total_value - self.equity_curve[-2]) / self.equity_curve[-2]
-            self.daily_returns.append(daily_return)
     
-    def _save_state(self):
-        """Save trading state to file."""
+    def _save_state(self, force: bool = False):
+        """Save trading state to file, at most once per STATE_SAVE_INTERVAL."""
+        now = time.monotonic()
+        if not force and now - self._last_save < STATE_SAVE_INTERVAL:
+            return
+        self._last_save = now
+        
+        self._flush_equity_curve()
+        
         state = {
             'positions': {
                 symbol: {
@@ -444,42 +812,86 @@ class PaperTradingEngine:
             'margin_used': self.margin_used,
             'daily_pnl': self.daily_pnl,
             'total_pnl': self.total_pnl,
-            'equity_curve': self.equity_curve,
+            'equity_n': self._equity_n,
             'max_drawdown': self.max_drawdown,
             'peak_equity': self.peak_equity
         }
         
-        with open(self.state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        # Write to a temp file and swap it in so a crash never leaves a torn file
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(state, option=orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_file, self.state_file)
+    
+    def _flush_equity_curve(self):
+        """Write equity samples recorded since the last flush to the equity file."""
+        # Overwrite from the last flushed sample so a partial earlier write is discarded
+        mode = 'r+b' if os.path.exists(self.equity_file) else 'wb'
+        with open(self.equity_file, mode) as f:
+            f.seek(self._equity_flushed * np.dtype(np.float64).itemsize)
+            start = self._equity_flushed
+            while start < self._equity_n:
+                chunk_idx, pos = divmod(start, EQUITY_CHUNK_SIZE)
+                stop = min(self._equity_n, (chunk_idx + 1) * EQUITY_CHUNK_SIZE)
+                self._equity_chunks[chunk_idx][pos:pos + stop - start].tofile(f)
+                start = stop
+            f.truncate()
+        self._equity_flushed = self._equity_n
     
     def _load_state(self):
         """Load trading state from file."""
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            with open(self.state_file, 'rb') as f:
+                state = orjson.loads(f.read())
             
             # Restore positions
-            self.positions = {}
             for symbol, pos_data in state.get('positions', {}).items():
-                self.positions[symbol] = PaperPosition(
-                    symbol=symbol,
-                    quantity=pos_data['quantity'],
-                    avg_price=pos_data['avg_price'],
-                    unrealized_pnl=pos_data['unrealized_pnl'],
-                    realized_pnl=pos_data['realized_pnl'],
-                    margin_used=pos_data['margin_used'],
-                    entry_time=datetime.fromisoformat(pos_data['entry_time'])
+                idx = self._symbol_id(symbol)
+                self._qty[idx] = pos_data['quantity']
+                self._avg_px[idx] = pos_data['avg_price']
+                self._unrealized[idx] = pos_data['unrealized_pnl']
+                self._realized[idx] = pos_data['realized_pnl']
+                self._margin[idx] = pos_data['margin_used']
+                self._entry_ns[idx] = int(
+                    datetime.fromisoformat(pos_data['entry_time']).timestamp() * 1e9
                 )
             
+            n = len(self._sym_list)
+            self._cost_basis_sum = float(self._qty[:n] @ self._avg_px[:n])
+            self._unrealized_sum = float(self._unrealized[:n].sum())
+            
             # Restore other state
             self.cash = state.get('cash', self.config.initial_capital)
             self.margin_used = state.get('margin_used', 0.0)
             self.daily_pnl = state.get('daily_pnl', 0.0)
             self.total_pnl = state.get('total_pnl', 0.0)
-            self.equity_curve = state.get('equity_curve', [])
+            equity_n = state.get('equity_n', 0)
+            # State files from before the binary equity file embed the curve
+            legacy_curve = state.get('equity_curve')
+            if legacy_curve is not None and 'equity_n' not in state:
+                equity_curve = np.asarray(legacy_curve, dtype=np.float64)
+            elif equity_n and os.path.exists(self.equity_file):
+                equity_curve = np.fromfile(self.equity_file, dtype=np.float64, count=equity_n)
+            else:
+                equity_curve = np.empty(0, dtype=np.float64)
+            self._equity_chunks = []
+            for start in range(0, max(equity_curve.size, 1), EQUITY_CHUNK_SIZE):
+                chunk = np.empty(EQUITY_CHUNK_SIZE, dtype=np.float64)
+                part = equity_curve[start:start + EQUITY_CHUNK_SIZE]
+                chunk[:part.size] = part
+                self._equity_chunks.append(chunk)
+            self._equity_n = equity_curve.size
+            self._equity_flushed = equity_curve.size
             self.max_drawdown = state.get('max_drawdown', 0.0)
             self.peak_equity = state.get('peak_equity', self.config.initial_capital)
             
+            if legacy_curve is not None and 'equity_n' not in state:
+                # Migrate once: write the whole curve to the equity file and
+                # rewrite the state without it
+                self._equity_flushed = 0
+                self._save_state(force=True)
+                logger.info(f"Migrated {equity_curve.size} equity samples to {self.equity_file}")
+            
             logger.info("Loaded paper trading state from file")
             
         except FileNotFoundError:
@@ -489,20 +901,25 @@ class PaperTradingEngine:
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get performance summary."""
-        if not self.equity_curve:
+        if self._equity_n == 0:
             return {}
         
-        total_return = (self.equity_curve[-1] - self.equity_curve[0]) / self.equity_curve[0]
-        volatility = np.std(self.daily_returns) * np.sqrt(252) if self.daily_returns else 0
-        sharpe_ratio = total_return / volatility if volatility > 0 else 0
+        # Only recompute when new equity samples have been recorded
+        cached_n, stats = self._perf_cache
+        if cached_n != self._equity_n:
+            stats = _performance_kernel(self.equity_curve)
+            self._perf_cache = (self._equity_n, stats)
+        total_return, volatility, sharpe_ratio, max_drawdown = stats
+        
+        last_chunk, pos = divmod(self._equity_n - 1, EQUITY_CHUNK_SIZE)
         
         return {
             'total_return': total_return,
             'volatility': volatility,
             'sharpe_ratio': sharpe_ratio,
-            'max_drawdown': self.max_drawdown,
+            'max_drawdown': max(self.max_drawdown, max_drawdown),
             'total_pnl': self.total_pnl,
-            'current_equity': self.equity_curve[-1] if self.equity_curve else self.config.initial_capital,
-            'position_count': len(self.positions),
-            'total_trades': len(self.fills)
+            'current_equity': float(self._equity_chunks[last_chunk][pos]),
+            'position_count': int(np.count_nonzero(self._qty[:len(self._sym_list)])),
+            'total_trades': self._fill_n
         }
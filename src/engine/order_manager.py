@@ -4,38 +4,104 @@ Order management system for multi-leg orders and risk control.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime
 import logging
-from enum import Enum
+from enum import IntEnum
+from collections import defaultdict, deque
+from collections.abc import Iterator, Mapping
+import bisect
+import itertools
+import csv
+import time
+import threading
+import os
 import uuid
 
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
+DEFAULT_MAX_FILLS = 1 << 16
+INITIAL_ORDER_CAPACITY = 1024
+# Rebuild the order store once this share of its rows belongs to removed orders
+COMPACT_DEAD_FRACTION = 0.5
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
-class OrderStatus(Enum):
+ORDER_EXPORT_COLUMNS = (
+    'order_id', 'order_type', 'status', 'created_time', 'updated_time',
+    'filled_quantity', 'remaining_quantity', 'average_price',
+    'total_commission', 'parent_order_id'
+)
+
+# In-process leg ids; next() on itertools.count is atomic under the GIL
+_leg_counter = itertools.count()
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Local naive datetime for an epoch-nanosecond timestamp."""
+    return datetime.fromtimestamp(ns / 1e9)
+
+
+def _ns_to_local_datetime64(ns: np.ndarray, utc_offset: int) -> np.ndarray:
+    """Local naive datetime64[ns] for epoch nanoseconds, matching _ns_to_datetime."""
+    return (ns.view(np.int64) + utc_offset * 1_000_000_000).view('datetime64[ns]')
+
+
+class OrderStatus(IntEnum):
     """Order status enumeration."""
-    PENDING = "pending"
-    SUBMITTED = "submitted"
-    FILLED = "filled"
-    PARTIALLY_FILLED = "partially_filled"
-    CANCELLED = "cancelled"
-    REJECTED = "rejected"
-    EXPIRED = "expired"
+    PENDING = 0
+    SUBMITTED = 1
+    FILLED = 2
+    PARTIALLY_FILLED = 3
+    CANCELLED = 4
+    REJECTED = 5
+    EXPIRED = 6
+    # A broker call for the order is in flight
+    SUBMITTING = 7
+    CANCELLING = 8
+    
+    @property
+    def label(self) -> str:
+        """Lower-case name used in exports."""
+        return self.name.lower()
 
 
-class OrderType(Enum):
+_ACTIVE_STATES = frozenset({
+    OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIALLY_FILLED,
+    OrderStatus.SUBMITTING, OrderStatus.CANCELLING
+})
+# Orders that may be sent a cancel; in-flight orders wait for their call
+_CANCELLABLE_STATES = frozenset({
+    OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIALLY_FILLED
+})
+_TERMINAL_STATES = frozenset({
+    OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED
+})
+# Status after a fill, indexed by "order fully filled"
+_STATUS_ON_FILL = (OrderStatus.PARTIALLY_FILLED, OrderStatus.FILLED)
+_STATUS_LABELS = np.array([status.label for status in OrderStatus], dtype=object)
+
+
+class OrderType(IntEnum):
     """Order type enumeration."""
-    MARKET = "market"
-    LIMIT = "limit"
-    STOP = "stop"
-    STOP_LIMIT = "stop_limit"
-    BRACKET = "bracket"
-    OCO = "oco"  # One Cancels Other
+    MARKET = 0
+    LIMIT = 1
+    STOP = 2
+    STOP_LIMIT = 3
+    BRACKET = 4
+    OCO = 5  # One Cancels Other
+    
+    @property
+    def label(self) -> str:
+        """Lower-case name used in exports."""
+        return self.name.lower()
+
 
+_TYPE_LABELS = np.array([order_type.label for order_type in OrderType], dtype=object)
 
-@dataclass
+
+@dataclass(slots=True)
 class OrderLeg:
     """Order leg for multi-leg orders."""
     symbol: str
@@ -47,10 +113,10 @@ class OrderLeg:
     
     def __post_init__(self):
         if self.leg_id is None:
-            self.leg_id = str(uuid.uuid4())
+            self.leg_id = f"LEG_{next(_leg_counter):08d}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order data structure."""
     order_id: str
@@ -61,10 +127,12 @@ class Order:
     updated_time: datetime
     filled_quantity: int = 0
     remaining_quantity: int = 0
-    average_price: float = 0.0
+    notional_value: float = 0.0
     total_commission: float = 0.0
     parent_order_id: Optional[str] = None
     child_order_ids: List[str] = None
+    created_ns: int = 0
+    fill_percentage: float = 0.0
     
     def __post_init__(self):
         if self.child_order_ids is None:
@@ -73,22 +141,23 @@ class Order:
         # Calculate total quantity
         self.remaining_quantity = sum(leg.quantity for leg in self.legs)
     
+    @property
+    def average_price(self) -> float:
+        """Volume-weighted average fill price."""
+        if self.filled_quantity == 0:
+            return 0.0
+        return self.notional_value / self.filled_quantity
+    
     def is_filled(self) -> bool:
         """Check if order is completely filled."""
         return self.status == OrderStatus.FILLED
     
     def is_active(self) -> bool:
         """Check if order is active (not filled, cancelled, or rejected)."""
-        return self.status in [OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIALLY_FILLED]
-    
-    def get_fill_percentage(self) -> float:
-        """Get fill percentage."""
-        if self.remaining_quantity == 0:
-            return 1.0
-        return self.filled_quantity / (self.filled_quantity + self.remaining_quantity)
+        return self.status in _ACTIVE_STATES
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Fill:
     """Fill data structure."""
     fill_id: str
@@ -102,15 +171,404 @@ class Fill:
     timestamp: datetime
 
 
+class FillRing:
+    """
+    Fixed-capacity columnar fill buffer backed by preallocated NumPy arrays.
+    
+    Fills are addressed by a monotonically increasing sequence number and
+    stored in slot ``seq % capacity``. When the ring is full the oldest
+    ``flush_block`` rows are spilled to a Parquet file in ``spill_dir`` (or
+    discarded if no directory is set) to make room. Spilled rows are copied
+    out and queued; ``write_spills`` writes them, so a caller holding a lock
+    can do the file I/O after releasing it. Spill file names carry a
+    per-ring session prefix, so rings sharing a directory (or a restarted
+    engine) never overwrite each other's files.
+    """
+    
+    _COLUMNS = (
+        'fill_id', 'order_id', 'leg_id', 'symbol', 'side',
+        'quantity', 'price', 'commission', 'timestamp'
+    )
+    
+    def __init__(
+        self,
+        capacity: int = DEFAULT_MAX_FILLS,
+        flush_block: Optional[int] = None,
+        spill_dir: Optional[str] = None
+    ):
+        self.capacity = capacity
+        self.flush_block = flush_block or max(1, capacity // 4)
+        self.spill_dir = spill_dir
+        self.session = f"{datetime.now():%Y%m%dT%H%M%S}_{uuid.uuid4().hex[:8]}"
+        self.head = 0  # sequence number of the next fill
+        self.tail = 0  # sequence number of the oldest fill still held
+        self._pending_spills: deque = deque()
+        
+        self.fill_id = np.empty(capacity, dtype=object)
+        self.order_id = np.empty(capacity, dtype=object)
+        self.leg_id = np.empty(capacity, dtype=object)
+        self.symbol = np.empty(capacity, dtype=object)
+        self.side = np.empty(capacity, dtype=object)
+        self.quantity = np.zeros(capacity, dtype=np.int64)
+        self.price = np.zeros(capacity, dtype=np.float64)
+        self.commission = np.zeros(capacity, dtype=np.float64)
+        self.timestamp = np.zeros(capacity, dtype='datetime64[ns]')
+    
+    def __len__(self) -> int:
+        return self.head - self.tail
+    
+    def append(
+        self,
+        fill_id: str,
+        order_id: str,
+        leg_id: str,
+        symbol: str,
+        side: str,
+        quantity: int,
+        price: float,
+        commission: float,
+        timestamp_ns: int
+    ) -> int:
+        """Write one fill and return its sequence number."""
+        self._reserve(1)
+        seq = self.head
+        i = seq % self.capacity
+        
+        self.fill_id[i] = fill_id
+        self.order_id[i] = order_id
+        self.leg_id[i] = leg_id
+        self.symbol[i] = symbol
+        self.side[i] = side
+        self.quantity[i] = quantity
+        self.price[i] = price
+        self.commission[i] = commission
+        self.timestamp[i] = timestamp_ns
+        self.head = seq + 1
+        return seq
+    
+    def extend(
+        self,
+        fill_ids: List[str],
+        order_ids,
+        leg_ids,
+        symbols,
+        sides,
+        quantities: np.ndarray,
+        prices: np.ndarray,
+        commissions: np.ndarray,
+        timestamp_ns: int
+    ) -> range:
+        """Write a block of fills and return their sequence numbers."""
+        start = self.head
+        k = len(fill_ids)
+        
+        # Blocks larger than the ring go in ring-sized pieces
+        for a in range(0, k, self.capacity):
+            b = min(a + self.capacity, k)
+            self._reserve(b - a)
+            slots = np.arange(self.head, self.head + b - a) % self.capacity
+            
+            self.fill_id[slots] = fill_ids[a:b]
+            self.order_id[slots] = _block(order_ids, a, b)
+            self.leg_id[slots] = _block(leg_ids, a, b)
+            self.symbol[slots] = _block(symbols, a, b)
+            self.side[slots] = _block(sides, a, b)
+            self.quantity[slots] = quantities[a:b]
+            self.price[slots] = prices[a:b]
+            self.commission[slots] = commissions[a:b]
+            self.timestamp[slots] = timestamp_ns
+            self.head += b - a
+        
+        return range(start, start + k)
+    
+    def __contains__(self, seq: int) -> bool:
+        return self.tail <= seq < self.head
+    
+    def row(self, seq: int) -> Fill:
+        """Materialize a single retained fill."""
+        if seq not in self:
+            raise IndexError(f"Fill {seq} is no longer held in the ring")
+        i = seq % self.capacity
+        return Fill(
+            fill_id=self.fill_id[i],
+            order_id=self.order_id[i],
+            leg_id=self.leg_id[i],
+            symbol=self.symbol[i],
+            side=self.side[i],
+            quantity=int(self.quantity[i]),
+            price=float(self.price[i]),
+            commission=float(self.commission[i]),
+            timestamp=_ns_to_datetime(int(self.timestamp[i].view(np.int64)))
+        )
+    
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Retained fills, oldest first; views unless the ring has wrapped."""
+        return self._take(self.tail, self.head)
+    
+    def _take(self, start: int, end: int) -> Dict[str, np.ndarray]:
+        i = start % self.capacity
+        if i + (end - start) <= self.capacity:
+            index = slice(i, i + end - start)
+        else:
+            index = np.arange(start, end) % self.capacity
+        return {name: getattr(self, name)[index] for name in self._COLUMNS}
+    
+    def _reserve(self, k: int):
+        """Spill the oldest rows until ``k`` more rows fit."""
+        while self.head + k - self.tail > self.capacity:
+            self._spill(min(self.flush_block, self.head - self.tail))
+    
+    def write_spills(self):
+        """Write spilled blocks queued by earlier appends to Parquet."""
+        while self._pending_spills:
+            try:
+                path, columns = self._pending_spills.popleft()
+            except IndexError:  # another thread took the last block
+                return
+            
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            table = pa.Table.from_arrays(
+                [pa.array(values) for values in columns.values()],
+                names=list(columns)
+            )
+            os.makedirs(self.spill_dir, exist_ok=True)
+            # 'x' refuses to replace a file that is already there
+            with open(path, 'xb') as f:
+                pq.write_table(table, f, compression='zstd')
+    
+    def _spill(self, k: int):
+        if self.spill_dir is not None:
+            # Copy now: the slots are reused before the block is written
+            columns = {
+                name: values.copy()
+                for name, values in self._take(self.tail, self.tail + k).items()
+            }
+            path = os.path.join(self.spill_dir, f"fills_{self.session}_{self.tail:012d}.parquet")
+            self._pending_spills.append((path, columns))
+        
+        # Release string references held by the spilled slots
+        index = np.arange(self.tail, self.tail + k) % self.capacity
+        for name in ('fill_id', 'order_id', 'leg_id', 'symbol', 'side'):
+            getattr(self, name)[index] = None
+        self.tail += k
+
+
+class OrderStore:
+    """
+    Columnar order state keyed by a dense integer index.
+    
+    Each order gets the next row when it is created and ``index`` maps its ID
+    to that row, so the ID is hashed once per event. Timestamps are stored as
+    epoch nanoseconds. Rows of removed orders stay in place until the store
+    is rebuilt with ``compacted``.
+    """
+    
+    _COLUMNS = (
+        'order_id', 'order_type', 'status', 'legs', 'created_ns',
+        'updated_ns', 'filled_quantity', 'remaining_quantity',
+        'notional_value', 'total_commission', 'fill_percentage',
+        'parent_order_id', 'child_order_ids'
+    )
+    
+    def __init__(self, capacity: int = INITIAL_ORDER_CAPACITY):
+        self.n = 0
+        self.dead = 0
+        self.index: Dict[str, int] = {}
+        self.order_id = np.empty(capacity, dtype=object)
+        self.order_type = np.zeros(capacity, dtype=np.int8)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.legs = np.empty(capacity, dtype=object)
+        self.created_ns = np.zeros(capacity, dtype=np.int64)
+        self.updated_ns = np.zeros(capacity, dtype=np.int64)
+        self.filled_quantity = np.zeros(capacity, dtype=np.int64)
+        self.remaining_quantity = np.zeros(capacity, dtype=np.int64)
+        self.notional_value = np.zeros(capacity, dtype=np.float64)
+        self.total_commission = np.zeros(capacity, dtype=np.float64)
+        self.fill_percentage = np.zeros(capacity, dtype=np.float64)
+        self.parent_order_id = np.empty(capacity, dtype=object)
+        self.child_order_ids = np.empty(capacity, dtype=object)
+    
+    def add(
+        self,
+        order_id: str,
+        order_type: OrderType,
+        legs: List[OrderLeg],
+        parent_order_id: Optional[str],
+        now_ns: int
+    ) -> int:
+        """Write a new pending order into the next row and return its index."""
+        i = self.n
+        if i == self.status.size:
+            self._grow(2 * self.status.size)
+        
+        self.order_id[i] = order_id
+        self.order_type[i] = order_type
+        self.status[i] = OrderStatus.PENDING
+        self.legs[i] = legs
+        self.created_ns[i] = now_ns
+        self.updated_ns[i] = now_ns
+        self.filled_quantity[i] = 0
+        self.remaining_quantity[i] = sum(leg.quantity for leg in legs)
+        self.notional_value[i] = 0.0
+        self.total_commission[i] = 0.0
+        self.fill_percentage[i] = 0.0 if self.remaining_quantity[i] else 1.0
+        self.parent_order_id[i] = parent_order_id
+        self.child_order_ids[i] = []
+        self.index[order_id] = i
+        self.n = i + 1
+        return i
+    
+    def update_fill_percentage(self, rows):
+        """Refresh the cached fill ratio for ``rows`` after their quantities change."""
+        filled = self.filled_quantity[rows]
+        total = filled + self.remaining_quantity[rows]
+        self.fill_percentage[rows] = np.divide(
+            filled, total, out=np.ones(np.shape(total)), where=total != 0
+        )
+    
+    def remove(self, order_id: str):
+        """Drop an order from the index and release its object references."""
+        i = self.index.pop(order_id)
+        self.legs[i] = None
+        self.child_order_ids[i] = None
+        self.dead += 1
+    
+    def live_rows(self) -> np.ndarray:
+        """Rows of orders still in the index, in creation order."""
+        return np.fromiter(tuple(self.index.values()), dtype=np.intp)
+    
+    def compacted(self) -> 'OrderStore':
+        """A new store holding only the live rows, renumbered from zero."""
+        live = self.live_rows()
+        store = OrderStore(max(INITIAL_ORDER_CAPACITY, 2 * live.size))
+        for name in self._COLUMNS:
+            getattr(store, name)[:live.size] = getattr(self, name)[live]
+        store.index = dict(zip(store.order_id[:live.size].tolist(), range(live.size)))
+        store.n = live.size
+        return store
+    
+    def view(self, i: int) -> Order:
+        """Materialize row ``i`` as an Order snapshot."""
+        order = Order(
+            order_id=self.order_id[i],
+            order_type=OrderType(int(self.order_type[i])),
+            legs=self.legs[i],
+            status=OrderStatus(int(self.status[i])),
+            created_time=_ns_to_datetime(int(self.created_ns[i])),
+            updated_time=_ns_to_datetime(int(self.updated_ns[i])),
+            filled_quantity=int(self.filled_quantity[i]),
+            notional_value=float(self.notional_value[i]),
+            total_commission=float(self.total_commission[i]),
+            parent_order_id=self.parent_order_id[i],
+            child_order_ids=list(self.child_order_ids[i]),
+            created_ns=int(self.created_ns[i]),
+            fill_percentage=float(self.fill_percentage[i])
+        )
+        # __post_init__ derives this from the legs; use the stored value
+        order.remaining_quantity = int(self.remaining_quantity[i])
+        return order
+    
+    def _grow(self, capacity: int):
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:column.size] = column
+            setattr(self, name, grown)
+
+
+def _apply_fills_core(
+    order_idx: np.ndarray,
+    quantities: np.ndarray,
+    prices: np.ndarray,
+    commissions: np.ndarray,
+    n_orders: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate a batch of fills per order.
+    
+    Takes only flat arrays and a dense order index, so the whole batch is
+    reduced without touching Python objects.
+    
+    Returns:
+        Filled quantity, notional and commission per order index
+    """
+    filled = np.bincount(order_idx, weights=quantities, minlength=n_orders)
+    notional = np.bincount(order_idx, weights=quantities * prices, minlength=n_orders)
+    commission = np.bincount(order_idx, weights=commissions, minlength=n_orders)
+    return filled.astype(np.int64), notional, commission
+
+
+def _csv_values(values: np.ndarray) -> list:
+    """Python values for one export column; ns timestamps go out as datetimes."""
+    if values.dtype.kind == 'M':
+        values = values.astype('datetime64[us]')
+    return values.tolist()
+
+
+def _block(values, a: int, b: int):
+    """Slice a per-fill sequence, passing scalars through for broadcasting."""
+    if isinstance(values, str) or np.ndim(values) == 0:
+        return values
+    return values[a:b]
+
+
+class OrdersView(Mapping):
+    """
+    Read-only mapping of live order IDs to Order snapshots.
+    
+    Orders live in the manager's columnar OrderStore; each lookup builds a
+    fresh Order from its row, and only for the orders actually read.
+    Snapshots are copies, so assigning to one (``orders[oid].status = ...``)
+    does not change the order: go through OrderManager.update_order_status,
+    add_fill or cancel_order instead.
+    """
+    
+    __slots__ = ('_manager',)
+    
+    def __init__(self, manager: 'OrderManager'):
+        self._manager = manager
+    
+    def __getitem__(self, order_id: str) -> Order:
+        # Read the store reference once; compaction swaps in a new store
+        store = self._manager._store
+        return store.view(store.index[order_id])
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(tuple(self._manager._store.index))
+    
+    def __len__(self) -> int:
+        return len(self._manager._store.index)
+    
+    def __contains__(self, order_id: object) -> bool:
+        return order_id in self._manager._store.index
+
+
 class OrderManager:
     """
     Order management system for multi-leg orders and risk control.
     """
     
-    def __init__(self):
-        self.orders: Dict[str, Order] = {}
-        self.fills: List[Fill] = []
+    def __init__(
+        self,
+        max_fills: int = DEFAULT_MAX_FILLS,
+        fill_spill_dir: Optional[str] = None
+    ):
+        self._lock = threading.Lock()
+        self._store = OrderStore()
+        self.fills = FillRing(max_fills, spill_dir=fill_spill_dir)
+        self._fills_by_order: Dict[str, List[int]] = defaultdict(list)
+        self._total_commission = 0.0
         self.order_counter = 0
+        self.fill_counter = 0
+        
+        # Status indices, kept in sync by _set_status
+        self._active_order_ids: Set[str] = set()
+        self._status_index: Dict[OrderStatus, Set[str]] = {s: set() for s in OrderStatus}
+        
+        # (terminal_ns, order_id) in the order orders became terminal
+        self._terminal_fifo: deque = deque()
         
         # Risk controls
         self.max_open_orders = 100
@@ -119,7 +577,17 @@ class OrderManager:
         
         # Order tracking
         self.daily_order_count = 0
-        self.last_reset_date = datetime.now().date()
+        self._utc_offset = time.localtime().tm_gmtoff
+        self._last_reset_day = self._local_day()
+    
+    @property
+    def orders(self) -> OrdersView:
+        """
+        Live orders by ID, as a read-only mapping of Order snapshots.
+        
+        Changes must go through the manager's methods; see OrdersView.
+        """
+        return OrdersView(self)
     
     def create_order(
         self,
@@ -138,32 +606,17 @@ class OrderManager:
         Returns:
             Order ID
         """
-        # Check risk limits
-        if not self._check_order_limits():
-            raise ValueError("Order limits exceeded")
-        
-        # Generate order ID
-        order_id = f"ORD_{self.order_counter:06d}"
-        self.order_counter += 1
-        
-        # Create order
-        order = Order(
-            order_id=order_id,
-            order_type=order_type,
-            legs=legs,
-            status=OrderStatus.PENDING,
-            created_time=datetime.now(),
-            updated_time=datetime.now(),
-            parent_order_id=parent_order_id
-        )
-        
-        # Store order
-        self.orders[order_id] = order
-        
-        # Update daily count
-        self._update_daily_count()
+        with self._lock:
+            # Check risk limits
+            if not self._check_order_limits():
+                raise ValueError("Order limits exceeded")
+            
+            order_id = self._construct(order_type, legs, parent_order_id, time.time_ns())
+            
+            # Update daily count
+            self._update_daily_count()
         
-        logger.info(f"Created order {order_id} with {len(legs)} legs")
+        logger.info("Created order %s with %s legs", order_id, len(legs))
         
         return order_id
     
@@ -184,28 +637,49 @@ class OrderManager:
         Returns:
             Parent order ID
         """
-        # Create parent order for entry
-        parent_order_id = self.create_order(OrderType.MARKET, [entry_leg])
-        
-        # Create child orders for stop loss and take profit
-        stop_order_id = self.create_order(
-            OrderType.STOP,
-            [stop_loss_leg],
-            parent_order_id
-        )
+        now_ns = time.time_ns()
         
-        take_order_id = self.create_order(
-            OrderType.LIMIT,
-            [take_profit_leg],
-            parent_order_id
+        with self._lock:
+            # The three orders are checked and counted as one unit
+            if not self._check_order_limits(3):
+                raise ValueError("Order limits exceeded")
+            
+            # Parent order for entry, children for stop loss and take profit
+            parent_id = self._construct(OrderType.MARKET, [entry_leg], None, now_ns)
+            stop_id = self._construct(OrderType.STOP, [stop_loss_leg], parent_id, now_ns)
+            take_id = self._construct(OrderType.LIMIT, [take_profit_leg], parent_id, now_ns)
+            
+            # Link child orders to parent
+            store = self._store
+            store.child_order_ids[store.index[parent_id]] = [stop_id, take_id]
+            
+            self._update_daily_count(3)
+        
+        logger.info(
+            "Created bracket order %s with children %s, %s",
+            parent_id, stop_id, take_id
         )
         
-        # Link child orders to parent
-        self.orders[parent_order_id].child_order_ids = [stop_order_id, take_order_id]
+        return parent_id
+    
+    def _construct(
+        self,
+        order_type: OrderType,
+        legs: List[OrderLeg],
+        parent_order_id: Optional[str],
+        now_ns: int
+    ) -> str:
+        """Store and index a pending order and return its ID; limits are the caller's job."""
+        # Generate order ID
+        order_id = f"ORD_{self.order_counter:06d}"
+        self.order_counter += 1
         
-        logger.info(f"Created bracket order {parent_order_id} with children {stop_order_id}, {take_order_id}")
+        # Store order
+        self._store.add(order_id, order_type, legs, parent_order_id, now_ns)
+        self._status_index[OrderStatus.PENDING].add(order_id)
+        self._active_order_ids.add(order_id)
         
-        return parent_order_id
+        return order_id
     
     def create_oco_order(
         self,
@@ -225,7 +699,7 @@ class OrderManager:
         # Create OCO order with both legs
         order_id = self.create_order(OrderType.OCO, [leg1, leg2])
         
-        logger.info(f"Created OCO order {order_id}")
+        logger.info("Created OCO order %s", order_id)
         
         return order_id
     
@@ -239,36 +713,42 @@ class OrderManager:
         Returns:
             Success status
         """
-        if order_id not in self.orders:
-            logger.error(f"Order {order_id} not found")
-            return False
-        
-        order = self.orders[order_id]
-        
-        if order.status != OrderStatus.PENDING:
-            logger.error(f"Order {order_id} is not in pending status")
-            return False
+        with self._lock:
+            store = self._store
+            idx = store.index.get(order_id)
+            
+            if idx is None:
+                logger.error("Order %s not found", order_id)
+                return False
+            
+            if store.status[idx] != OrderStatus.PENDING:
+                logger.error("Order %s is not in pending status", order_id)
+                return False
+            
+            # Claim the order so a second submit or a cancel sees it in flight
+            self._set_status(idx, OrderStatus.SUBMITTING)
+            order = store.view(idx)
         
+        # Broker I/O happens outside the lock
         try:
             # Submit to broker (this would integrate with your broker)
             success = self._submit_to_broker(order)
-            
-            if success:
-                order.status = OrderStatus.SUBMITTED
-                order.updated_time = datetime.now()
-                logger.info(f"Order {order_id} submitted successfully")
-            else:
-                order.status = OrderStatus.REJECTED
-                order.updated_time = datetime.now()
-                logger.error(f"Order {order_id} submission failed")
-            
-            return success
-            
         except Exception as e:
-            logger.error(f"Error submitting order {order_id}: {e}")
-            order.status = OrderStatus.REJECTED
-            order.updated_time = datetime.now()
+            logger.error("Error submitting order %s: %s", order_id, e)
+            self._finish_broker_call(order_id, OrderStatus.SUBMITTING, OrderStatus.REJECTED)
             return False
+        
+        self._finish_broker_call(
+            order_id, OrderStatus.SUBMITTING,
+            OrderStatus.SUBMITTED if success else OrderStatus.REJECTED
+        )
+        
+        if success:
+            logger.info("Order %s submitted successfully", order_id)
+        else:
+            logger.error("Order %s submission failed", order_id)
+        
+        return success
     
     def cancel_order(self, order_id: str) -> bool:
         """
@@ -280,38 +760,82 @@ class OrderManager:
         Returns:
             Success status
         """
-        if order_id not in self.orders:
-            logger.error(f"Order {order_id} not found")
-            return False
-        
-        order = self.orders[order_id]
-        
-        if not order.is_active():
-            logger.error(f"Order {order_id} is not active")
-            return False
+        with self._lock:
+            store = self._store
+            idx = store.index.get(order_id)
+            
+            if idx is None:
+                logger.error("Order %s not found", order_id)
+                return False
+            
+            previous = OrderStatus(int(store.status[idx]))
+            if previous not in _CANCELLABLE_STATES:
+                logger.error("Order %s is not active or has a broker call in flight", order_id)
+                return False
+            
+            self._set_status(idx, OrderStatus.CANCELLING)
+            order = store.view(idx)
         
+        # Broker I/O happens outside the lock
         try:
             # Cancel with broker
             success = self._cancel_with_broker(order)
-            
-            if success:
-                order.status = OrderStatus.CANCELLED
-                order.updated_time = datetime.now()
-                logger.info(f"Order {order_id} cancelled successfully")
-            else:
-                logger.error(f"Failed to cancel order {order_id}")
-            
-            return success
-            
         except Exception as e:
-            logger.error(f"Error cancelling order {order_id}: {e}")
-            return False
+            logger.error("Error cancelling order %s: %s", order_id, e)
+            success = False
+        
+        # A fill that landed during the call has already moved the order on
+        self._finish_broker_call(
+            order_id, OrderStatus.CANCELLING,
+            OrderStatus.CANCELLED if success else previous
+        )
+        if success:
+            logger.info("Order %s cancelled successfully", order_id)
+        else:
+            logger.error("Failed to cancel order %s", order_id)
+        
+        return success
     
     def update_order_status(self, order_id: str, status: OrderStatus):
         """Update order status."""
-        if order_id in self.orders:
-            self.orders[order_id].status = status
-            self.orders[order_id].updated_time = datetime.now()
+        with self._lock:
+            idx = self._store.index.get(order_id)
+            if idx is not None:
+                self._set_status(idx, status)
+                self._store.updated_ns[idx] = time.time_ns()
+    
+    def _finish_broker_call(self, order_id: str, expected: OrderStatus, status: OrderStatus):
+        """
+        Record the outcome of a broker call made outside the lock.
+        
+        The new status applies only if the order is still in the ``expected``
+        in-flight status; otherwise a fill or status update won the race.
+        """
+        with self._lock:
+            # Look the row up again; the order may have been removed meanwhile
+            idx = self._store.index.get(order_id)
+            if idx is not None and self._store.status[idx] == expected:
+                self._set_status(idx, status)
+                self._store.updated_ns[idx] = time.time_ns()
+    
+    def _set_status(self, idx: int, new_status: OrderStatus):
+        """Move an order to a new status, keeping the status indices in sync.
+        
+        Callers must hold ``self._lock``.
+        """
+        store = self._store
+        order_id = store.order_id[idx]
+        self._status_index[int(store.status[idx])].discard(order_id)
+        self._status_index[new_status].add(order_id)
+        
+        if new_status in _ACTIVE_STATES:
+            self._active_order_ids.add(order_id)
+        else:
+            self._active_order_ids.discard(order_id)
+            if new_status in _TERMINAL_STATES:
+                self._terminal_fifo.append((time.time_ns(), order_id))
+        
+        store.status[idx] = new_status
     
     def add_fill(
         self,
@@ -338,80 +862,257 @@ class OrderManager:
         Returns:
             Fill ID
         """
-        if order_id not in self.orders:
-            logger.error(f"Order {order_id} not found")
-            return None
+        now_ns = time.time_ns()
         
-        # Generate fill ID
-        fill_id = f"FILL_{len(self.fills):06d}"
-        
-        # Create fill
-        fill = Fill(
-            fill_id=fill_id,
-            order_id=order_id,
-            leg_id=leg_id,
-            symbol=symbol,
-            side=side,
-            quantity=quantity,
-            price=price,
-            commission=commission,
-            timestamp=datetime.now()
-        )
+        with self._lock:
+            idx = self._store.index.get(order_id)
+            if idx is None:
+                logger.error("Order %s not found", order_id)
+                return None
+            
+            # Generate fill ID
+            fill_id = f"FILL_{self.fill_counter:06d}"
+            self.fill_counter += 1
+            
+            # Add fill
+            row = self.fills.append(
+                fill_id, order_id, leg_id, symbol, side,
+                quantity, price, commission, now_ns
+            )
+            self._fills_by_order[order_id].append(row)
+            self._total_commission += commission
+            
+            # Update order
+            store = self._store
+            store.filled_quantity[idx] += quantity
+            store.remaining_quantity[idx] -= quantity
+            store.total_commission[idx] += commission
+            store.notional_value[idx] += price * quantity
+            
+            # Update order status
+            self._set_status(idx, _STATUS_ON_FILL[int(store.remaining_quantity[idx] == 0)])
+            
+            store.updated_ns[idx] = now_ns
+            store.update_fill_percentage(idx)
+        
+        self.fills.write_spills()
+        logger.info("Added fill %s for order %s", fill_id, order_id)
+        
+        return fill_id
+    
+    def add_fills(
+        self,
+        order_id: str,
+        quantities: np.ndarray,
+        prices: np.ndarray,
+        commissions: np.ndarray,
+        leg_ids,
+        sides,
+        symbols
+    ) -> List[str]:
+        """
+        Add a burst of fills to an order in one pass.
         
-        # Add fill
-        self.fills.append(fill)
+        Args:
+            order_id: Order ID
+            quantities: Quantities filled
+            prices: Fill prices
+            commissions: Commissions
+            leg_ids: Leg ID per fill, or a single leg ID for all
+            sides: Side per fill, or a single side for all
+            symbols: Symbol per fill, or a single symbol for all
+            
+        Returns:
+            Fill IDs
+        """
+        quantities = np.asarray(quantities, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        commissions = np.asarray(commissions, dtype=np.float64)
         
-        # Update order
-        order = self.orders[order_id]
-        order.filled_quantity += quantity
-        order.remaining_quantity -= quantity
-        order.total_commission += commission
+        qsum = int(quantities.sum())
+        notional = float(quantities @ prices)
+        csum = float(commissions.sum())
+        now_ns = time.time_ns()
         
-        # Update average price
-        if order.filled_quantity > 0:
-            order.average_price = (
-                (order.average_price * (order.filled_quantity - quantity) + price * quantity) 
-                / order.filled_quantity
+        with self._lock:
+            idx = self._store.index.get(order_id)
+            if idx is None:
+                logger.error("Order %s not found", order_id)
+                return []
+            if quantities.size == 0:
+                return []
+            
+            # Generate fill IDs
+            first = self.fill_counter
+            self.fill_counter += quantities.size
+            fill_ids = [f"FILL_{i:06d}" for i in range(first, self.fill_counter)]
+            
+            # Add fills
+            rows = self.fills.extend(
+                fill_ids, order_id, leg_ids, symbols, sides,
+                quantities, prices, commissions, now_ns
             )
+            self._fills_by_order[order_id].extend(rows)
+            self._total_commission += csum
+            
+            # Update order
+            store = self._store
+            store.filled_quantity[idx] += qsum
+            store.remaining_quantity[idx] -= qsum
+            store.total_commission[idx] += csum
+            store.notional_value[idx] += notional
+            
+            # Update order status
+            self._set_status(idx, _STATUS_ON_FILL[int(store.remaining_quantity[idx] == 0)])
+            
+            store.updated_ns[idx] = now_ns
+            store.update_fill_percentage(idx)
         
-        # Update order status
-        if order.remaining_quantity == 0:
-            order.status = OrderStatus.FILLED
-        else:
-            order.status = OrderStatus.PARTIALLY_FILLED
+        self.fills.write_spills()
+        logger.info("Added %s fills for order %s", len(fill_ids), order_id)
+        
+        return fill_ids
+    
+    def add_fills_for_orders(
+        self,
+        order_ids: List[str],
+        quantities: np.ndarray,
+        prices: np.ndarray,
+        commissions: np.ndarray,
+        leg_ids,
+        sides,
+        symbols
+    ) -> List[str]:
+        """
+        Add a burst of fills spanning several orders in one pass.
         
-        order.updated_time = datetime.now()
+        Args:
+            order_ids: Order ID per fill
+            quantities: Quantities filled
+            prices: Fill prices
+            commissions: Commissions
+            leg_ids: Leg ID per fill, or a single leg ID for all
+            sides: Side per fill, or a single side for all
+            symbols: Symbol per fill, or a single symbol for all
+            
+        Returns:
+            Fill IDs
+        """
+        quantities = np.asarray(quantities, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        commissions = np.asarray(commissions, dtype=np.float64)
+        if quantities.size == 0:
+            return []
         
-        logger.info(f"Added fill {fill_id} for order {order_id}")
+        order_ids = np.asarray(order_ids, dtype=object)
         
-        return fill_id
+        # Aggregate per distinct order before taking the lock
+        unique_ids, order_idx = np.unique(order_ids, return_inverse=True)
+        filled, notional, commission = _apply_fills_core(
+            order_idx, quantities, prices, commissions, unique_ids.size
+        )
+        csum = float(commission.sum())
+        now_ns = time.time_ns()
+        
+        with self._lock:
+            # Translate order IDs to store rows, hashing each distinct ID once
+            id_to_idx = self._store.index
+            try:
+                touched = np.fromiter(
+                    (id_to_idx[order_id] for order_id in unique_ids.tolist()),
+                    dtype=np.intp,
+                    count=unique_ids.size
+                )
+            except KeyError as e:
+                logger.error("Order %s not found", e.args[0])
+                return []
+            
+            # Generate fill IDs
+            first = self.fill_counter
+            self.fill_counter += quantities.size
+            fill_ids = [f"FILL_{i:06d}" for i in range(first, self.fill_counter)]
+            
+            # Add fills
+            rows = self.fills.extend(
+                fill_ids, order_ids, leg_ids, symbols, sides,
+                quantities, prices, commissions, now_ns
+            )
+            for order_id, seq in zip(order_ids, rows):
+                self._fills_by_order[order_id].append(seq)
+            self._total_commission += csum
+            
+            # Update orders; rows in touched are unique, so plain fancy adds are safe
+            store = self._store
+            store.filled_quantity[touched] += filled
+            store.remaining_quantity[touched] -= filled
+            store.total_commission[touched] += commission
+            store.notional_value[touched] += notional
+            store.updated_ns[touched] = now_ns
+            store.update_fill_percentage(touched)
+            
+            done = store.remaining_quantity[touched] == 0
+            for idx, is_done in zip(touched.tolist(), done.tolist()):
+                self._set_status(idx, _STATUS_ON_FILL[is_done])
+        
+        self.fills.write_spills()
+        logger.info("Added %s fills across %s orders", len(fill_ids), touched.size)
+        
+        return fill_ids
     
     def get_order(self, order_id: str) -> Optional[Order]:
-        """Get order by ID."""
-        return self.orders.get(order_id)
+        """
+        Get a snapshot of an order by ID.
+        
+        The snapshot is a copy; update the order with update_order_status,
+        add_fill or cancel_order.
+        """
+        store = self._store
+        idx = store.index.get(order_id)
+        if idx is None:
+            return None
+        return store.view(idx)
     
     def get_active_orders(self) -> List[Order]:
         """Get all active orders."""
-        return [order for order in self.orders.values() if order.is_active()]
+        return self._views(self._active_order_ids)
     
     def get_orders_by_status(self, status: OrderStatus) -> List[Order]:
         """Get orders by status."""
-        return [order for order in self.orders.values() if order.status == status]
+        return self._views(self._status_index[status])
+    
+    def _views(self, order_ids: Set[str]) -> List[Order]:
+        """Materialize the orders in an index set that are still stored."""
+        # Read the store reference once; compaction swaps in a new store
+        store = self._store
+        index = store.index
+        # tuple() snapshots the set in one step, so getters need no lock
+        return [
+            store.view(index[order_id]) for order_id in tuple(order_ids)
+            if order_id in index
+        ]
     
     def get_fills_for_order(self, order_id: str) -> List[Fill]:
         """Get fills for an order."""
-        return [fill for fill in self.fills if fill.order_id == order_id]
+        rows = self._fills_by_order.get(order_id)
+        if not rows:
+            return []
+        
+        # Drop fills that have been spilled out of the ring
+        expired = bisect.bisect_left(rows, self.fills.tail)
+        if expired:
+            del rows[:expired]
+        return [self.fills.row(seq) for seq in rows]
     
     def get_order_summary(self) -> Dict[str, Any]:
         """Get order summary statistics."""
-        total_orders = len(self.orders)
-        active_orders = len(self.get_active_orders())
-        filled_orders = len(self.get_orders_by_status(OrderStatus.FILLED))
-        cancelled_orders = len(self.get_orders_by_status(OrderStatus.CANCELLED))
-        rejected_orders = len(self.get_orders_by_status(OrderStatus.REJECTED))
+        total_orders = len(self._store.index)
+        active_orders = len(self._active_order_ids)
+        filled_orders = len(self._status_index[OrderStatus.FILLED])
+        cancelled_orders = len(self._status_index[OrderStatus.CANCELLED])
+        rejected_orders = len(self._status_index[OrderStatus.REJECTED])
         
-        total_fills = len(self.fills)
-        total_commission = sum(fill.commission for fill in self.fills)
+        total_fills = self.fill_counter
+        total_commission = self._total_commission
         
         return {
             'total_orders': total_orders,
@@ -424,29 +1125,38 @@ class OrderManager:
             'daily_order_count': self.daily_order_count
         }
     
-    def _check_order_limits(self) -> bool:
-        """Check if order limits are within bounds."""
+    def _check_order_limits(self, n: int = 1) -> bool:
+        """Check if ``n`` more orders stay within the limits."""
         # Check max open orders
-        if len(self.get_active_orders()) >= self.max_open_orders:
+        if len(self._active_order_ids) + n > self.max_open_orders:
             logger.warning("Maximum open orders reached")
             return False
         
         # Check daily order count
-        if self.daily_order_count >= self.max_daily_orders:
+        if self.daily_order_count + n > self.max_daily_orders:
             logger.warning("Maximum daily orders reached")
             return False
         
         return True
     
-    def _update_daily_count(self):
+    @property
+    def last_reset_date(self) -> date:
+        """Local date the daily order count was last reset."""
+        return date.fromordinal(self._last_reset_day + _EPOCH_ORDINAL)
+    
+    def _local_day(self) -> int:
+        """Days since the epoch in local time."""
+        return int((time.time() + self._utc_offset) // 86_400)
+    
+    def _update_daily_count(self, n: int = 1):
         """Update daily order count."""
-        current_date = datetime.now().date()
+        today = self._local_day()
         
-        if current_date != self.last_reset_date:
+        if today != self._last_reset_day:
             self.daily_order_count = 0
-            self.last_reset_date = current_date
+            self._last_reset_day = today
         
-        self.daily_order_count += 1
+        self.daily_order_count += n
     
     def _submit_to_broker(self, order: Order) -> bool:
         """Submit order to broker (placeholder)."""
@@ -461,64 +1171,112 @@ class OrderManager:
         return True
     
     def cleanup_old_orders(self, days: int = 30):
-        """Clean up old orders."""
-        cutoff_date = datetime.now() - timedelta(days=days)
-        
-        old_orders = [
-            order_id for order_id, order in self.orders.items()
-            if order.created_time < cutoff_date and order.status in [
-                OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED
-            ]
-        ]
+        """Clean up orders that finished more than ``days`` ago."""
+        cutoff_ns = time.time_ns() - days * 86_400 * 1_000_000_000
+        fifo = self._terminal_fifo
+        removed = 0
         
-        for order_id in old_orders:
-            del self.orders[order_id]
+        with self._lock:
+            store = self._store
+            while fifo and fifo[0][0] < cutoff_ns:
+                _, order_id = fifo.popleft()
+                idx = store.index.get(order_id)
+                # Skip ids already removed or moved back to a live status
+                if idx is None:
+                    continue
+                status = int(store.status[idx])
+                if status not in _TERMINAL_STATES:
+                    continue
+                store.remove(order_id)
+                self._status_index[status].discard(order_id)
+                self._fills_by_order.pop(order_id, None)
+                removed += 1
+            
+            # Rebuild once removed orders dominate; readers holding the old
+            # store keep a consistent, if stale, view
+            if store.dead > COMPACT_DEAD_FRACTION * store.n:
+                self._store = store.compacted()
         
-        logger.info(f"Cleaned up {len(old_orders)} old orders")
+        logger.info("Cleaned up %s old orders", removed)
+    
+    def _order_columns(self) -> Dict[str, np.ndarray]:
+        """Export columns for every live order, in creation order."""
+        store = self._store
+        live = store.live_rows()
+        filled = store.filled_quantity[live]
+        notional = store.notional_value[live]
+        average_price = np.divide(
+            notional, filled, out=np.zeros_like(notional), where=filled != 0
+        )
+        return {
+            'order_id': store.order_id[live],
+            'order_type': _TYPE_LABELS[store.order_type[live]],
+            'status': _STATUS_LABELS[store.status[live]],
+            'created_time': _ns_to_local_datetime64(store.created_ns[live], self._utc_offset),
+            'updated_time': _ns_to_local_datetime64(store.updated_ns[live], self._utc_offset),
+            'filled_quantity': filled,
+            'remaining_quantity': store.remaining_quantity[live],
+            'average_price': average_price,
+            'total_commission': store.total_commission[live],
+            'parent_order_id': store.parent_order_id[live]
+        }
+    
+    def _fill_columns(self) -> Dict[str, np.ndarray]:
+        """Export columns for the fills held in the ring, with local timestamps."""
+        columns = self.fills.columns()
+        columns['timestamp'] = _ns_to_local_datetime64(columns['timestamp'], self._utc_offset)
+        return columns
     
     def export_orders(self, filename: str):
         """Export orders to CSV file."""
-        if not self.orders:
+        if not self._store.index:
             return
         
-        orders_data = []
-        for order in self.orders.values():
-            orders_data.append({
-                'order_id': order.order_id,
-                'order_type': order.order_type.value,
-                'status': order.status.value,
-                'created_time': order.created_time,
-                'updated_time': order.updated_time,
-                'filled_quantity': order.filled_quantity,
-                'remaining_quantity': order.remaining_quantity,
-                'average_price': order.average_price,
-                'total_commission': order.total_commission,
-                'parent_order_id': order.parent_order_id
-            })
-        
-        df = pd.DataFrame(orders_data)
-        df.to_csv(filename, index=False)
-        logger.info(f"Exported {len(orders_data)} orders to {filename}")
+        columns = self._order_columns()
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(ORDER_EXPORT_COLUMNS)
+            writer.writerows(zip(*(_csv_values(values) for values in columns.values())))
+        
+        logger.info("Exported %s orders to %s", len(columns['order_id']), filename)
+    
+    def export_orders_parquet(self, path: str):
+        """Export orders to a zstd-compressed Parquet file."""
+        if not self._store.index:
+            return
+        
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        columns = self._order_columns()
+        table = pa.Table.from_arrays(
+            [pa.array(values) for values in columns.values()],
+            names=list(columns)
+        )
+        pq.write_table(table, path, compression='zstd')
+        logger.info("Exported %s orders to %s", len(columns['order_id']), path)
+    
+    def export_fills_parquet(self, path: str):
+        """Export fills still held in the ring to a zstd-compressed Parquet file."""
+        if not len(self.fills):
+            return
+        
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        columns = self._fill_columns()
+        table = pa.Table.from_arrays(
+            [pa.array(values) for values in columns.values()],
+            names=list(columns)
+        )
+        pq.write_table(table, path, compression='zstd')
+        logger.info("Exported %s fills to %s", len(self.fills), path)
     
     def export_fills(self, filename: str):
-        """Export fills to CSV file."""
-        if not self.fills:
+        """Export fills still held in the ring to CSV file."""
+        if not len(self.fills):
             return
         
-        fills_data = []
-        for fill in self.fills:
-            fills_data.append({
-                'fill_id': fill.fill_id,
-                'order_id': fill.order_id,
-                'leg_id': fill.leg_id,
-                'symbol': fill.symbol,
-                'side': fill.side,
-                'quantity': fill.quantity,
-                'price': fill.price,
-                'commission': fill.commission,
-                'timestamp': fill.timestamp
-            })
-        
-        df = pd.DataFrame(fills_data)
+        df = pd.DataFrame(self._fill_columns(), copy=False)
         df.to_csv(filename, index=False)
-        logger.info(f"Exported {len(fills_data)} fills to {filename}")
+        logger.info("Exported %s fills to %s", len(df), filename)
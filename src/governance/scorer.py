@@ -2,17 +2,163 @@
 Strategy performance scoring system.
 """
 
-import pandas as pd
+import math
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class BacktestView:
+    """
+    Backtest metrics read by the score components.
+    
+    Fields hold floats for one backtest, or equal-length arrays when
+    scoring a batch.
+    """
+    annualized_return: float = 0.0
+    total_return: float = 0.0
+    sharpe_ratio: float = 0.0
+    volatility: float = 0.0
+    max_drawdown: float = 0.0
+    var_95: float = 0.0
+    cvar_95: float = 0.0
+    total_trades: float = 0.0
+    win_rate: float = 0.0
+    profit_factor: float = 0.0
+    avg_win: float = 0.0
+    avg_loss: float = 0.0
+    theta_harvest: float = 0.0
+    vega_exposure: float = 0.0
+    gamma_exposure: float = 0.0
+    delta_exposure: float = 0.0
+
+
+BACKTEST_COLUMNS = tuple(field.name for field in fields(BacktestView))
+
+# Reciprocals of the fixed targets and limits, so scoring multiplies
+_INV_TOTAL_RETURN_TARGET = 1 / 0.5
+_INV_VAR_LIMIT = 1 / 0.05
+_INV_CVAR_LIMIT = 1 / 0.1
+_INV_MIN_TRADES = 1 / 100
+_INV_THETA_TARGET = 1 / 1000
+_INV_VEGA_LIMIT = 1 / 1000
+_INV_GAMMA_LIMIT = 1 / 100
+_INV_DELTA_LIMIT = 1 / 500
+
+
+# Lists longer than this amortize NumPy's per-call overhead
+_CV_NUMPY_MIN_LEN = 64
+
+
+def _cv(xs: List[float]) -> float:
+    """
+    Coefficient of variation (population std over mean) of a list;
+    1.0 for an empty list or a zero mean, so the metric adds no stability.
+    """
+    n = len(xs)
+    if n > _CV_NUMPY_MIN_LEN:
+        arr = np.asarray(xs, dtype=np.float64)
+        m = arr.mean()
+        return float(arr.std() / m) if m != 0 else 1.0
+    if n == 0:
+        return 1.0
+    m = math.fsum(xs) / n
+    if m == 0:
+        return 1.0
+    v = math.fsum((x - m) * (x - m) for x in xs) / n
+    return math.sqrt(v) / m
+
+
+def _stability_kernel(
+    returns: List[float],
+    sharpe_ratios: List[float],
+    max_drawdowns: List[float]
+) -> float:
+    """Stability score from walk-forward returns, Sharpe ratios and absolute drawdowns."""
+    stability_score = (
+        (1 - _cv(returns)) * 0.4 +
+        (1 - _cv(sharpe_ratios)) * 0.3 +
+        (1 - _cv(max_drawdowns)) * 0.3
+    )
+    return max(0.0, min(1.0, stability_score))
+
+
+# Weights of the return, Sharpe and drawdown stabilities
+_STABILITY_WEIGHTS = np.array([0.4, 0.3, 0.3])
+
+
+@dataclass(slots=True)
+class _StabilityAccum:
+    """
+    Running (Welford) mean and sum of squared deviations of a strategy's
+    walk-forward annualized return, Sharpe ratio and absolute drawdown.
+    """
+    n: int = 0
+    mean: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    m2: np.ndarray = field(default_factory=lambda: np.zeros(3))
+    
+    def update(self, x: np.ndarray):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+    
+    def stability(self) -> float:
+        """Stability score over the windows seen so far, as in calculate_stability_score."""
+        if not self.n:
+            return 0.0
+        std = np.sqrt(self.m2 / self.n)
+        # A column with zero mean contributes no stability
+        nonzero = self.mean != 0
+        cv = np.where(nonzero, std / np.where(nonzero, self.mean, 1.0), 1.0)
+        return float(np.clip((1 - cv) @ _STABILITY_WEIGHTS, 0.0, 1.0))
+
+
+def _tiered_credit(
+    value: np.ndarray,
+    minimum: float,
+    inv_minimum: float,
+    inv_saturation: float
+) -> np.ndarray:
+    """
+    Credit for a metric against its minimum: value / minimum below it,
+    value / minimum * inv_saturation capped at 1 from the minimum up.
+    The tier is picked with np.where rather than mask products, which
+    would turn an infinite metric into 0 * inf = NaN.
+    """
+    ratio = value * inv_minimum
+    capped = np.minimum(1.0, ratio * inv_saturation)
+    return np.where(value < minimum, ratio, capped)
+
+
+def _overshoot_credit(value: np.ndarray, limit: float, inv_limit: float) -> np.ndarray:
+    """
+    Credit for a metric against its limit: 1 - value / limit up to the
+    limit, 2 - value / limit floored at 0 past it.
+    """
+    ratio = value * inv_limit
+    return np.where(value <= limit, 1.0 - ratio, np.maximum(0.0, 2.0 - ratio))
+
+
+def _safe(backtest_results: Dict[str, Any]) -> BacktestView:
+    """BacktestView of a results dict with missing, None and NaN metrics as 0."""
+    get = backtest_results.get
+    values = [float(get(name) or 0.0) for name in BACKTEST_COLUMNS]
+    return BacktestView(*[0.0 if math.isnan(value) else value for value in values])
+
+
+def _as_view(backtest_results: Union[BacktestView, Dict[str, Any]]) -> BacktestView:
+    if isinstance(backtest_results, BacktestView):
+        return backtest_results
+    return _safe(backtest_results)
+
+
+@dataclass(slots=True)
 class ScoreWeights:
     """Score weights configuration."""
     return_weight: float = 0.3
@@ -36,6 +182,13 @@ class StrategyScorer:
             capacity_weight=config.get('capacity_weight', 0.15),
             greek_weight=config.get('greek_weight', 0.1)
         )
+        self._weights_arr = np.array([
+            self.weights.return_weight,
+            self.weights.risk_weight,
+            self.weights.stability_weight,
+            self.weights.capacity_weight,
+            self.weights.greek_weight
+        ], dtype=np.float64)
         
         # Scoring thresholds
         self.min_annual_return = config.get('min_annual_return', 0.15)
@@ -45,96 +198,40 @@ class StrategyScorer:
         self.min_profit_factor = config.get('min_profit_factor', 1.25)
         self.min_win_rate = config.get('min_win_rate', 0.4)
         
-    def calculate_return_score(self, backtest_results: Dict[str, Any]) -> float:
+        # Reciprocal thresholds; threshold comparisons still use the originals
+        self._inv_min_annual_return = 1.0 / self.min_annual_return
+        self._inv_max_volatility = 1.0 / self.max_volatility
+        self._inv_max_drawdown = 1.0 / self.max_drawdown
+        self._inv_min_sharpe = 1.0 / self.min_sharpe_ratio
+        self._inv_min_profit_factor = 1.0 / self.min_profit_factor
+        self._inv_min_win_rate = 1.0 / self.min_win_rate
+        
+        # Per-strategy running walk-forward statistics
+        self._stability_accums: Dict[str, _StabilityAccum] = {}
+        
+    def calculate_return_score(self, backtest_results: Union[BacktestView, Dict[str, Any]]) -> float:
         """
         Calculate return-based score.
         
         Args:
-            backtest_results: Backtest performance metrics
-            
+            backtest_results: Backtest performance metrics, as a dict or BacktestView
+        
         Returns:
             Return score (0-1)
         """
-        try:
-            annual_return = backtest_results.get('annualized_return', 0.0)
-            total_return = backtest_results.get('total_return', 0.0)
-            sharpe_ratio = backtest_results.get('sharpe_ratio', 0.0)
-            
-            # Calculate return score
-            return_score = 0.0
-            
-            # Annual return component (40% weight)
-            if annual_return >= self.min_annual_return:
-                return_score += 0.4 * min(1.0, annual_return / (self.min_annual_return * 2))
-            else:
-                return_score += 0.4 * (annual_return / self.min_annual_return)
-            
-            # Total return component (30% weight)
-            if total_return > 0:
-                return_score += 0.3 * min(1.0, total_return / 0.5)  # 50% total return target
-            else:
-                return_score += 0.3 * max(0.0, 1 + total_return)  # Penalty for negative returns
-            
-            # Sharpe ratio component (30% weight)
-            if sharpe_ratio >= self.min_sharpe_ratio:
-                return_score += 0.3 * min(1.0, sharpe_ratio / (self.min_sharpe_ratio * 2))
-            else:
-                return_score += 0.3 * (sharpe_ratio / self.min_sharpe_ratio)
-            
-            return max(0.0, min(1.0, return_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating return score: {e}")
-            return 0.0
+        return float(self._return_scores(_as_view(backtest_results)))
     
-    def calculate_risk_score(self, backtest_results: Dict[str, Any]) -> float:
+    def calculate_risk_score(self, backtest_results: Union[BacktestView, Dict[str, Any]]) -> float:
         """
         Calculate risk-based score (lower is better).
         
         Args:
-            backtest_results: Backtest performance metrics
-            
+            backtest_results: Backtest performance metrics, as a dict or BacktestView
+        
         Returns:
             Risk score (0-1, lower is better)
         """
-        try:
-            volatility = backtest_results.get('volatility', 0.0)
-            max_drawdown = abs(backtest_results.get('max_drawdown', 0.0))
-            var_95 = abs(backtest_results.get('var_95', 0.0))
-            cvar_95 = abs(backtest_results.get('cvar_95', 0.0))
-            
-            # Calculate risk score (lower is better)
-            risk_score = 0.0
-            
-            # Volatility component (30% weight)
-            if volatility <= self.max_volatility:
-                risk_score += 0.3 * (1 - volatility / self.max_volatility)
-            else:
-                risk_score += 0.3 * max(0.0, 1 - (volatility - self.max_volatility) / self.max_volatility)
-            
-            # Max drawdown component (40% weight)
-            if max_drawdown <= self.max_drawdown:
-                risk_score += 0.4 * (1 - max_drawdown / self.max_drawdown)
-            else:
-                risk_score += 0.4 * max(0.0, 1 - (max_drawdown - self.max_drawdown) / self.max_drawdown)
-            
-            # VaR component (15% weight)
-            if var_95 <= 0.05:  # 5% VaR threshold
-                risk_score += 0.15 * (1 - var_95 / 0.05)
-            else:
-                risk_score += 0.15 * max(0.0, 1 - (var_95 - 0.05) / 0.05)
-            
-            # CVaR component (15% weight)
-            if cvar_95 <= 0.1:  # 10% CVaR threshold
-                risk_score += 0.15 * (1 - cvar_95 / 0.1)
-            else:
-                risk_score += 0.15 * max(0.0, 1 - (cvar_95 - 0.1) / 0.1)
-            
-            return max(0.0, min(1.0, risk_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating risk score: {e}")
-            return 1.0  # High risk if error
+        return float(self._risk_scores(_as_view(backtest_results)))
     
     def calculate_stability_score(self, walk_forward_results: List[Dict[str, Any]]) -> float:
         """
@@ -146,133 +243,205 @@ class StrategyScorer:
         Returns:
             Stability score (0-1)
         """
-        try:
-            if not walk_forward_results:
-                return 0.0
-            
-            # Extract metrics
-            returns = [result.get('annualized_return', 0.0) for result in walk_forward_results]
-            sharpe_ratios = [result.get('sharpe_ratio', 0.0) for result in walk_forward_results]
-            max_drawdowns = [abs(result.get('max_drawdown', 0.0)) for result in walk_forward_results]
-            
-            # Calculate stability metrics
-            return_stability = 1 - (np.std(returns) / np.mean(returns)) if np.mean(returns) != 0 else 0
-            sharpe_stability = 1 - (np.std(sharpe_ratios) / np.mean(sharpe_ratios)) if np.mean(sharpe_ratios) != 0 else 0
-            drawdown_stability = 1 - (np.std(max_drawdowns) / np.mean(max_drawdowns)) if np.mean(max_drawdowns) != 0 else 0
-            
-            # Calculate overall stability score
-            stability_score = (
-                return_stability * 0.4 +
-                sharpe_stability * 0.3 +
-                drawdown_stability * 0.3
-            )
-            
-            return max(0.0, min(1.0, stability_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating stability score: {e}")
+        if not walk_forward_results:
             return 0.0
+        
+        # Extract metrics
+        returns = [result.get('annualized_return', 0.0) for result in walk_forward_results]
+        sharpe_ratios = [result.get('sharpe_ratio', 0.0) for result in walk_forward_results]
+        max_drawdowns = [abs(result.get('max_drawdown', 0.0)) for result in walk_forward_results]
+        
+        return _stability_kernel(returns, sharpe_ratios, max_drawdowns)
     
-    def calculate_capacity_score(self, backtest_results: Dict[str, Any]) -> float:
+    def calculate_stability_score_incremental(
+        self,
+        strategy_name: str,
+        new_window: Dict[str, Any]
+    ) -> float:
+        """
+        Add one walk-forward window to a strategy's running statistics.
+        
+        Args:
+            strategy_name: Name of the strategy
+            new_window: Walk-forward results for the new window
+        
+        Returns:
+            Stability score (0-1) over all windows added for the strategy
+        """
+        accum = self._stability_accums.get(strategy_name)
+        if accum is None:
+            accum = self._stability_accums[strategy_name] = _StabilityAccum()
+        
+        accum.update(np.array([
+            new_window.get('annualized_return', 0.0),
+            new_window.get('sharpe_ratio', 0.0),
+            abs(new_window.get('max_drawdown', 0.0))
+        ], dtype=np.float64))
+        
+        return accum.stability()
+
+    def calculate_capacity_score(self, backtest_results: Union[BacktestView, Dict[str, Any]]) -> float:
         """
         Calculate capacity score based on strategy capacity.
         
         Args:
-            backtest_results: Backtest performance metrics
-            
+            backtest_results: Backtest performance metrics, as a dict or BacktestView
+        
         Returns:
             Capacity score (0-1)
         """
-        try:
-            total_trades = backtest_results.get('total_trades', 0)
-            win_rate = backtest_results.get('win_rate', 0.0)
-            profit_factor = backtest_results.get('profit_factor', 0.0)
-            avg_win = backtest_results.get('avg_win', 0.0)
-            avg_loss = backtest_results.get('avg_loss', 0.0)
-            
-            # Calculate capacity score
-            capacity_score = 0.0
-            
-            # Trade count component (30% weight)
-            if total_trades >= 100:  # Minimum trade count
-                capacity_score += 0.3 * min(1.0, total_trades / 500)  # 500 trades target
-            else:
-                capacity_score += 0.3 * (total_trades / 100)
-            
-            # Win rate component (25% weight)
-            if win_rate >= self.min_win_rate:
-                capacity_score += 0.25 * min(1.0, win_rate / (self.min_win_rate * 2))
-            else:
-                capacity_score += 0.25 * (win_rate / self.min_win_rate)
-            
-            # Profit factor component (25% weight)
-            if profit_factor >= self.min_profit_factor:
-                capacity_score += 0.25 * min(1.0, profit_factor / (self.min_profit_factor * 2))
-            else:
-                capacity_score += 0.25 * (profit_factor / self.min_profit_factor)
-            
-            # Average win/loss component (20% weight)
-            if avg_loss > 0:
-                win_loss_ratio = avg_win / avg_loss
-                capacity_score += 0.2 * min(1.0, win_loss_ratio / 2.0)  # 2:1 win/loss target
-            else:
-                capacity_score += 0.2 * 0.0
-            
-            return max(0.0, min(1.0, capacity_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating capacity score: {e}")
-            return 0.0
+        return float(self._capacity_scores(_as_view(backtest_results)))
     
-    def calculate_greek_score(self, backtest_results: Dict[str, Any]) -> float:
+    def calculate_greek_score(self, backtest_results: Union[BacktestView, Dict[str, Any]]) -> float:
         """
         Calculate Greek-based score for options strategies.
         
         Args:
-            backtest_results: Backtest performance metrics
-            
+            backtest_results: Backtest performance metrics, as a dict or BacktestView
+        
         Returns:
             Greek score (0-1)
         """
-        try:
-            theta_harvest = backtest_results.get('theta_harvest', 0.0)
-            vega_exposure = abs(backtest_results.get('vega_exposure', 0.0))
-            gamma_exposure = abs(backtest_results.get('gamma_exposure', 0.0))
-            delta_exposure = abs(backtest_results.get('delta_exposure', 0.0))
-            
-            # Calculate Greek score
-            greek_score = 0.0
-            
-            # Theta harvest component (40% weight)
-            if theta_harvest > 0:
-                greek_score += 0.4 * min(1.0, theta_harvest / 1000)  # 1000 theta target
-            else:
-                greek_score += 0.4 * 0.0
-            
-            # Vega exposure component (25% weight)
-            if vega_exposure <= 1000:  # 1000 vega limit
-                greek_score += 0.25 * (1 - vega_exposure / 1000)
-            else:
-                greek_score += 0.25 * 0.0
-            
-            # Gamma exposure component (20% weight)
-            if gamma_exposure <= 100:  # 100 gamma limit
-                greek_score += 0.2 * (1 - gamma_exposure / 100)
-            else:
-                greek_score += 0.2 * 0.0
-            
-            # Delta exposure component (15% weight)
-            if delta_exposure <= 500:  # 500 delta limit
-                greek_score += 0.15 * (1 - delta_exposure / 500)
-            else:
-                greek_score += 0.15 * 0.0
-            
-            return max(0.0, min(1.0, greek_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating Greek score: {e}")
-            return 0.0
+        return float(self._greek_scores(_as_view(backtest_results)))
     
+    def score_batch(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
+        """
+        Score many backtests at once.
+        
+        Args:
+            df: One row per backtest with the metric columns in
+                BACKTEST_COLUMNS; missing columns count as 0
+        
+        Returns:
+            DataFrame of return, risk, capacity and Greek scores on df's index
+        """
+        import pandas as pd
+        n = len(df)
+        metrics = BacktestView(*[
+            df[name].to_numpy(np.float64) if name in df.columns else np.zeros(n)
+            for name in BACKTEST_COLUMNS
+        ])
+        
+        return pd.DataFrame({
+            'return_score': self._return_scores(metrics),
+            'risk_score': self._risk_scores(metrics),
+            'capacity_score': self._capacity_scores(metrics),
+            'greek_score': self._greek_scores(metrics)
+        }, index=df.index)
+    
+    def calculate_batch(
+        self,
+        metrics: np.ndarray,
+        stability_scores: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Score many backtests given as a plain float64 matrix.
+        
+        Args:
+            metrics: (N, 16) array with columns in BACKTEST_COLUMNS order
+            stability_scores: Optional (N,) walk-forward stability scores;
+                0 when omitted
+        
+        Returns:
+            (N, 6) array of return, risk, stability, capacity, Greek and
+            composite scores
+        """
+        # Column-major, so each metric column is contiguous for the kernels
+        metrics = np.asfortranarray(metrics, dtype=np.float64)
+        n = metrics.shape[0]
+        view = BacktestView(*[metrics[:, j] for j in range(len(BACKTEST_COLUMNS))])
+        
+        out = np.empty((n, 6), dtype=np.float64)
+        out[:, 0] = self._return_scores(view)
+        out[:, 1] = self._risk_scores(view)
+        out[:, 2] = 0.0 if stability_scores is None else stability_scores
+        out[:, 3] = self._capacity_scores(view)
+        out[:, 4] = self._greek_scores(view)
+        out[:, 5] = self.calculate_composite_batch(out[:, :5])
+        return out
+    
+    def _return_scores(self, metrics: BacktestView) -> np.ndarray:
+        total_return = metrics.total_return
+        
+        # Annual return component (40% weight)
+        return_score = 0.4 * _tiered_credit(
+            metrics.annualized_return, self.min_annual_return, self._inv_min_annual_return, 0.5
+        )
+        
+        # Total return component (30% weight); 50% total return target,
+        # penalty for negative returns
+        return_score += 0.3 * (
+            (total_return > 0) * np.minimum(1.0, total_return * _INV_TOTAL_RETURN_TARGET) +
+            (total_return <= 0) * np.maximum(0.0, 1 + total_return)
+        )
+        
+        # Sharpe ratio component (30% weight)
+        return_score += 0.3 * _tiered_credit(
+            metrics.sharpe_ratio, self.min_sharpe_ratio, self._inv_min_sharpe, 0.5
+        )
+        
+        return np.clip(return_score, 0.0, 1.0)
+    
+    def _risk_scores(self, metrics: BacktestView) -> np.ndarray:
+        # Volatility component (30% weight)
+        risk_score = 0.3 * _overshoot_credit(
+            metrics.volatility, self.max_volatility, self._inv_max_volatility
+        )
+        
+        # Max drawdown component (40% weight)
+        risk_score += 0.4 * _overshoot_credit(
+            np.abs(metrics.max_drawdown), self.max_drawdown, self._inv_max_drawdown
+        )
+        
+        # VaR component (15% weight), 5% VaR threshold
+        risk_score += 0.15 * _overshoot_credit(np.abs(metrics.var_95), 0.05, _INV_VAR_LIMIT)
+        
+        # CVaR component (15% weight), 10% CVaR threshold
+        risk_score += 0.15 * _overshoot_credit(np.abs(metrics.cvar_95), 0.1, _INV_CVAR_LIMIT)
+        
+        return np.clip(risk_score, 0.0, 1.0)
+    
+    def _capacity_scores(self, metrics: BacktestView) -> np.ndarray:
+        avg_win = metrics.avg_win
+        avg_loss = metrics.avg_loss
+        
+        # Trade count component (30% weight); 100 trades minimum, 500 target
+        capacity_score = 0.3 * _tiered_credit(metrics.total_trades, 100, _INV_MIN_TRADES, 0.2)
+        
+        # Win rate component (25% weight)
+        capacity_score += 0.25 * _tiered_credit(
+            metrics.win_rate, self.min_win_rate, self._inv_min_win_rate, 0.5
+        )
+        
+        # Profit factor component (25% weight)
+        capacity_score += 0.25 * _tiered_credit(
+            metrics.profit_factor, self.min_profit_factor, self._inv_min_profit_factor, 0.5
+        )
+        
+        # Average win/loss component (20% weight), 2:1 target; no credit
+        # without a positive average loss
+        win_loss_ratio = np.divide(
+            avg_win, avg_loss, out=np.zeros_like(avg_win, dtype=np.float64), where=avg_loss > 0
+        )
+        capacity_score += 0.2 * np.minimum(1.0, win_loss_ratio * 0.5)
+        
+        return np.clip(capacity_score, 0.0, 1.0)
+    
+    def _greek_scores(self, metrics: BacktestView) -> np.ndarray:
+        # Theta harvest component (40% weight), 1000 theta target
+        greek_score = 0.4 * np.clip(metrics.theta_harvest * _INV_THETA_TARGET, 0.0, 1.0)
+        
+        # Vega exposure component (25% weight), 1000 vega limit
+        greek_score += 0.25 * np.maximum(0.0, 1 - np.abs(metrics.vega_exposure) * _INV_VEGA_LIMIT)
+        
+        # Gamma exposure component (20% weight), 100 gamma limit
+        greek_score += 0.2 * np.maximum(0.0, 1 - np.abs(metrics.gamma_exposure) * _INV_GAMMA_LIMIT)
+        
+        # Delta exposure component (15% weight), 500 delta limit
+        greek_score += 0.15 * np.maximum(0.0, 1 - np.abs(metrics.delta_exposure) * _INV_DELTA_LIMIT)
+        
+        return np.clip(greek_score, 0.0, 1.0)
+
     def calculate_composite_score(
         self,
         return_score: float,
@@ -294,21 +463,32 @@ class StrategyScorer:
         Returns:
             Composite score (0-1)
         """
-        try:
-            composite_score = (
-                return_score * self.weights.return_weight +
-                risk_score * self.weights.risk_weight +
-                stability_score * self.weights.stability_weight +
-                capacity_score * self.weights.capacity_weight +
-                greek_score * self.weights.greek_weight
-            )
-            
-            return max(0.0, min(1.0, composite_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating composite score: {e}")
-            return 0.0
+        scores = np.array([return_score, risk_score, stability_score, capacity_score, greek_score])
+        composite_score = float(np.dot(scores, self._weights_arr))
+        
+        return max(0.0, min(1.0, composite_score))
     
+    def calculate_composite_batch(
+        self,
+        scores_mat: np.ndarray,
+        weights: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calculate composite scores for many strategies at once.
+        
+        Args:
+            scores_mat: (N, 5) array of return, risk, stability, capacity and
+                Greek scores, one row per strategy
+            weights: Component weights in the same order (default: this
+                scorer's weights)
+        
+        Returns:
+            Composite scores (0-1), one per row
+        """
+        if weights is None:
+            weights = self._weights_arr
+        return np.clip(scores_mat @ weights, 0.0, 1.0)
+
     def get_score_breakdown(
         self,
         backtest_results: Dict[str, Any],
@@ -325,11 +505,12 @@ class StrategyScorer:
             Score breakdown
         """
         try:
-            return_score = self.calculate_return_score(backtest_results)
-            risk_score = self.calculate_risk_score(backtest_results)
+            metrics = _safe(backtest_results)
+            return_score = self.calculate_return_score(metrics)
+            risk_score = self.calculate_risk_score(metrics)
             stability_score = self.calculate_stability_score(walk_forward_results)
-            capacity_score = self.calculate_capacity_score(backtest_results)
-            greek_score = self.calculate_greek_score(backtest_results)
+            capacity_score = self.calculate_capacity_score(metrics)
+            greek_score = self.calculate_greek_score(metrics)
             
             composite_score = self.calculate_composite_score(
                 return_score, risk_score, stability_score, capacity_score, greek_score
@@ -2,20 +2,61 @@
 Strategy selector for choosing the best performing strategies.
 """
 
-import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import logging
 
-from .scorer import StrategyScorer
+from .scorer import BACKTEST_COLUMNS, StrategyScorer
 from .validator import StrategyValidator
 
 logger = logging.getLogger(__name__)
 
+INITIAL_SCORE_CAPACITY = 256
+# Suitability grades by code, worst first
+SUITABILITY_LABELS = ('POOR', 'FAIR', 'GOOD', 'EXCELLENT')
+_SUITABILITY_CODES = {label: code for code, label in enumerate(SUITABILITY_LABELS)}
+# Selection criteria as (score column, threshold attribute, is an upper bound, label)
+_CRITERIA = (
+    ('total_score', 'min_total_score', False, 'Total score'),
+    ('return_score', 'min_return_score', False, 'Return score'),
+    ('risk_score', 'max_risk_score', True, 'Risk score'),
+    ('stability_score', 'min_stability_score', False, 'Stability score'),
+    ('capacity_score', 'min_capacity_score', False, 'Capacity score'),
+    ('greek_score', 'min_greek_score', False, 'Greek score')
+)
 
-@dataclass
+
+def _score_one(
+    entry: Tuple[str, Dict[str, Any], List[Dict[str, Any]]],
+    scorer: StrategyScorer
+) -> Optional[Tuple[float, float, float, float, float]]:
+    """
+    Component scores for one (name, backtest_results, walk_forward_results)
+    entry, in return, risk, stability, capacity, Greek order; None if the
+    entry could not be scored.
+    
+    Module-level so process pool workers can unpickle it.
+    """
+    strategy_name, backtest_results, walk_forward_results = entry
+    try:
+        return (
+            scorer.calculate_return_score(backtest_results),
+            scorer.calculate_risk_score(backtest_results),
+            scorer.calculate_stability_score(walk_forward_results),
+            scorer.calculate_capacity_score(backtest_results),
+            scorer.calculate_greek_score(backtest_results)
+        )
+    
+    except Exception as e:
+        logger.error(f"Error evaluating strategy {strategy_name}: {e}")
+        return None
+
+
+@dataclass(slots=True, frozen=True)
 class StrategyScore:
     """Strategy performance score."""
     strategy_name: str
@@ -28,6 +69,79 @@ class StrategyScore:
     suitability: str  # 'EXCELLENT', 'GOOD', 'FAIR', 'POOR'
 
 
+class ScoreStore:
+    """
+    Columnar strategy scores keyed by a dense row per strategy.
+    
+    Each strategy gets the next row on its first evaluation and ``index``
+    maps its name to that row; re-evaluating overwrites the row in place.
+    Threshold filters and rankings run over whole columns.
+    """
+    
+    _COLUMNS = (
+        'strategy_name', 'total_score', 'return_score', 'risk_score',
+        'stability_score', 'capacity_score', 'greek_score', 'suitability'
+    )
+    
+    def __init__(self, capacity: int = INITIAL_SCORE_CAPACITY):
+        self.n = 0
+        self.index: Dict[str, int] = {}
+        self.strategy_name = np.empty(capacity, dtype=object)
+        self.total_score = np.zeros(capacity, dtype=np.float64)
+        self.return_score = np.zeros(capacity, dtype=np.float64)
+        self.risk_score = np.zeros(capacity, dtype=np.float64)
+        self.stability_score = np.zeros(capacity, dtype=np.float64)
+        self.capacity_score = np.zeros(capacity, dtype=np.float64)
+        self.greek_score = np.zeros(capacity, dtype=np.float64)
+        self.suitability = np.zeros(capacity, dtype=np.int8)
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    def __contains__(self, strategy_name: str) -> bool:
+        return strategy_name in self.index
+    
+    def put(self, score: StrategyScore) -> int:
+        """Write a score into its strategy's row and return the row."""
+        i = self.index.get(score.strategy_name)
+        if i is None:
+            i = self.n
+            if i == self.total_score.size:
+                self._grow(2 * self.total_score.size)
+            self.strategy_name[i] = score.strategy_name
+            self.index[score.strategy_name] = i
+            self.n = i + 1
+        
+        self.total_score[i] = score.total_score
+        self.return_score[i] = score.return_score
+        self.risk_score[i] = score.risk_score
+        self.stability_score[i] = score.stability_score
+        self.capacity_score[i] = score.capacity_score
+        self.greek_score[i] = score.greek_score
+        self.suitability[i] = _SUITABILITY_CODES[score.suitability]
+        return i
+    
+    def view(self, i: int) -> StrategyScore:
+        """Materialize row ``i`` as a StrategyScore."""
+        return StrategyScore(
+            strategy_name=self.strategy_name[i],
+            total_score=float(self.total_score[i]),
+            return_score=float(self.return_score[i]),
+            risk_score=float(self.risk_score[i]),
+            stability_score=float(self.stability_score[i]),
+            capacity_score=float(self.capacity_score[i]),
+            greek_score=float(self.greek_score[i]),
+            suitability=SUITABILITY_LABELS[self.suitability[i]]
+        )
+    
+    def _grow(self, capacity: int):
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:column.size] = column
+            setattr(self, name, grown)
+
+
 class StrategySelector:
     """
     Strategy selector for choosing the best performing strategies.
@@ -46,11 +160,30 @@ class StrategySelector:
         self.min_capacity_score = config.get('min_capacity_score', 0.3)
         self.min_greek_score = config.get('min_greek_score', 0.4)
         
+        # Total score weights, in return, risk, stability, capacity, Greek order
+        weights = config.get('score_weights', {
+            'return': 0.3,
+            'risk': 0.25,
+            'stability': 0.2,
+            'capacity': 0.15,
+            'greek': 0.1
+        })
+        self._weights_arr = np.array([
+            weights['return'], weights['risk'], weights['stability'],
+            weights['capacity'], weights['greek']
+        ], dtype=np.float64)
+        
         # Strategy tracking
-        self.strategy_scores: Dict[str, StrategyScore] = {}
+        self._scores = ScoreStore()
         self.selected_strategies: List[str] = []
         self.rejected_strategies: List[str] = []
     
+    @property
+    def strategy_scores(self) -> Dict[str, StrategyScore]:
+        """Snapshot of every evaluated strategy's score, keyed by name."""
+        store = self._scores
+        return {name: store.view(i) for name, i in store.index.items()}
+    
     def evaluate_strategy(
         self,
         strategy_name: str,
@@ -79,21 +212,8 @@ class StrategySelector:
             greek_score = self.scorer.calculate_greek_score(backtest_results)
             
             # Calculate total score (weighted average)
-            weights = self.config.get('score_weights', {
-                'return': 0.3,
-                'risk': 0.25,
-                'stability': 0.2,
-                'capacity': 0.15,
-                'greek': 0.1
-            })
-            
-            total_score = (
-                return_score * weights['return'] +
-                risk_score * weights['risk'] +
-                stability_score * weights['stability'] +
-                capacity_score * weights['capacity'] +
-                greek_score * weights['greek']
-            )
+            scores = np.array([return_score, risk_score, stability_score, capacity_score, greek_score])
+            total_score = float(np.dot(scores, self._weights_arr))
             
             # Determine suitability
             suitability = self._determine_suitability(total_score, return_score, risk_score)
@@ -111,7 +231,7 @@ class StrategySelector:
             )
             
             # Store score
-            self.strategy_scores[strategy_name] = score
+            self._scores.put(score)
             
             logger.info(f"Strategy {strategy_name} scored {total_score:.3f} ({suitability})")
             
@@ -130,6 +250,93 @@ class StrategySelector:
                 suitability='POOR'
             )
     
+    def evaluate_strategies_batch(
+        self,
+        entries: List[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]],
+        max_workers: Optional[int] = None
+    ) -> List[StrategyScore]:
+        """
+        Evaluate many strategies at once.
+        
+        By default the backtests are scored in-process with the scorer's
+        vectorized kernels. Each score takes microseconds, so worker
+        processes only pay off for very large batches with costly
+        walk-forward histories; pass max_workers to opt in.
+        
+        Args:
+            entries: (strategy_name, backtest_results, walk_forward_results) tuples
+            max_workers: Worker process count; None (default) scores in-process
+                in one vectorized pass
+        
+        Returns:
+            Strategy scores in entry order
+        """
+        if not entries:
+            return []
+        
+        if max_workers is None:
+            scores_mat, failed = self._score_matrix(entries)
+        else:
+            score_one = partial(_score_one, scorer=self.scorer)
+            if max_workers == 1 or len(entries) == 1:
+                components = list(map(score_one, entries))
+            else:
+                chunksize = max(1, len(entries) // (4 * max_workers))
+                with ProcessPoolExecutor(max_workers=max_workers) as ex:
+                    components = list(ex.map(score_one, entries, chunksize=chunksize))
+            
+            failed = np.array([c is None for c in components])
+            scores_mat = np.array(
+                [(0.0, 1.0, 0.0, 0.0, 0.0) if c is None else c for c in components],
+                dtype=np.float64
+            )
+        
+        # Totals and grades for the whole batch in one pass
+        total_scores = self.scorer.calculate_composite_batch(scores_mat, self._weights_arr)
+        total_scores[failed] = 0.0
+        codes = self._suitability_batch(total_scores, scores_mat[:, 0], scores_mat[:, 1])
+        
+        scores = []
+        for (strategy_name, _, _), row, total_score, code, is_failed in zip(
+            entries, scores_mat.tolist(), total_scores.tolist(), codes.tolist(), failed.tolist()
+        ):
+            score = StrategyScore(strategy_name, total_score, *row, SUITABILITY_LABELS[code])
+            if not is_failed:
+                self._scores.put(score)
+            scores.append(score)
+        
+        logger.info(f"Evaluated {len(scores)} strategies")
+        
+        return scores
+    
+    def _score_matrix(
+        self,
+        entries: List[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (N, 5) component scores for entries from StrategyScorer.calculate_batch,
+        and a mask of the entries that could not be scored. Failed entries
+        get the same placeholder as evaluate_strategy.
+        """
+        n = len(entries)
+        metrics = np.zeros((n, len(BACKTEST_COLUMNS)), dtype=np.float64)
+        stability = np.zeros(n, dtype=np.float64)
+        failed = np.zeros(n, dtype=bool)
+        for i, (strategy_name, backtest_results, walk_forward_results) in enumerate(entries):
+            try:
+                # Missing and None metrics count as 0, as in the scalar scores
+                get = backtest_results.get
+                metrics[i] = [float(get(name) or 0.0) for name in BACKTEST_COLUMNS]
+                stability[i] = self.scorer.calculate_stability_score(walk_forward_results)
+            except Exception as e:
+                logger.error(f"Error evaluating strategy {strategy_name}: {e}")
+                failed[i] = True
+        metrics[np.isnan(metrics)] = 0.0
+        
+        scores_mat = self.scorer.calculate_batch(metrics, stability)[:, :5]
+        scores_mat[failed] = (0.0, 1.0, 0.0, 0.0, 0.0)
+        return scores_mat, failed
+    
     def select_strategies(
         self,
         available_strategies: List[str],
@@ -146,27 +353,38 @@ class StrategySelector:
             List of selected strategy names
         """
         try:
-            # Filter strategies that meet minimum criteria
-            qualified_strategies = []
+            store = self._scores
+            rows = np.array(
+                [store.index[name] for name in available_strategies if name in store.index],
+                dtype=np.intp
+            )
             
-            for strategy_name in available_strategies:
-                if strategy_name not in self.strategy_scores:
-                    continue
-                
-                score = self.strategy_scores[strategy_name]
-                
-                # Check if strategy meets minimum criteria
-                if self._meets_minimum_criteria(score):
-                    qualified_strategies.append((strategy_name, score))
-                else:
-                    self.rejected_strategies.append(strategy_name)
-                    logger.info(f"Strategy {strategy_name} rejected: {self._get_rejection_reason(score)}")
+            # Filter strategies that meet minimum criteria
+            failed = self._failed_criteria(rows)
+            mask = ~failed.any(axis=0)
             
-            # Sort by total score (descending)
-            qualified_strategies.sort(key=lambda x: x[1].total_score, reverse=True)
+            rejected = rows[~mask]
+            self.rejected_strategies.extend(store.strategy_name[rejected].tolist())
+            if rejected.size and logger.isEnabledFor(logging.INFO):
+                for strategy_name, reason in zip(
+                    store.strategy_name[rejected], self._rejection_reasons(rejected, failed[:, ~mask])
+                ):
+                    logger.info(f"Strategy {strategy_name} rejected: {reason}")
             
-            # Select top strategies
-            selected = [strategy for strategy, score in qualified_strategies[:max_strategies]]
+            # Select top strategies by total score (descending)
+            qualified = rows[mask]
+            totals = store.total_score[qualified]
+            if 0 < max_strategies < totals.size:
+                # Partition out the K best, keeping the earliest of any ties at
+                # the cut, then sort just those
+                cut = -np.partition(-totals, max_strategies - 1)[max_strategies - 1]
+                top = np.flatnonzero(totals > cut)
+                ties = np.flatnonzero(totals == cut)[:max_strategies - top.size]
+                top = np.concatenate((top, ties))
+                top = top[np.argsort(-totals[top], kind='stable')]
+            else:
+                top = np.argsort(-totals, kind='stable')[:max_strategies]
+            selected = store.strategy_name[qualified[top]].tolist()
             self.selected_strategies = selected
             
             logger.info(f"Selected {len(selected)} strategies: {selected}")
@@ -237,44 +455,55 @@ class StrategySelector:
         risk_score: float
     ) -> str:
         """Determine strategy suitability based on scores."""
-        if total_score >= 0.8 and return_score >= 0.7 and risk_score <= 0.2:
-            return 'EXCELLENT'
-        elif total_score >= 0.6 and return_score >= 0.5 and risk_score <= 0.3:
-            return 'GOOD'
-        elif total_score >= 0.4 and return_score >= 0.3 and risk_score <= 0.4:
-            return 'FAIR'
-        else:
-            return 'POOR'
-    
-    def _meets_minimum_criteria(self, score: StrategyScore) -> bool:
-        """Check if strategy meets minimum criteria."""
-        return (
-            score.total_score >= self.min_total_score and
-            score.return_score >= self.min_return_score and
-            score.risk_score <= self.max_risk_score and
-            score.stability_score >= self.min_stability_score and
-            score.capacity_score >= self.min_capacity_score and
-            score.greek_score >= self.min_greek_score
+        # Each grade's gates imply those of the grade below, so the number
+        # of gates passed is the grade's code
+        code = (
+            int(total_score >= 0.4 and return_score >= 0.3 and risk_score <= 0.4) +
+            int(total_score >= 0.6 and return_score >= 0.5 and risk_score <= 0.3) +
+            int(total_score >= 0.8 and return_score >= 0.7 and risk_score <= 0.2)
         )
+        return SUITABILITY_LABELS[code]
     
-    def _get_rejection_reason(self, score: StrategyScore) -> str:
-        """Get reason for strategy rejection."""
-        reasons = []
-        
-        if score.total_score < self.min_total_score:
-            reasons.append(f"Total score {score.total_score:.3f} < {self.min_total_score}")
-        if score.return_score < self.min_return_score:
-            reasons.append(f"Return score {score.return_score:.3f} < {self.min_return_score}")
-        if score.risk_score > self.max_risk_score:
-            reasons.append(f"Risk score {score.risk_score:.3f} > {self.max_risk_score}")
-        if score.stability_score < self.min_stability_score:
-            reasons.append(f"Stability score {score.stability_score:.3f} < {self.min_stability_score}")
-        if score.capacity_score < self.min_capacity_score:
-            reasons.append(f"Capacity score {score.capacity_score:.3f} < {self.min_capacity_score}")
-        if score.greek_score < self.min_greek_score:
-            reasons.append(f"Greek score {score.greek_score:.3f} < {self.min_greek_score}")
-        
-        return "; ".join(reasons)
+    def _suitability_batch(
+        self,
+        total_score: np.ndarray,
+        return_score: np.ndarray,
+        risk_score: np.ndarray
+    ) -> np.ndarray:
+        """Suitability codes (indices into SUITABILITY_LABELS) for arrays of scores."""
+        return np.select(
+            [
+                (total_score >= 0.8) & (return_score >= 0.7) & (risk_score <= 0.2),
+                (total_score >= 0.6) & (return_score >= 0.5) & (risk_score <= 0.3),
+                (total_score >= 0.4) & (return_score >= 0.3) & (risk_score <= 0.4)
+            ],
+            [3, 2, 1],
+            default=0
+        ).astype(np.int8)
+    
+    def _failed_criteria(self, rows: np.ndarray) -> np.ndarray:
+        """Boolean (criterion x row) array of the selection criteria each row fails."""
+        store = self._scores
+        failed = np.empty((len(_CRITERIA), rows.size), dtype=bool)
+        for k, (column, threshold, is_upper, _) in enumerate(_CRITERIA):
+            values = getattr(store, column)[rows]
+            limit = getattr(self, threshold)
+            failed[k] = ~(values <= limit) if is_upper else ~(values >= limit)
+        return failed
+    
+    def _rejection_reasons(self, rows: np.ndarray, failed: np.ndarray) -> List[str]:
+        """Rejection reasons for rows, given their failed criteria."""
+        store = self._scores
+        reasons: List[List[str]] = [[] for _ in range(rows.size)]
+        for (column, threshold, is_upper, label), fails in zip(_CRITERIA, failed):
+            hits = np.flatnonzero(fails)
+            if not hits.size:
+                continue
+            limit = getattr(self, threshold)
+            op = '>' if is_upper else '<'
+            for j, value in zip(hits.tolist(), getattr(store, column)[rows[hits]].tolist()):
+                reasons[j].append(f"{label} {value:.3f} {op} {limit}")
+        return ["; ".join(reason) for reason in reasons]
     
     def _check_market_conditions(
         self,
@@ -318,34 +547,38 @@ class StrategySelector:
     
     def get_strategy_rankings(self) -> List[Dict[str, Any]]:
         """Get strategy rankings."""
-        rankings = []
+        store = self._scores
         
-        for strategy_name, score in self.strategy_scores.items():
-            rankings.append({
-                'strategy_name': strategy_name,
-                'total_score': score.total_score,
-                'return_score': score.return_score,
-                'risk_score': score.risk_score,
-                'stability_score': score.stability_score,
-                'capacity_score': score.capacity_score,
-                'greek_score': score.greek_score,
-                'suitability': score.suitability,
-                'selected': strategy_name in self.selected_strategies
-            })
-        
-        # Sort by total score
-        rankings.sort(key=lambda x: x['total_score'], reverse=True)
+        # Sort by total score; stable, so ties keep evaluation order
+        order = np.argsort(-store.total_score[:store.n], kind='stable')
+        selected = set(self.selected_strategies)
         
-        return rankings
+        return [
+            {
+                'strategy_name': strategy_name,
+                'total_score': total_score,
+                'return_score': return_score,
+                'risk_score': risk_score,
+                'stability_score': stability_score,
+                'capacity_score': capacity_score,
+                'greek_score': greek_score,
+                'suitability': SUITABILITY_LABELS[code],
+                'selected': strategy_name in selected
+            }
+            for strategy_name, total_score, return_score, risk_score, stability_score,
+            capacity_score, greek_score, code in zip(
+                *(getattr(store, name)[order].tolist() for name in ScoreStore._COLUMNS)
+            )
+        ]
     
     def get_selection_summary(self) -> Dict[str, Any]:
         """Get selection summary."""
         return {
-            'total_strategies_evaluated': len(self.strategy_scores),
+            'total_strategies_evaluated': len(self._scores),
             'selected_strategies': len(self.selected_strategies),
             'rejected_strategies': len(self.rejected_strategies),
-            'selection_rate': len(self.selected_strategies) / len(self.strategy_scores) if self.strategy_scores else 0,
-            'average_score': np.mean([score.total_score for score in self.strategy_scores.values()]) if self.strategy_scores else 0,
+            'selection_rate': len(self.selected_strategies) / len(self._scores) if len(self._scores) else 0,
+            'average_score': self._scores.total_score[:len(self._scores)].mean() if len(self._scores) else 0,
             'selected_strategies_list': self.selected_strategies,
             'rejected_strategies_list': self.rejected_strategies
         }
@@ -4,15 +4,222 @@ Strategy validation system.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple, NamedTuple, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
+import math
+from math import fabs
+from operator import itemgetter
+import time
 
 logger = logging.getLogger(__name__)
 
+# Trading hours (09:00-14:59) and the wall-clock hour, refreshed at most
+# every _HOUR_CACHE_TTL seconds: [monotonic timestamp, hour]
+_MARKET_HOURS_SET = frozenset(range(9, 15))
+_HOUR_CACHE_TTL = 30.0
+_HOUR_CACHE = [float('-inf'), -1]
 
-@dataclass
+
+def _current_hour(now=time.monotonic) -> int:
+    """Return the local hour, re-reading the clock only when the cache is stale."""
+    t = now()
+    cache = _HOUR_CACHE
+    if t - cache[0] > _HOUR_CACHE_TTL:
+        cache[0] = t
+        cache[1] = datetime.now().hour
+    return cache[1]
+
+
+# Message formatters, bound once so hot paths skip the str attribute lookup
+_TPL_WF_INSUFFICIENT = "Insufficient walk-forward periods: {}".format
+_TPL_WF_LIMITED = "Limited walk-forward periods: {}".format
+_TPL_RETURN_CV_VIOL = "High return variability: CV = {:.2f}".format
+_TPL_RETURN_CV_WARN = "Moderate return variability: CV = {:.2f}".format
+_TPL_SHARPE_CV_VIOL = "High Sharpe ratio variability: CV = {:.2f}".format
+_TPL_SHARPE_CV_WARN = "Moderate Sharpe ratio variability: CV = {:.2f}".format
+_TPL_NEGATIVE_VIOL = "Too many negative periods: {:.2%}".format
+_TPL_NEGATIVE_WARN = "Moderate negative periods: {:.2%}".format
+_TPL_VOL_REGIME_VIOL = "High volatility regime: {:.2%}".format
+_TPL_VOL_REGIME_WARN = "Elevated volatility regime: {:.2%}".format
+_TPL_EXPIRY_VIOL = "Too close to expiry: {} days".format
+_TPL_EXPIRY_WARN = "Close to expiry: {} days".format
+_TPL_DELTA_VIOL = "Delta exposure {:.0f} above maximum {}".format
+_TPL_DELTA_WARN = "Delta exposure {:.0f} close to maximum {}".format
+_TPL_GAMMA_VIOL = "Gamma exposure {:.0f} above maximum {}".format
+_TPL_GAMMA_WARN = "Gamma exposure {:.0f} close to maximum {}".format
+_TPL_THETA_VIOL = "Theta exposure {:.0f} above maximum {}".format
+_TPL_THETA_WARN = "Theta exposure {:.0f} close to maximum {}".format
+_TPL_VEGA_VIOL = "Vega exposure {:.0f} above maximum {}".format
+_TPL_VEGA_WARN = "Vega exposure {:.0f} close to maximum {}".format
+_TPL_POSITION_VIOL = "Position size {:.0f} above maximum {}".format
+_TPL_POSITION_WARN = "Position size {:.0f} close to maximum {}".format
+_TPL_PORTFOLIO_VIOL = "Portfolio value {:.0f} above maximum {}".format
+_TPL_PORTFOLIO_WARN = "Portfolio value {:.0f} close to maximum {}".format
+_TPL_MARGIN_VIOL = "Margin usage {:.2%} above maximum {:.2%}".format
+_TPL_MARGIN_WARN = "Margin usage {:.2%} close to maximum {:.2%}".format
+
+# Walk-forward lists longer than this amortize NumPy's per-call overhead
+_WF_NUMPY_MIN_LEN = 64
+
+
+def _wf_stats(walk_forward_results: List[Dict[str, Any]]) -> Tuple[float, float, float, float, float]:
+    """
+    Population mean and std of walk-forward returns and Sharpe ratios plus
+    the fraction of negative-return periods, for a non-empty list:
+    (return_mean, return_std, sharpe_mean, sharpe_std, negative_pct).
+    """
+    n = len(walk_forward_results)
+    if n > _WF_NUMPY_MIN_LEN:
+        # One (N, 2) array of (return, sharpe) rows reduced column-wise
+        stats = np.fromiter(
+            ((result.get('annualized_return', 0.0), result.get('sharpe_ratio', 0.0))
+             for result in walk_forward_results),
+            dtype=np.dtype((np.float64, 2)),
+            count=n
+        )
+        return_mean, sharpe_mean = stats.mean(axis=0).tolist()
+        return_std, sharpe_std = stats.std(axis=0).tolist()
+        return return_mean, return_std, sharpe_mean, sharpe_std, float((stats[:, 0] < 0).mean())
+    
+    returns = [result.get('annualized_return', 0.0) for result in walk_forward_results]
+    sharpes = [result.get('sharpe_ratio', 0.0) for result in walk_forward_results]
+    return_mean = math.fsum(returns) / n
+    sharpe_mean = math.fsum(sharpes) / n
+    return_std = math.sqrt(math.fsum((x - return_mean) * (x - return_mean) for x in returns) / n)
+    sharpe_std = math.sqrt(math.fsum((x - sharpe_mean) * (x - sharpe_mean) for x in sharpes) / n)
+    negative_pct = sum(1 for r in returns if r < 0) / n
+    return return_mean, return_std, sharpe_mean, sharpe_std, negative_pct
+
+
+# Backtest threshold checks in report order: (metric, default, takes abs,
+# threshold attribute, is a maximum, warning factor, violation and warning
+# message formatters)
+_BACKTEST_CHECKS = (
+    ('annualized_return', 0.0, False, 'min_annual_return', False, 1.2,
+     "Annual return {:.2%} below minimum {:.2%}".format, "Annual return {:.2%} close to minimum {:.2%}".format),
+    ('volatility', 0.0, False, 'max_volatility', True, 0.9,
+     "Volatility {:.2%} above maximum {:.2%}".format, "Volatility {:.2%} close to maximum {:.2%}".format),
+    ('max_drawdown', 0.0, True, 'max_drawdown', True, 0.9,
+     "Max drawdown {:.2%} above maximum {:.2%}".format, "Max drawdown {:.2%} close to maximum {:.2%}".format),
+    ('sharpe_ratio', 0.0, False, 'min_sharpe_ratio', False, 1.1,
+     "Sharpe ratio {:.2f} below minimum {:.2f}".format, "Sharpe ratio {:.2f} close to minimum {:.2f}".format),
+    ('profit_factor', 0.0, False, 'min_profit_factor', False, 1.1,
+     "Profit factor {:.2f} below minimum {:.2f}".format, "Profit factor {:.2f} close to minimum {:.2f}".format),
+    ('win_rate', 0.0, False, 'min_win_rate', False, 1.1,
+     "Win rate {:.2%} below minimum {:.2%}".format, "Win rate {:.2%} close to minimum {:.2%}".format),
+    ('total_trades', 0, False, 'min_trade_count', False, 1.2,
+     "Trade count {} below minimum {}".format, "Trade count {} close to minimum {}".format),
+    ('calmar_ratio', 0.0, False, 'min_calmar_ratio', False, 1.1,
+     "Calmar ratio {:.2f} below minimum {:.2f}".format, "Calmar ratio {:.2f} close to minimum {:.2f}".format),
+    ('var_95', 0.0, True, 'max_var_95', True, 0.9,
+     "VaR 95% {:.2%} above maximum {:.2%}".format, "VaR 95% {:.2%} close to maximum {:.2%}".format),
+    ('cvar_95', 0.0, True, 'max_cvar_95', True, 0.9,
+     "CVaR 95% {:.2%} above maximum {:.2%}".format, "CVaR 95% {:.2%} close to maximum {:.2%}".format)
+)
+
+
+class BacktestMetrics(NamedTuple):
+    """
+    Backtest metrics read by the validator, as a typed alternative to a
+    results dict. Defaults match the dict lookups' defaults.
+    """
+    annualized_return: float = 0.0
+    volatility: float = 0.0
+    max_drawdown: float = 0.0
+    sharpe_ratio: float = 0.0
+    profit_factor: float = 0.0
+    win_rate: float = 0.0
+    total_trades: int = 0
+    calmar_ratio: float = 0.0
+    var_95: float = 0.0
+    cvar_95: float = 0.0
+    delta_exposure: float = 0.0
+    gamma_exposure: float = 0.0
+    theta_exposure: float = 0.0
+    vega_exposure: float = 0.0
+    max_position_size: float = 0.0
+    max_portfolio_value: float = 0.0
+    margin_usage: float = 0.0
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get-style field lookup, for code shared with results dicts."""
+        return getattr(self, key, default)
+
+
+# Struct-of-arrays batch of BacktestMetrics for validate_many:
+# np.zeros(n, dtype=MetricsBatch) holds one row per strategy
+MetricsBatch = np.dtype([(name, np.float64) for name in BacktestMetrics._fields])
+
+# Backtest check metrics of a BacktestMetrics, in _BACKTEST_CHECKS order
+_backtest_fields = itemgetter(*(BacktestMetrics._fields.index(check[0]) for check in _BACKTEST_CHECKS))
+
+
+def _float_literal(x: float) -> str:
+    """Source expression for a float, including non-finite values."""
+    return repr(x) if math.isfinite(x) else f"float('{x}')"
+
+
+def _compile_backtest_checks(limits: Tuple[Any, ...]):
+    """
+    Generate StrategyValidator._validate_backtest_results for fixed limits
+    (aligned with _BACKTEST_CHECKS), with each comparison against a constant.
+    Missing (None) or NaN metrics fail their check, as in validate_many and
+    the validation score.
+    """
+    namespace: Dict[str, Any] = {
+        'fabs': fabs,
+        'nan': math.nan,
+        'BacktestMetrics': BacktestMetrics,
+        '_backtest_fields': _backtest_fields
+    }
+    names = [f"m{i}" for i in range(len(_BACKTEST_CHECKS))]
+    lines = [
+        "def _validate_backtest_results(backtest_results, violations, warnings):",
+        "    if isinstance(backtest_results, BacktestMetrics):",
+        f"        {', '.join(names)} = _backtest_fields(backtest_results)",
+        "    else:",
+        "        get = backtest_results.get"
+    ]
+    for name, (key, default) in zip(names, (check[:2] for check in _BACKTEST_CHECKS)):
+        lines.append(f"        {name} = get({key!r}, {default!r})")
+    for i, check in enumerate(_BACKTEST_CHECKS):
+        key, default, takes_abs, _, is_max, factor, violation_format, warning_format = check
+        namespace[f'_limit_{i}'] = limits[i]
+        namespace[f'_violation_{i}'] = violation_format
+        namespace[f'_warning_{i}'] = warning_format
+        limit = float(limits[i])
+        # None becomes NaN; the raw value is kept for the message so integer
+        # counts still format as integers
+        lines.append(f"    value = nan if {names[i]} is None else {names[i]}")
+        if takes_abs:
+            lines.append("    value = fabs(value)")
+        # "not (x >= limit)" so NaN metrics fail, as in the vectorized check
+        if is_max:
+            lines.append(f"    if not (float(value) <= {_float_literal(limit)}):")
+        else:
+            lines.append(f"    if not (float(value) >= {_float_literal(limit)}):")
+        lines.append(f"        violations.append(_violation_{i}(value, _limit_{i}))")
+        lines.append(f"    elif value {'>' if is_max else '<'} {_float_literal(limit * factor)}:")
+        lines.append(f"        warnings.append(_warning_{i}(value, _limit_{i}))")
+    exec("\n".join(lines), namespace)
+    return namespace['_validate_backtest_results']
+
+
+# Validation score deducted for each violated backtest threshold
+_SCORE_PENALTIES = {
+    'annualized_return': 0.3,
+    'volatility': 0.2,
+    'max_drawdown': 0.2,
+    'sharpe_ratio': 0.1,
+    'profit_factor': 0.1,
+    'win_rate': 0.1
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Validation result."""
     is_valid: bool
@@ -26,6 +233,11 @@ class StrategyValidator:
     Strategy validation system.
     """
     
+    # Shared instances from from_config, keyed by sorted config items and
+    # kept in least-recently-used order
+    _INSTANCES: 'OrderedDict[Tuple[Tuple[str, Any], ...], StrategyValidator]' = OrderedDict()
+    _MAX_INSTANCES = 32
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         
@@ -52,11 +264,74 @@ class StrategyValidator:
         self.max_position_size = config.get('max_position_size', 10000)
         self.max_portfolio_value = config.get('max_portfolio_value', 1000000)
         self.max_margin_usage = config.get('max_margin_usage', 0.8)
+        
+        # Stop after the first category that brings the violation count to
+        # early_exit_threshold
+        self.early_exit = config.get('early_exit', False)
+        self.early_exit_threshold = config.get('early_exit_threshold', 3)
+        
+        # Whether each strategy name seen so far is an options strategy
+        self._is_option_cache: Dict[str, bool] = {}
+        
+        self._build_backtest_checks()
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'StrategyValidator':
+        """
+        Return a shared validator for config, constructing it on first use.
+        
+        The config dict must not be mutated after it has been passed here.
+        Configs with unhashable values get a fresh, uncached validator. At
+        most _MAX_INSTANCES validators are kept; the least recently used is
+        dropped first, so callers cycling through many configs should hold
+        on to their validators instead.
+        
+        Args:
+            config: Validator configuration
+        
+        Returns:
+            Validator for this configuration
+        """
+        try:
+            key = tuple(sorted(config.items()))
+            instance = cls._INSTANCES.get(key)
+        except TypeError:
+            return cls(config)
+        if instance is None:
+            instance = cls._INSTANCES[key] = cls(config)
+            if len(cls._INSTANCES) > cls._MAX_INSTANCES:
+                cls._INSTANCES.popitem(last=False)
+        else:
+            cls._INSTANCES.move_to_end(key)
+        return instance
+
+    def _build_backtest_checks(self) -> None:
+        """
+        Derive the backtest check state from the current thresholds: aligned
+        vectors for the vectorized checks and score, and a straight-line
+        _validate_backtest_results specialized to these thresholds. Call
+        again after changing any backtest threshold.
+        """
+        # Backtest checks as aligned vectors. Maximums are negated so every
+        # check reads "sign * value must be at least the floor"
+        (self._bt_keys, self._bt_defaults, takes_abs, thresholds, is_max, factors,
+         self._bt_violation_formats, self._bt_warning_formats) = zip(*_BACKTEST_CHECKS)
+        self._bt_abs = np.array(takes_abs)
+        self._bt_limits = tuple(getattr(self, name) for name in thresholds)
+        self._bt_signs = np.where(is_max, -1.0, 1.0)
+        self._bt_floors = self._bt_signs * np.array(self._bt_limits, dtype=np.float64)
+        self._bt_warning_floors = self._bt_floors * np.array(factors)
+        self._bt_penalties = np.array([_SCORE_PENALTIES.get(key, 0.0) for key in self._bt_keys])
+        # Bit i of a violation fingerprint is check i of _BACKTEST_CHECKS
+        self._bt_bits = np.left_shift(1, np.arange(len(self._bt_keys), dtype=np.uint16), dtype=np.uint16)
+        
+        # Backtest checker with the thresholds baked in as constants
+        self._validate_backtest_results = _compile_backtest_checks(self._bt_limits)
     
     def validate_strategy(
         self,
         strategy_name: str,
-        backtest_results: Dict[str, Any],
+        backtest_results: Union[Dict[str, Any], BacktestMetrics],
         walk_forward_results: List[Dict[str, Any]],
         current_market_conditions: Dict[str, Any]
     ) -> ValidationResult:
@@ -65,223 +340,177 @@ class StrategyValidator:
         
         Args:
             strategy_name: Name of the strategy
-            backtest_results: Backtest performance metrics
+            backtest_results: Backtest performance metrics, as a dict or BacktestMetrics
             walk_forward_results: Walk-forward optimization results
             current_market_conditions: Current market conditions
             
         Returns:
             Validation result
         """
-        try:
-            violations = []
-            warnings = []
-            
-            # Validate backtest results
-            backtest_violations, backtest_warnings = self._validate_backtest_results(backtest_results)
-            violations.extend(backtest_violations)
-            warnings.extend(backtest_warnings)
-            
-            # Validate walk-forward results
-            wf_violations, wf_warnings = self._validate_walk_forward_results(walk_forward_results)
-            violations.extend(wf_violations)
-            warnings.extend(wf_warnings)
-            
-            # Validate market conditions
-            market_violations, market_warnings = self._validate_market_conditions(
-                strategy_name, current_market_conditions
-            )
-            violations.extend(market_violations)
-            warnings.extend(market_warnings)
-            
-            # Validate Greeks
-            greek_violations, greek_warnings = self._validate_greeks(backtest_results)
-            violations.extend(greek_violations)
-            warnings.extend(greek_warnings)
-            
-            # Validate capacity
-            capacity_violations, capacity_warnings = self._validate_capacity(backtest_results)
-            violations.extend(capacity_violations)
-            warnings.extend(capacity_warnings)
-            
-            # Calculate validation score
-            score = self._calculate_validation_score(backtest_results, walk_forward_results)
-            
-            # Determine if strategy is valid
-            is_valid = len(violations) == 0
-            
-            result = ValidationResult(
-                is_valid=is_valid,
-                violations=violations,
-                warnings=warnings,
-                score=score
-            )
-            
-            logger.info(f"Strategy {strategy_name} validation: {'PASSED' if is_valid else 'FAILED'}")
-            if violations:
-                logger.warning(f"Violations: {violations}")
-            if warnings:
-                logger.info(f"Warnings: {warnings}")
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error validating strategy {strategy_name}: {e}")
-            return ValidationResult(
-                is_valid=False,
-                violations=[f"Validation error: {e}"],
-                warnings=[],
-                score=0.0
-            )
-    
-    def _validate_backtest_results(self, backtest_results: Dict[str, Any]) -> Tuple[List[str], List[str]]:
-        """Validate backtest results."""
         violations = []
         warnings = []
         
-        # Check annual return
-        annual_return = backtest_results.get('annualized_return', 0.0)
-        if annual_return < self.min_annual_return:
-            violations.append(f"Annual return {annual_return:.2%} below minimum {self.min_annual_return:.2%}")
-        elif annual_return < self.min_annual_return * 1.2:
-            warnings.append(f"Annual return {annual_return:.2%} close to minimum {self.min_annual_return:.2%}")
-        
-        # Check volatility
-        volatility = backtest_results.get('volatility', 0.0)
-        if volatility > self.max_volatility:
-            violations.append(f"Volatility {volatility:.2%} above maximum {self.max_volatility:.2%}")
-        elif volatility > self.max_volatility * 0.9:
-            warnings.append(f"Volatility {volatility:.2%} close to maximum {self.max_volatility:.2%}")
-        
-        # Check max drawdown
-        max_drawdown = abs(backtest_results.get('max_drawdown', 0.0))
-        if max_drawdown > self.max_drawdown:
-            violations.append(f"Max drawdown {max_drawdown:.2%} above maximum {self.max_drawdown:.2%}")
-        elif max_drawdown > self.max_drawdown * 0.9:
-            warnings.append(f"Max drawdown {max_drawdown:.2%} close to maximum {self.max_drawdown:.2%}")
-        
-        # Check Sharpe ratio
-        sharpe_ratio = backtest_results.get('sharpe_ratio', 0.0)
-        if sharpe_ratio < self.min_sharpe_ratio:
-            violations.append(f"Sharpe ratio {sharpe_ratio:.2f} below minimum {self.min_sharpe_ratio:.2f}")
-        elif sharpe_ratio < self.min_sharpe_ratio * 1.1:
-            warnings.append(f"Sharpe ratio {sharpe_ratio:.2f} close to minimum {self.min_sharpe_ratio:.2f}")
-        
-        # Check profit factor
-        profit_factor = backtest_results.get('profit_factor', 0.0)
-        if profit_factor < self.min_profit_factor:
-            violations.append(f"Profit factor {profit_factor:.2f} below minimum {self.min_profit_factor:.2f}")
-        elif profit_factor < self.min_profit_factor * 1.1:
-            warnings.append(f"Profit factor {profit_factor:.2f} close to minimum {self.min_profit_factor:.2f}")
-        
-        # Check win rate
-        win_rate = backtest_results.get('win_rate', 0.0)
-        if win_rate < self.min_win_rate:
-            violations.append(f"Win rate {win_rate:.2%} below minimum {self.min_win_rate:.2%}")
-        elif win_rate < self.min_win_rate * 1.1:
-            warnings.append(f"Win rate {win_rate:.2%} close to minimum {self.min_win_rate:.2%}")
-        
-        # Check trade count
-        total_trades = backtest_results.get('total_trades', 0)
-        if total_trades < self.min_trade_count:
-            violations.append(f"Trade count {total_trades} below minimum {self.min_trade_count}")
-        elif total_trades < self.min_trade_count * 1.2:
-            warnings.append(f"Trade count {total_trades} close to minimum {self.min_trade_count}")
-        
-        # Check Calmar ratio
-        calmar_ratio = backtest_results.get('calmar_ratio', 0.0)
-        if calmar_ratio < self.min_calmar_ratio:
-            violations.append(f"Calmar ratio {calmar_ratio:.2f} below minimum {self.min_calmar_ratio:.2f}")
-        elif calmar_ratio < self.min_calmar_ratio * 1.1:
-            warnings.append(f"Calmar ratio {calmar_ratio:.2f} close to minimum {self.min_calmar_ratio:.2f}")
-        
-        # Check VaR
-        var_95 = abs(backtest_results.get('var_95', 0.0))
-        if var_95 > self.max_var_95:
-            violations.append(f"VaR 95% {var_95:.2%} above maximum {self.max_var_95:.2%}")
-        elif var_95 > self.max_var_95 * 0.9:
-            warnings.append(f"VaR 95% {var_95:.2%} close to maximum {self.max_var_95:.2%}")
-        
-        # Check CVaR
-        cvar_95 = abs(backtest_results.get('cvar_95', 0.0))
-        if cvar_95 > self.max_cvar_95:
-            violations.append(f"CVaR 95% {cvar_95:.2%} above maximum {self.max_cvar_95:.2%}")
-        elif cvar_95 > self.max_cvar_95 * 0.9:
-            warnings.append(f"CVaR 95% {cvar_95:.2%} close to maximum {self.max_cvar_95:.2%}")
-        
-        return violations, warnings
+        # Backtest, walk-forward, market conditions, Greeks, capacity
+        checks = (
+            (self._validate_backtest_results, (backtest_results,)),
+            (self._validate_walk_forward_results, (walk_forward_results,)),
+            (self._validate_market_conditions, (strategy_name, current_market_conditions)),
+            (self._validate_greeks, (backtest_results,)),
+            (self._validate_capacity, (backtest_results,))
+        )
+        for check, args in checks:
+            check(*args, violations, warnings)
+            if self.early_exit and len(violations) >= self.early_exit_threshold:
+                # Remaining categories are skipped, so their warnings
+                # would be incomplete
+                warnings = ["early_exit_triggered"]
+                break
+        
+        # Calculate validation score
+        score = self._calculate_validation_score(backtest_results, walk_forward_results)
+        
+        # Determine if strategy is valid
+        is_valid = len(violations) == 0
+        
+        result = ValidationResult(
+            is_valid=is_valid,
+            violations=violations,
+            warnings=warnings,
+            score=score
+        )
+        
+        # %-style arguments so disabled levels skip formatting the lists
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Strategy %s validation: %s", strategy_name, 'PASSED' if is_valid else 'FAILED')
+        if violations and logger.isEnabledFor(logging.WARNING):
+            logger.warning("Violations: %s", violations)
+        if warnings and logger.isEnabledFor(logging.INFO):
+            logger.info("Warnings: %s", warnings)
+        
+        return result
+    
+    def validate_many(self, results: Union[pd.DataFrame, np.ndarray]) -> pd.DataFrame:
+        """
+        Validate the backtest metrics of many strategies at once.
+        
+        Only the backtest thresholds are checked; walk-forward, market,
+        Greek and capacity checks need per-strategy inputs and remain in
+        validate_strategy.
+        
+        Args:
+            results: DataFrame with one row per strategy and one column per
+                backtest metric, or a MetricsBatch structured array; missing
+                columns take the validate_strategy defaults
+        
+        Returns:
+            DataFrame (on the input index for a DataFrame) with
+            violation_count, warning_count,
+            score, is_valid and violation_fingerprint columns; bit i of
+            the uint16 fingerprint is set when backtest check i failed, so
+            failure patterns can be compared or counted with np.bincount
+        """
+        is_frame = isinstance(results, pd.DataFrame)
+        columns = results.columns if is_frame else results.dtype.names
+        metrics = np.empty((len(results), len(self._bt_keys)), dtype=np.float64)
+        for j, (key, default) in enumerate(zip(self._bt_keys, self._bt_defaults)):
+            if key not in columns:
+                metrics[:, j] = default
+            elif is_frame:
+                metrics[:, j] = results[key].to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                metrics[:, j] = results[key]
+        np.abs(metrics, out=metrics, where=self._bt_abs)
+        metrics *= self._bt_signs
+        
+        # One comparison per threshold column, as in _validate_backtest_results
+        violated = ~(metrics >= self._bt_floors)
+        warned = ~violated & (metrics < self._bt_warning_floors)
+        fingerprints = (violated * self._bt_bits).sum(axis=1, dtype=np.uint16)
+        
+        return pd.DataFrame({
+            'violation_count': violated.sum(axis=1),
+            'warning_count': warned.sum(axis=1),
+            'score': np.clip(1.0 - violated @ self._bt_penalties, 0.0, 1.0),
+            'is_valid': fingerprints == 0,
+            'violation_fingerprint': fingerprints
+        }, index=results.index if is_frame else None)
+    
+    def _signed_backtest_values(
+        self,
+        backtest_results: Union[Dict[str, Any], BacktestMetrics]
+    ) -> Tuple[List[Any], np.ndarray]:
+        """Raw backtest metrics in check order and their signed float vector."""
+        if isinstance(backtest_results, BacktestMetrics):
+            values = list(_backtest_fields(backtest_results))
+        else:
+            get = backtest_results.get
+            values = [get(key, default) for key, default in zip(self._bt_keys, self._bt_defaults)]
+        signed = np.fromiter(values, dtype=np.float64, count=len(values))
+        np.abs(signed, out=signed, where=self._bt_abs)
+        signed *= self._bt_signs
+        return values, signed
     
     def _validate_walk_forward_results(
         self, 
-        walk_forward_results: List[Dict[str, Any]]
-    ) -> Tuple[List[str], List[str]]:
-        """Validate walk-forward results."""
-        violations = []
-        warnings = []
-        
+        walk_forward_results: List[Dict[str, Any]],
+        violations: List[str],
+        warnings: List[str]
+    ) -> None:
+        """Validate walk-forward results, appending to violations and warnings."""
         if not walk_forward_results:
             violations.append("No walk-forward results available")
-            return violations, warnings
+            return
         
         # Check number of periods
-        if len(walk_forward_results) < 5:
-            violations.append(f"Insufficient walk-forward periods: {len(walk_forward_results)}")
-        elif len(walk_forward_results) < 10:
-            warnings.append(f"Limited walk-forward periods: {len(walk_forward_results)}")
+        n_periods = len(walk_forward_results)
+        if n_periods < 5:
+            violations.append(_TPL_WF_INSUFFICIENT(n_periods))
+        elif n_periods < 10:
+            warnings.append(_TPL_WF_LIMITED(n_periods))
         
         # Check consistency across periods
-        returns = [result.get('annualized_return', 0.0) for result in walk_forward_results]
-        sharpe_ratios = [result.get('sharpe_ratio', 0.0) for result in walk_forward_results]
+        return_mean, return_std, sharpe_mean, sharpe_std, negative_pct = _wf_stats(walk_forward_results)
         
         # Check return consistency
-        return_std = np.std(returns)
-        return_mean = np.mean(returns)
         if return_mean != 0:
-            return_cv = return_std / abs(return_mean)
+            return_cv = return_std / fabs(return_mean)
             if return_cv > 0.5:
-                violations.append(f"High return variability: CV = {return_cv:.2f}")
+                violations.append(_TPL_RETURN_CV_VIOL(return_cv))
             elif return_cv > 0.3:
-                warnings.append(f"Moderate return variability: CV = {return_cv:.2f}")
+                warnings.append(_TPL_RETURN_CV_WARN(return_cv))
         
         # Check Sharpe ratio consistency
-        sharpe_std = np.std(sharpe_ratios)
-        sharpe_mean = np.mean(sharpe_ratios)
         if sharpe_mean != 0:
-            sharpe_cv = sharpe_std / abs(sharpe_mean)
+            sharpe_cv = sharpe_std / fabs(sharpe_mean)
             if sharpe_cv > 0.5:
-                violations.append(f"High Sharpe ratio variability: CV = {sharpe_cv:.2f}")
+                violations.append(_TPL_SHARPE_CV_VIOL(sharpe_cv))
             elif sharpe_cv > 0.3:
-                warnings.append(f"Moderate Sharpe ratio variability: CV = {sharpe_cv:.2f}")
+                warnings.append(_TPL_SHARPE_CV_WARN(sharpe_cv))
         
         # Check for negative periods
-        negative_periods = sum(1 for r in returns if r < 0)
-        negative_pct = negative_periods / len(returns)
         if negative_pct > 0.5:
-            violations.append(f"Too many negative periods: {negative_pct:.2%}")
+            violations.append(_TPL_NEGATIVE_VIOL(negative_pct))
         elif negative_pct > 0.3:
-            warnings.append(f"Moderate negative periods: {negative_pct:.2%}")
-        
-        return violations, warnings
+            warnings.append(_TPL_NEGATIVE_WARN(negative_pct))
     
     def _validate_market_conditions(
         self,
         strategy_name: str,
-        market_conditions: Dict[str, Any]
-    ) -> Tuple[List[str], List[str]]:
-        """Validate market conditions."""
-        violations = []
-        warnings = []
-        
+        market_conditions: Dict[str, Any],
+        violations: List[str],
+        warnings: List[str]
+    ) -> None:
+        """Validate market conditions, appending to violations and warnings."""
         # Check market hours
-        current_hour = datetime.now().hour
-        if not (9 <= current_hour < 15):
+        if _current_hour() not in _MARKET_HOURS_SET:
             violations.append("Outside market hours")
         
         # Check volatility regime
         volatility = market_conditions.get('volatility', 0.0)
         if volatility > 0.4:
-            violations.append(f"High volatility regime: {volatility:.2%}")
+            violations.append(_TPL_VOL_REGIME_VIOL(volatility))
         elif volatility > 0.3:
-            warnings.append(f"Elevated volatility regime: {volatility:.2%}")
+            warnings.append(_TPL_VOL_REGIME_WARN(volatility))
         
         # Check market regime
         market_regime = market_conditions.get('market_regime', 'unknown')
@@ -291,112 +520,94 @@ class StrategyValidator:
             violations.append("Crisis market regime detected")
         
         # Check time to expiry for options strategies
-        if 'OPT' in strategy_name:
+        is_option = self._is_option_cache.get(strategy_name)
+        if is_option is None:
+            is_option = self._is_option_cache[strategy_name] = 'OPT' in strategy_name
+        if is_option:
             time_to_expiry = market_conditions.get('time_to_expiry', 30)
             if time_to_expiry < 7:
-                violations.append(f"Too close to expiry: {time_to_expiry} days")
+                violations.append(_TPL_EXPIRY_VIOL(time_to_expiry))
             elif time_to_expiry < 14:
-                warnings.append(f"Close to expiry: {time_to_expiry} days")
-        
-        return violations, warnings
+                warnings.append(_TPL_EXPIRY_WARN(time_to_expiry))
     
-    def _validate_greeks(self, backtest_results: Dict[str, Any]) -> Tuple[List[str], List[str]]:
-        """Validate Greeks exposure."""
-        violations = []
-        warnings = []
+    def _validate_greeks(
+        self,
+        backtest_results: Union[Dict[str, Any], BacktestMetrics],
+        violations: List[str],
+        warnings: List[str]
+    ) -> None:
+        """Validate Greeks exposure, appending to violations and warnings."""
+        get = backtest_results.get
         
         # Check delta exposure
-        delta_exposure = abs(backtest_results.get('delta_exposure', 0.0))
+        delta_exposure = fabs(get('delta_exposure', 0.0))
         if delta_exposure > self.max_delta_exposure:
-            violations.append(f"Delta exposure {delta_exposure:.0f} above maximum {self.max_delta_exposure}")
+            violations.append(_TPL_DELTA_VIOL(delta_exposure, self.max_delta_exposure))
         elif delta_exposure > self.max_delta_exposure * 0.9:
-            warnings.append(f"Delta exposure {delta_exposure:.0f} close to maximum {self.max_delta_exposure}")
+            warnings.append(_TPL_DELTA_WARN(delta_exposure, self.max_delta_exposure))
         
         # Check gamma exposure
-        gamma_exposure = abs(backtest_results.get('gamma_exposure', 0.0))
+        gamma_exposure = fabs(get('gamma_exposure', 0.0))
         if gamma_exposure > self.max_gamma_exposure:
-            violations.append(f"Gamma exposure {gamma_exposure:.0f} above maximum {self.max_gamma_exposure}")
+            violations.append(_TPL_GAMMA_VIOL(gamma_exposure, self.max_gamma_exposure))
         elif gamma_exposure > self.max_gamma_exposure * 0.9:
-            warnings.append(f"Gamma exposure {gamma_exposure:.0f} close to maximum {self.max_gamma_exposure}")
+            warnings.append(_TPL_GAMMA_WARN(gamma_exposure, self.max_gamma_exposure))
         
         # Check theta exposure
-        theta_exposure = abs(backtest_results.get('theta_exposure', 0.0))
+        theta_exposure = fabs(get('theta_exposure', 0.0))
         if theta_exposure > self.max_theta_exposure:
-            violations.append(f"Theta exposure {theta_exposure:.0f} above maximum {self.max_theta_exposure}")
+            violations.append(_TPL_THETA_VIOL(theta_exposure, self.max_theta_exposure))
         elif theta_exposure > self.max_theta_exposure * 0.9:
-            warnings.append(f"Theta exposure {theta_exposure:.0f} close to maximum {self.max_theta_exposure}")
+            warnings.append(_TPL_THETA_WARN(theta_exposure, self.max_theta_exposure))
         
         # Check vega exposure
-        vega_exposure = abs(backtest_results.get('vega_exposure', 0.0))
+        vega_exposure = fabs(get('vega_exposure', 0.0))
         if vega_exposure > self.max_vega_exposure:
-            violations.append(f"Vega exposure {vega_exposure:.0f} above maximum {self.max_vega_exposure}")
+            violations.append(_TPL_VEGA_VIOL(vega_exposure, self.max_vega_exposure))
         elif vega_exposure > self.max_vega_exposure * 0.9:
-            warnings.append(f"Vega exposure {vega_exposure:.0f} close to maximum {self.max_vega_exposure}")
-        
-        return violations, warnings
+            warnings.append(_TPL_VEGA_WARN(vega_exposure, self.max_vega_exposure))
     
-    def _validate_capacity(self, backtest_results: Dict[str, Any]) -> Tuple[List[str], List[str]]:
-        """Validate capacity limits."""
-        violations = []
-        warnings = []
+    def _validate_capacity(
+        self,
+        backtest_results: Union[Dict[str, Any], BacktestMetrics],
+        violations: List[str],
+        warnings: List[str]
+    ) -> None:
+        """Validate capacity limits, appending to violations and warnings."""
+        get = backtest_results.get
         
         # Check position size
-        position_size = backtest_results.get('max_position_size', 0.0)
+        position_size = get('max_position_size', 0.0)
         if position_size > self.max_position_size:
-            violations.append(f"Position size {position_size:.0f} above maximum {self.max_position_size}")
+            violations.append(_TPL_POSITION_VIOL(position_size, self.max_position_size))
         elif position_size > self.max_position_size * 0.9:
-            warnings.append(f"Position size {position_size:.0f} close to maximum {self.max_position_size}")
+            warnings.append(_TPL_POSITION_WARN(position_size, self.max_position_size))
         
         # Check portfolio value
-        portfolio_value = backtest_results.get('max_portfolio_value', 0.0)
+        portfolio_value = get('max_portfolio_value', 0.0)
         if portfolio_value > self.max_portfolio_value:
-            violations.append(f"Portfolio value {portfolio_value:.0f} above maximum {self.max_portfolio_value}")
+            violations.append(_TPL_PORTFOLIO_VIOL(portfolio_value, self.max_portfolio_value))
         elif portfolio_value > self.max_portfolio_value * 0.9:
-            warnings.append(f"Portfolio value {portfolio_value:.0f} close to maximum {self.max_portfolio_value}")
+            warnings.append(_TPL_PORTFOLIO_WARN(portfolio_value, self.max_portfolio_value))
         
         # Check margin usage
-        margin_usage = backtest_results.get('margin_usage', 0.0)
+        margin_usage = get('margin_usage', 0.0)
         if margin_usage > self.max_margin_usage:
-            violations.append(f"Margin usage {margin_usage:.2%} above maximum {self.max_margin_usage:.2%}")
+            violations.append(_TPL_MARGIN_VIOL(margin_usage, self.max_margin_usage))
         elif margin_usage > self.max_margin_usage * 0.9:
-            warnings.append(f"Margin usage {margin_usage:.2%} close to maximum {self.max_margin_usage:.2%}")
-        
-        return violations, warnings
+            warnings.append(_TPL_MARGIN_WARN(margin_usage, self.max_margin_usage))
     
     def _calculate_validation_score(
         self,
-        backtest_results: Dict[str, Any],
+        backtest_results: Union[Dict[str, Any], BacktestMetrics],
         walk_forward_results: List[Dict[str, Any]]
     ) -> float:
         """Calculate validation score."""
         try:
-            score = 1.0
-            
-            # Penalize for violations
-            annual_return = backtest_results.get('annualized_return', 0.0)
-            if annual_return < self.min_annual_return:
-                score -= 0.3
-            
-            volatility = backtest_results.get('volatility', 0.0)
-            if volatility > self.max_volatility:
-                score -= 0.2
-            
-            max_drawdown = abs(backtest_results.get('max_drawdown', 0.0))
-            if max_drawdown > self.max_drawdown:
-                score -= 0.2
-            
-            sharpe_ratio = backtest_results.get('sharpe_ratio', 0.0)
-            if sharpe_ratio < self.min_sharpe_ratio:
-                score -= 0.1
-            
-            profit_factor = backtest_results.get('profit_factor', 0.0)
-            if profit_factor < self.min_profit_factor:
-                score -= 0.1
-            
-            win_rate = backtest_results.get('win_rate', 0.0)
-            if win_rate < self.min_win_rate:
-                score -= 0.1
-            
+            # Penalize for violations: penalties dotted with the violation mask
+            _, signed = self._signed_backtest_values(backtest_results)
+            score = 1.0 - float(self._bt_penalties @ ~(signed >= self._bt_floors))
+
             return max(0.0, min(1.0, score))
             
         except Exception as e:
@@ -3,105 +3,193 @@ Live dashboard server for the Liquid F&O Trading System.
 """
 
 import asyncio
-import json
+import gzip
+import hashlib
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 import logging
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import msgpack
+import orjson
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 import uvicorn
 
 from ..config import config
 from ..utils.timezone import ISTTimezone
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the dashboard update and broadcast loop while the server is up."""
+    update_task = asyncio.create_task(update_dashboard_data())
+    yield
+    update_task.cancel()
+
 # Initialize FastAPI app
-app = FastAPI(title="Liquid F&O Trading Dashboard", version="1.0.0")
+app = FastAPI(
+    title="Liquid F&O Trading Dashboard",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# WebSocket wire formats: JSON by default, MessagePack when the client
+# asks for it with ?format=msgpack or the "msgpack" subprotocol
+def encode_json(data: Any) -> bytes:
+    return orjson.dumps(data, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _msgpack_default(obj: Any) -> Any:
+    return asdict(obj) if is_dataclass(obj) else str(obj)
+
+def encode_msgpack(data: Any) -> bytes:
+    return msgpack.packb(data, use_bin_type=True, default=_msgpack_default)
+
+ENCODERS = {"json": encode_json, "msgpack": encode_msgpack}
+
+def json_response(data: Any) -> Response:
+    """Pre-serialized JSON response, skipping FastAPI's jsonable_encoder."""
+    return Response(content=encode_json(data), media_type="application/json")
+
+def negotiate_wire_format(websocket: WebSocket) -> str:
+    """Pick the wire format a connecting client asked for."""
+    if websocket.query_params.get("format") == "msgpack" or "msgpack" in websocket.scope.get("subprotocols", ()):
+        return "msgpack"
+    return "json"
 
-# WebSocket connection manager
+# Frames buffered per client before older snapshots are dropped
+CLIENT_QUEUE_SIZE = 8
+
+# WebSocket connection manager. Each client has a bounded outbound queue
+# drained by its own writer task, so a slow client never delays the rest
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self.wire_formats: Dict[WebSocket, str] = {}
+        self.writers: Dict[WebSocket, asyncio.Task] = {}
         self.logger = logging.getLogger(__name__)
     
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+    async def connect(self, websocket: WebSocket, wire_format: str = "json"):
+        # Echo the subprotocol only if the client offered it; a client that
+        # asked via ?format=msgpack would fail a handshake naming one
+        if "msgpack" in websocket.scope.get("subprotocols", ()):
+            await websocket.accept(subprotocol="msgpack")
+        else:
+            await websocket.accept()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self.wire_formats[websocket] = wire_format
+        self.writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
         self.logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
     
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
+        self.wire_formats.pop(websocket, None)
+        writer = self.writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         self.logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
     
-    async def send_personal_message(self, message: str, websocket: WebSocket):
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        while True:
+            message = await queue.get()
+            try:
+                await websocket.send_bytes(message)
+            except Exception as e:
+                self.logger.error(f"Failed to send message: {e}")
+                self.disconnect(websocket)
+                return
+    
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue, message: bytes):
+        # Frames are full snapshots, so a backed-up client only needs the latest
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(message)
+    
+    async def send_personal_message(self, message: bytes, websocket: WebSocket):
+        queue = self.active_connections.get(websocket)
+        if queue is not None:
+            self._enqueue(queue, message)
+            return
         try:
-            await websocket.send_text(message)
+            await websocket.send_bytes(message)
         except Exception as e:
             self.logger.error(f"Failed to send message: {e}")
     
-    async def broadcast(self, message: str):
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                self.logger.error(f"Failed to broadcast message: {e}")
-                disconnected.append(connection)
+    async def broadcast(self, data: Any):
+        # Encode once per wire format in use, not once per client; the
+        # writers do the sending, so this never waits on a socket
+        payloads: Dict[str, bytes] = {}
+        for wire_format in set(self.wire_formats.values()):
+            payloads[wire_format] = ENCODERS[wire_format](data)
         
-        # Remove disconnected connections
-        for connection in disconnected:
-            self.disconnect(connection)
+        for connection, queue in self.active_connections.items():
+            self._enqueue(queue, payloads[self.wire_formats.get(connection, "json")])
 
 manager = ConnectionManager()
 
-# Dashboard data
-dashboard_data = {
-    "system_status": {
-        "timestamp": ISTTimezone.now().isoformat(),
-        "market_status": "Open" if ISTTimezone.is_market_hours() else "Closed",
-        "live_trading": config.is_live_trading_enabled,
-        "options_enabled": config.is_options_enabled
-    },
-    "portfolio": {
-        "total_pnl": 0.0,
-        "daily_pnl": 0.0,
-        "max_drawdown": 0.0,
-        "total_trades": 0,
-        "win_rate": 0.0
-    },
-    "positions": [],
-    "orders": [],
-    "risk_metrics": {
-        "portfolio_delta": 0.0,
-        "portfolio_gamma": 0.0,
-        "portfolio_theta": 0.0,
-        "portfolio_vega": 0.0,
-        "margin_used": 0.0,
-        "margin_available": 1000000.0
-    },
-    "strategies": [
-        {
-            "name": "Donchian Breakout",
-            "status": "Active",
-            "pnl": 0.0,
-            "trades": 0,
-            "win_rate": 0.0
-        },
-        {
-            "name": "Iron Butterfly",
-            "status": "Active",
-            "pnl": 0.0,
-            "trades": 0,
-            "win_rate": 0.0
-        }
+# Dashboard data, as slotted dataclasses that orjson encodes field by field
+@dataclass(slots=True)
+class SystemStatus:
+    timestamp: str
+    market_status: str
+    live_trading: bool
+    options_enabled: bool
+
+@dataclass(slots=True)
+class Portfolio:
+    total_pnl: float = 0.0
+    daily_pnl: float = 0.0
+    max_drawdown: float = 0.0
+    total_trades: int = 0
+    win_rate: float = 0.0
+
+@dataclass(slots=True)
+class RiskMetrics:
+    portfolio_delta: float = 0.0
+    portfolio_gamma: float = 0.0
+    portfolio_theta: float = 0.0
+    portfolio_vega: float = 0.0
+    margin_used: float = 0.0
+    margin_available: float = 1000000.0
+
+@dataclass(slots=True)
+class StrategyStatus:
+    name: str
+    status: str = "Active"
+    pnl: float = 0.0
+    trades: int = 0
+    win_rate: float = 0.0
+
+@dataclass(slots=True)
+class Dashboard:
+    system_status: SystemStatus
+    portfolio: Portfolio = field(default_factory=Portfolio)
+    positions: List[Dict[str, Any]] = field(default_factory=list)
+    orders: List[Dict[str, Any]] = field(default_factory=list)
+    risk_metrics: RiskMetrics = field(default_factory=RiskMetrics)
+    strategies: List[StrategyStatus] = field(default_factory=list)
+
+dashboard_data = Dashboard(
+    system_status=SystemStatus(
+        timestamp=ISTTimezone.now().isoformat(),
+        market_status="Open" if ISTTimezone.is_market_hours() else "Closed",
+        live_trading=config.is_live_trading_enabled,
+        options_enabled=config.is_options_enabled
+    ),
+    strategies=[
+        StrategyStatus(name="Donchian Breakout"),
+        StrategyStatus(name="Iron Butterfly")
     ]
-}
+)
 
-@app.get("/")
-async def get_dashboard():
-    """Serve the main dashboard page."""
-    html_content = """
+# Dashboard page, encoded, gzip-compressed and fingerprinted once at import
+DASHBOARD_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -243,9 +331,11 @@ async def get_dashboard():
         
         <script>
             const ws = new WebSocket("ws://localhost:8787/ws");
+            ws.binaryType = 'arraybuffer';
+            const decoder = new TextDecoder();
             
             ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
+                const data = JSON.parse(decoder.decode(event.data));
                 updateDashboard(data);
             };
             
@@ -286,68 +376,91 @@ async def get_dashboard():
         </script>
     </body>
     </html>
-    """
-    return HTMLResponse(content=html_content)
+"""
+_DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_HTML_GZIP = gzip.compress(_DASHBOARD_HTML_BYTES, 9)
+# Weak ETag: the plain and gzip bodies are the same page
+_DASHBOARD_ETAG = 'W/"' + hashlib.sha1(_DASHBOARD_HTML_BYTES).hexdigest() + '"'
+_DASHBOARD_CACHE_HEADERS = {"ETag": _DASHBOARD_ETAG, "Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+# The page never changes, so the responses are built once and reused;
+# nothing per-request (cookies, background tasks) is attached to them
+_DASHBOARD_RESPONSE = HTMLResponse(content=_DASHBOARD_HTML_BYTES, headers=_DASHBOARD_CACHE_HEADERS)
+_DASHBOARD_RESPONSE_GZIP = HTMLResponse(
+    content=_DASHBOARD_HTML_GZIP,
+    headers={**_DASHBOARD_CACHE_HEADERS, "Content-Encoding": "gzip"}
+)
+_DASHBOARD_NOT_MODIFIED = Response(status_code=304, headers=_DASHBOARD_CACHE_HEADERS)
+
+@app.get("/")
+async def get_dashboard(request: Request):
+    """Serve the main dashboard page."""
+    if _DASHBOARD_ETAG in request.headers.get("if-none-match", ""):
+        return _DASHBOARD_NOT_MODIFIED
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return _DASHBOARD_RESPONSE_GZIP
+    return _DASHBOARD_RESPONSE
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates."""
-    await manager.connect(websocket)
+    wire_format = negotiate_wire_format(websocket)
+    await manager.connect(websocket, wire_format)
     try:
+        # Send the current snapshot; later updates arrive via the shared
+        # broadcast in update_dashboard_data, serialized once per tick
+        await manager.send_personal_message(ENCODERS[wire_format](dashboard_data), websocket)
+        # Client frames, text or binary (msgpack clients), are ignored
         while True:
-            # Send current dashboard data
-            await manager.send_personal_message(
-                json.dumps(dashboard_data, default=str), 
-                websocket
-            )
-            await asyncio.sleep(5)  # Update every 5 seconds
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
 @app.get("/api/status")
 async def get_status():
     """Get current system status."""
-    return dashboard_data
+    return json_response(dashboard_data)
 
 @app.get("/api/portfolio")
 async def get_portfolio():
     """Get portfolio data."""
-    return dashboard_data["portfolio"]
+    return json_response(dashboard_data.portfolio)
 
 @app.get("/api/positions")
 async def get_positions():
     """Get current positions."""
-    return dashboard_data["positions"]
+    return json_response(dashboard_data.positions)
 
 @app.get("/api/orders")
 async def get_orders():
     """Get current orders."""
-    return dashboard_data["orders"]
+    return json_response(dashboard_data.orders)
 
 @app.get("/api/risk")
 async def get_risk_metrics():
     """Get risk metrics."""
-    return dashboard_data["risk_metrics"]
+    return json_response(dashboard_data.risk_metrics)
 
 @app.get("/api/strategies")
 async def get_strategies():
     """Get strategy status."""
-    return dashboard_data["strategies"]
+    return json_response(dashboard_data.strategies)
 
 async def update_dashboard_data():
     """Update dashboard data periodically."""
     while True:
         try:
             # Update timestamp
-            dashboard_data["system_status"]["timestamp"] = ISTTimezone.now().isoformat()
-            dashboard_data["system_status"]["market_status"] = "Open" if ISTTimezone.is_market_hours() else "Closed"
+            dashboard_data.system_status.timestamp = ISTTimezone.now().isoformat()
+            dashboard_data.system_status.market_status = "Open" if ISTTimezone.is_market_hours() else "Closed"
             
             # Simulate some data updates
-            dashboard_data["portfolio"]["total_pnl"] += 100.0  # Simulate P&L change
-            dashboard_data["portfolio"]["daily_pnl"] += 50.0
+            dashboard_data.portfolio.total_pnl += 100.0  # Simulate P&L change
+            dashboard_data.portfolio.daily_pnl += 50.0
             
             # Broadcast update to all connected clients
-            await manager.broadcast(json.dumps(dashboard_data, default=str))
+            await manager.broadcast(dashboard_data)
             
             await asyncio.sleep(10)  # Update every 10 seconds
             
@@ -363,10 +476,7 @@ def start_dashboard_server(host: str = "localhost", port: int = 8787):
     logger.info(f"Starting dashboard server on {host}:{port}")
     logger.info(f"Dashboard available at: http://{host}:{port}")
     
-    # Start the update task
-    asyncio.create_task(update_dashboard_data())
-    
-    # Run the server
+    # Run the server; the lifespan handler starts the update task
     uvicorn.run(app, host=host, port=port, log_level="info")
 
 if __name__ == "__main__":
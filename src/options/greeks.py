@@ -2,14 +2,88 @@
 Greeks calculations for the Liquid F&O Trading System.
 """
 
+import math
+from functools import lru_cache
 import numpy as np
-from typing import Dict, Tuple, Optional
+from scipy.special import ndtr
+from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime, date
 import logging
 
 from ..utils.timezone import ISTTimezone
 
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+_INV_SQRT_2 = 1.0 / math.sqrt(2)
+
+
+@lru_cache(maxsize=4096)
+def _greeks_scalar(spot_price: float, strike_price: float, time_to_expiry: float,
+                   risk_free_rate: float, volatility: float,
+                   is_call: bool) -> Tuple[float, float, float, float, float]:
+    """
+    (delta, gamma, theta, vega, rho) for one option with positive spot,
+    strike, expiry and volatility, using math-module calls on plain floats
+    rather than NumPy scalar ufuncs. N(x) is 0.5 * erfc(-x / sqrt(2)).
+    
+    Memoized on inputs rounded by _greeks_key, so the exposure helpers and
+    risk-array scenarios that re-query the same contract within a tick get
+    a cache hit.
+    """
+    sqrt_t = math.sqrt(time_to_expiry)
+    vol_sqrt_t = volatility * sqrt_t
+    d1 = (math.log(spot_price / strike_price) +
+          (risk_free_rate + 0.5 * volatility * volatility) * time_to_expiry) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    
+    disc = math.exp(-risk_free_rate * time_to_expiry)
+    pdf_d1 = math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    # N(d) for calls, N(-d) for puts, with the matching sign
+    sign = 1.0 if is_call else -1.0
+    cdf_d1 = 0.5 * math.erfc(-sign * d1 * _INV_SQRT_2)
+    cdf_d2 = 0.5 * math.erfc(-sign * d2 * _INV_SQRT_2)
+    
+    delta = sign * disc * cdf_d1
+    gamma = disc * pdf_d1 / (spot_price * vol_sqrt_t)
+    theta = (-spot_price * pdf_d1 * volatility / (2 * sqrt_t) -
+             sign * risk_free_rate * strike_price * disc * cdf_d2) / 365  # Per day
+    vega = spot_price * disc * pdf_d1 * sqrt_t / 100  # Per 1% vol change
+    rho = sign * strike_price * time_to_expiry * disc * cdf_d2 / 100  # Per 1% rate change
+    return delta, gamma, theta, vega, rho
+
+
+def _greeks_key(spot_price: float, strike_price: float, time_to_expiry: float,
+                risk_free_rate: float, volatility: float,
+                option_type: str) -> Tuple[float, float, float, float, float, bool]:
+    """
+    _greeks_scalar arguments rounded to the cached precision: prices to
+    0.01, expiry to 1e-6 years (~30s), rate to 0.1bp, volatility to 0.01%.
+    """
+    return (round(spot_price, 2), round(strike_price, 2), round(time_to_expiry, 6),
+            round(risk_free_rate, 5), round(volatility, 4), option_type.upper() == 'CALL')
+
+
+def _d1_d2(spot_price: float, strike_price: float, time_to_expiry: float,
+           risk_free_rate: float, volatility: float) -> Tuple[float, float]:
+    """Black-Scholes d1 and d2."""
+    if time_to_expiry <= 0:
+        return 0, 0
+    
+    vol_sqrt_t = volatility * np.sqrt(time_to_expiry)
+    d1 = (np.log(spot_price / strike_price) + 
+          (risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / vol_sqrt_t
+    
+    return d1, d1 - vol_sqrt_t
+
+
+# d1 and d2 memoized for the probability helpers
+_d1_d2_cached = lru_cache(maxsize=4096)(_d1_d2)
+
+
+def _any_array(*values: object) -> bool:
+    """Whether any argument is an ndarray (unhashable, so not cacheable)."""
+    return any(isinstance(value, np.ndarray) for value in values)
+
 
 @dataclass
 class Greeks:
@@ -21,12 +95,94 @@ class Greeks:
     rho: float
 
 
+class PositionBook:
+    """
+    Option positions stored column-wise: one array per Greek plus quantity,
+    side sign (+1 BUY, -1 SELL) and an index into a per-underlying spot
+    table, so portfolio aggregation is a dot product instead of a loop
+    over position objects.
+    """
+    
+    GREEK_NAMES = ('delta', 'gamma', 'theta', 'vega', 'rho')
+    
+    def __init__(self, delta: np.ndarray, gamma: np.ndarray, theta: np.ndarray,
+                 vega: np.ndarray, rho: np.ndarray, qty: np.ndarray,
+                 side_sign: np.ndarray, underlying_idx: np.ndarray,
+                 underlyings: List[str]):
+        self.delta = delta
+        self.gamma = gamma
+        self.theta = theta
+        self.vega = vega
+        self.rho = rho
+        self.qty = qty
+        self.side_sign = side_sign
+        # -1 marks positions with no underlying
+        self.underlying_idx = underlying_idx
+        self.underlyings = underlyings
+        self.spot = np.zeros(len(qty))
+    
+    @classmethod
+    def from_positions(cls, positions: list,
+                       spot_prices: Optional[Dict[str, float]] = None) -> 'PositionBook':
+        """Build a book from position objects, skipping those without Greeks."""
+        positions = [p for p in positions if getattr(p, 'greeks', None)]
+        underlyings: Dict[str, int] = {}
+        underlying_idx = [
+            underlyings.setdefault(p.underlying, len(underlyings))
+            if hasattr(p, 'underlying') else -1
+            for p in positions
+        ]
+        
+        book = cls(
+            *(np.fromiter((getattr(p.greeks, name) for p in positions),
+                          dtype=np.float64, count=len(positions))
+              for name in cls.GREEK_NAMES),
+            qty=np.fromiter((p.quantity for p in positions),
+                            dtype=np.float64, count=len(positions)),
+            side_sign=np.fromiter((1.0 if p.side == 'BUY' else -1.0 for p in positions),
+                                  dtype=np.float64, count=len(positions)),
+            underlying_idx=np.array(underlying_idx, dtype=np.intp),
+            underlyings=list(underlyings),
+        )
+        if spot_prices is not None:
+            book.set_spot_prices(spot_prices)
+        return book
+    
+    def set_spot_prices(self, spot_prices: Dict[str, float]) -> None:
+        """Mirror the spot table into the per-position spot column."""
+        # Unpriced underlyings (and the -1 slot) get 0 and drop out of dollar delta
+        table = np.array([spot_prices.get(u, 0.0) for u in self.underlyings] + [0.0],
+                         dtype=np.float64)
+        self.spot = table[self.underlying_idx]
+    
+    @property
+    def multipliers(self) -> np.ndarray:
+        """Signed position size."""
+        return self.qty * self.side_sign
+    
+    def portfolio_greeks(self) -> Dict[str, float]:
+        """Position-weighted sum of each Greek."""
+        multipliers = self.multipliers
+        return {name: float(np.dot(getattr(self, name), multipliers))
+                for name in self.GREEK_NAMES}
+    
+    def dollar_delta(self) -> float:
+        """Sum of delta * signed size * spot."""
+        return float((self.delta * self.multipliers * self.spot).sum())
+
+
 class GreeksCalculator:
     """Black-Scholes Greeks calculator."""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop memoized scalar Greeks and d1/d2, e.g. at a tick or session boundary."""
+        _greeks_scalar.cache_clear()
+        _d1_d2_cached.cache_clear()
+    
     def calculate_greeks(self, spot_price: float, strike_price: float, 
                        time_to_expiry: float, risk_free_rate: float, 
                        volatility: float, option_type: str) -> Greeks:
@@ -42,7 +198,20 @@ class GreeksCalculator:
             option_type: 'CALL' or 'PUT'
         """
         try:
-            # Calculate d1 and d2
+            if _any_array(spot_price, strike_price, time_to_expiry, risk_free_rate, volatility):
+                # Elementwise over arrays: the vectorized path, not the cache
+                return Greeks(**self.calculate_greeks_batch(
+                    spot_price, strike_price, time_to_expiry,
+                    risk_free_rate, volatility, option_type.upper() == 'CALL'
+                ))
+            
+            key = _greeks_key(spot_price, strike_price, time_to_expiry,
+                              risk_free_rate, volatility, option_type)
+            if key[0] > 0 and key[1] > 0 and key[2] > 0 and key[4] > 0:
+                return Greeks(*_greeks_scalar(*key))
+            
+            # Degenerate inputs (expired, zero vol) keep the NumPy path's
+            # limit and inf/nan values
             d1, d2 = self._calculate_d1_d2(
                 spot_price, strike_price, time_to_expiry, 
                 risk_free_rate, volatility
@@ -81,20 +250,78 @@ class GreeksCalculator:
             self.logger.error(f"Failed to calculate Greeks: {e}")
             return Greeks(0, 0, 0, 0, 0)
     
+    def calculate_greeks_batch(self, spot_price: np.ndarray, strike_price: np.ndarray,
+                               time_to_expiry: np.ndarray, risk_free_rate: np.ndarray,
+                               volatility: np.ndarray, is_call: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate all Greeks for many options at once.
+        
+        Same formulas as calculate_greeks, evaluated over arrays that
+        broadcast against each other, with d1, d2, sqrt(T) and the
+        discount factor computed once per option.
+        
+        Args:
+            spot_price: Current spot prices
+            strike_price: Option strike prices
+            time_to_expiry: Times to expiry in years
+            risk_free_rate: Risk-free interest rates
+            volatility: Implied volatilities
+            is_call: True for calls, False for puts
+        
+        Returns:
+            Dict of 'delta', 'gamma', 'theta', 'vega' and 'rho' arrays
+        """
+        spot_price = np.asarray(spot_price, dtype=np.float64)
+        strike_price = np.asarray(strike_price, dtype=np.float64)
+        time_to_expiry = np.asarray(time_to_expiry, dtype=np.float64)
+        risk_free_rate = np.asarray(risk_free_rate, dtype=np.float64)
+        volatility = np.asarray(volatility, dtype=np.float64)
+        is_call = np.asarray(is_call, dtype=bool)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            live = time_to_expiry > 0
+            sqrt_t = np.sqrt(time_to_expiry)
+            vol_sqrt_t = volatility * sqrt_t
+            d1 = np.where(
+                live,
+                (np.log(spot_price / strike_price) +
+                 (risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / vol_sqrt_t,
+                0.0
+            )
+            d2 = np.where(live, d1 - vol_sqrt_t, 0.0)
+            
+            disc = np.exp(-risk_free_rate * time_to_expiry)
+            pdf_d1 = self._normal_pdf(d1)
+            # N(d) for calls, N(-d) for puts, with the matching sign
+            sign = np.where(is_call, 1.0, -1.0)
+            cdf_d1 = self._normal_cdf(sign * d1)
+            cdf_d2 = self._normal_cdf(sign * d2)
+            
+            delta = sign * disc * cdf_d1
+            gamma = disc * pdf_d1 / (spot_price * vol_sqrt_t)
+            term1 = -spot_price * pdf_d1 * volatility / (2 * sqrt_t)
+            term2 = -sign * risk_free_rate * strike_price * disc * cdf_d2
+            theta = np.where(live, (term1 + term2) / 365, 0.0)  # Per day
+            vega = spot_price * disc * pdf_d1 * sqrt_t / 100  # Per 1% vol change
+            rho = sign * strike_price * time_to_expiry * disc * cdf_d2 / 100  # Per 1% rate change
+        
+        return {
+            'delta': delta,
+            'gamma': gamma,
+            'theta': theta,
+            'vega': vega,
+            'rho': rho
+        }
+    
     def _calculate_d1_d2(self, spot_price: float, strike_price: float, 
                         time_to_expiry: float, risk_free_rate: float, 
                         volatility: float) -> Tuple[float, float]:
         """Calculate d1 and d2 for Black-Scholes formula."""
-        if time_to_expiry <= 0:
-            return 0, 0
-        
-        d1 = (np.log(spot_price / strike_price) + 
-              (risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / \
-             (volatility * np.sqrt(time_to_expiry))
-        
-        d2 = d1 - volatility * np.sqrt(time_to_expiry)
-        
-        return d1, d2
+        if _any_array(spot_price, strike_price, time_to_expiry, risk_free_rate, volatility):
+            return _d1_d2(spot_price, strike_price, time_to_expiry, 
+                          risk_free_rate, volatility)
+        return _d1_d2_cached(spot_price, strike_price, time_to_expiry, 
+                             risk_free_rate, volatility)
     
     def _calculate_delta(self, spot_price: float, strike_price: float, 
                         time_to_expiry: float, risk_free_rate: float, 
@@ -152,41 +379,19 @@ class GreeksCalculator:
     
     def _normal_cdf(self, x: float) -> float:
         """Cumulative distribution function of standard normal distribution."""
-        return 0.5 * (1 + np.sign(x) * np.sqrt(1 - np.exp(-2 * x**2 / np.pi)))
+        return ndtr(x)
     
     def _normal_pdf(self, x: float) -> float:
         """Probability density function of standard normal distribution."""
-        return np.exp(-0.5 * x**2) / np.sqrt(2 * np.pi)
+        return np.exp(-0.5 * x**2) * _INV_SQRT_2PI
     
-    def calculate_portfolio_greeks(self, positions: list) -> Dict[str, float]:
+    def calculate_portfolio_greeks(self, positions: Union[list, PositionBook]) -> Dict[str, float]:
         """Calculate portfolio-level Greeks."""
-        total_delta = 0
-        total_gamma = 0
-        total_theta = 0
-        total_vega = 0
-        total_rho = 0
-        
-        for position in positions:
-            if not hasattr(position, 'greeks') or not position.greeks:
-                continue
-            
-            # Multiply by position size and direction
-            multiplier = position.quantity * (1 if position.side == 'BUY' else -1)
-            
-            total_delta += position.greeks.delta * multiplier
-            total_gamma += position.greeks.gamma * multiplier
-            total_theta += position.greeks.theta * multiplier
-            total_vega += position.greeks.vega * multiplier
-            total_rho += position.greeks.rho * multiplier
+        if not isinstance(positions, PositionBook):
+            positions = PositionBook.from_positions(positions)
         
-        return {
-            'delta': total_delta,
-            'gamma': total_gamma,
-            'theta': total_theta,
-            'vega': total_vega,
-            'rho': total_rho
-        }
-    
+        return positions.portfolio_greeks()
+
     def calculate_delta_hedge_ratio(self, spot_price: float, strike_price: float, 
                                    time_to_expiry: float, risk_free_rate: float, 
                                    volatility: float, option_type: str) -> float:
@@ -266,10 +471,16 @@ class GreeksCalculator:
                                 time_to_expiry: float, risk_free_rate: float, 
                                 volatility: float, option_type: str) -> float:
         """Calculate probability of finishing out of the money."""
-        return 1 - self.calculate_probability_itm(
+        _, d2 = self._calculate_d1_d2(
             spot_price, strike_price, time_to_expiry, 
-            risk_free_rate, volatility, option_type
+            risk_free_rate, volatility
         )
+        
+        # 1 - N(d2) == N(-d2) for calls, without the cancellation in the tails
+        if option_type.upper() == 'CALL':
+            return self._normal_cdf(-d2)
+        else:  # PUT
+            return self._normal_cdf(d2)
     
     def calculate_expected_value(self, spot_price: float, strike_price: float, 
                                time_to_expiry: float, risk_free_rate: float, 
@@ -278,22 +489,27 @@ class GreeksCalculator:
         # This is a simplified calculation
         # In practice, you'd use Monte Carlo or other methods
         
-        prob_itm = self.calculate_probability_itm(
+        _, d2 = self._calculate_d1_d2(
             spot_price, strike_price, time_to_expiry, 
-            risk_free_rate, volatility, option_type
+            risk_free_rate, volatility
         )
         
         if option_type.upper() == 'CALL':
-            expected_payoff = max(0, spot_price - strike_price) * prob_itm
+            expected_payoff = max(0, spot_price - strike_price) * self._normal_cdf(d2)
         else:  # PUT
-            expected_payoff = max(0, strike_price - spot_price) * prob_itm
+            expected_payoff = max(0, strike_price - spot_price) * self._normal_cdf(-d2)
         
-        return expected_payoff * np.exp(-risk_free_rate * time_to_expiry)
+        return expected_payoff * math.exp(-risk_free_rate * time_to_expiry)
     
-    def calculate_risk_metrics(self, positions: list, 
+    def calculate_risk_metrics(self, positions: Union[list, PositionBook], 
                              spot_prices: Dict[str, float]) -> Dict[str, float]:
         """Calculate portfolio risk metrics."""
-        portfolio_greeks = self.calculate_portfolio_greeks(positions)
+        if isinstance(positions, PositionBook):
+            positions.set_spot_prices(spot_prices)
+            book = positions
+        else:
+            book = PositionBook.from_positions(positions, spot_prices)
+        portfolio_greeks = book.portfolio_greeks()
         
         # Calculate risk metrics
         risk_metrics = {
@@ -304,15 +520,6 @@ class GreeksCalculator:
             'rho_exposure': portfolio_greeks['rho']
         }
         
-        # Calculate dollar delta
-        total_dollar_delta = 0
-        for position in positions:
-            if hasattr(position, 'underlying') and position.underlying in spot_prices:
-                spot_price = spot_prices[position.underlying]
-                if hasattr(position, 'greeks') and position.greeks:
-                    dollar_delta = position.greeks.delta * position.quantity * spot_price
-                    total_dollar_delta += dollar_delta * (1 if position.side == 'BUY' else -1)
-        
-        risk_metrics['dollar_delta'] = total_dollar_delta
+        risk_metrics['dollar_delta'] = book.dollar_delta()
         
         return risk_metrics
@@ -97,6 +97,10 @@ class RiskManager:
         """
         violations = []
         
+        # Limits are checked once per tick; Greeks memoized at earlier
+        # prices will not be asked for again
+        self.greeks_calc.clear_cache()
+        
         # Calculate current risk metrics
         risk_metrics = self._calculate_risk_metrics(positions, cash, margin_used, market_data)
         
@@ -0,0 +1,234 @@
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import src
+
+
+def _stub_module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+# The engine imports modules that cannot load in every checkout: the global
+# config validates the local .env at import time, src.risk re-exports names
+# its modules do not define, and src.strategies.base may be absent. Stand in
+# for whichever of them fails; the engine only needs their names
+try:
+    import src.config  # noqa: F401
+except Exception:
+    _stub_module("src.config", Config=type("Config", (), {}))
+try:
+    import src.risk  # noqa: F401
+except ImportError:
+    _stub_module("src.risk", __path__=[os.path.join(os.path.dirname(src.__file__), "risk")])
+try:
+    import src.strategies.base  # noqa: F401
+except ImportError:
+    _stub_module("src.strategies.base", BaseStrategy=type("BaseStrategy", (), {}))
+
+from src.engine.engine_paper import (  # noqa: E402
+    DEFAULT_QUOTE_IDLE_TIMEOUT, EQUITY_CHUNK_SIZE, INITIAL_FILL_CAPACITY, INITIAL_SYMBOL_CAPACITY,
+    SIDE_BUY, SIDE_SELL, PaperTradingEngine, _apply_trade, _performance_kernel
+)
+
+
+@pytest.fixture
+def config():
+    return SimpleNamespace(
+        initial_capital=1_000_000.0, slippage_bps=5, options_commission=20.0,
+        equity_commission=0.03, fill_spill_dir=None,
+        max_position_size=100_000, max_portfolio_value=10_000_000, max_daily_loss=0.05,
+        max_drawdown=0.1, max_delta_exposure=500, max_gamma_exposure=100,
+        max_theta_exposure=1000, max_vega_exposure=1000, max_margin_usage=0.8,
+        max_concurrent_positions=100, max_sector_exposure=0.5, max_underlying_exposure=0.5
+    )
+
+
+@pytest.fixture
+def engine(config, tmp_path, monkeypatch):
+    # State files are relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data")
+    return PaperTradingEngine(config)
+
+
+class TestQuoteFeed:
+    def test_broker_price_updates_reach_subscribers(self, engine):
+        broker = engine.broker
+        queue = broker.subscribe_quotes_batch(["NIFTY", "NEW"])
+        broker.update_price("NIFTY", 101.0)
+        broker.update_price("UNSUBSCRIBED", 5.0)
+        # A mock price generated on first lookup is published as well
+        price = broker.get_quotes(["NEW"])["NEW"]["close"]
+        received = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [(symbol, quote["close"]) for symbol, quote in received] == [
+            ("NIFTY", 101.0), ("NEW", price)
+        ]
+        assert broker.market_data["UNSUBSCRIBED"] == 5.0
+
+    def test_pushed_quotes_are_coalesced(self, engine):
+        queue = engine._subscribe_to_market_data(["NIFTY", "BANKNIFTY"])
+        for symbol, price in (("NIFTY", 100.0), ("BANKNIFTY", 200.0), ("NIFTY", 101.0)):
+            engine.broker.update_price(symbol, price)
+        ticks = asyncio.run(engine._next_ticks(queue))
+        assert {symbol: quote["close"] for symbol, quote in ticks.items()} == {
+            "NIFTY": 101.0, "BANKNIFTY": 200.0
+        }
+
+    def test_idle_feed_polls_after_timeout(self, config, engine):
+        assert engine._quote_idle_timeout == DEFAULT_QUOTE_IDLE_TIMEOUT == 1.0
+        config.quote_idle_timeout = 0.05
+        engine = PaperTradingEngine(config)
+        queue = engine._subscribe_to_market_data(["NIFTY"])
+        start = time.monotonic()
+        ticks = asyncio.run(engine._next_ticks(queue))
+        assert time.monotonic() - start >= 0.05
+        assert list(ticks) == ["NIFTY"]
+
+    def test_unchanged_quotes_skip_the_pass(self, engine, monkeypatch):
+        passes = []
+        update_positions = engine._update_positions
+
+        def counting_update(market_data):
+            passes.append(market_data["NIFTY"]["close"])
+            update_positions(market_data)
+
+        monkeypatch.setattr(engine, "_update_positions", counting_update)
+        engine._quote_idle_timeout = 60.0
+        strategy = SimpleNamespace(generate_signals=lambda now, market_data, positions: [])
+
+        async def run():
+            queue = engine._subscribe_to_market_data(["NIFTY"])
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                loop = asyncio.create_task(engine._trading_loop(strategy, queue, executor))
+                for price in (100.0, 100.0, 101.0):
+                    engine.broker.update_price("NIFTY", price)
+                    await asyncio.sleep(0.02)
+                loop.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await loop
+
+        asyncio.run(run())
+        assert passes == [100.0, 101.0]
+
+
+class TestKernels:
+    def test_apply_trade_matches_reference(self):
+        rng = np.random.default_rng(1)
+        qty = np.zeros(4, dtype=np.int64)
+        avg_px = np.zeros(4)
+        realized = np.zeros(4)
+        ref = [{'qty': 0, 'avg': 0.0, 'realized': 0.0} for _ in range(4)]
+        for _ in range(500):
+            idx = int(rng.integers(4))
+            price = float(rng.uniform(90, 110))
+            pos = ref[idx]
+            if pos['qty'] and rng.random() < 0.4:
+                side, quantity = SIDE_SELL, int(rng.integers(1, pos['qty'] + 1))
+                pos['realized'] += (price - pos['avg']) * quantity
+                pos['qty'] -= quantity
+            else:
+                side, quantity = SIDE_BUY, int(rng.integers(1, 50))
+                pos['avg'] = (pos['avg'] * pos['qty'] + price * quantity) / (pos['qty'] + quantity)
+                pos['qty'] += quantity
+            _apply_trade(qty, avg_px, realized, idx, side, quantity, price)
+        assert qty.tolist() == [p['qty'] for p in ref]
+        np.testing.assert_allclose(avg_px, [p['avg'] for p in ref])
+        np.testing.assert_allclose(realized, [p['realized'] for p in ref])
+
+    def test_performance_kernel(self):
+        equity = np.array([100.0, 110.0, 99.0, 121.0, 115.0])
+        total_return, volatility, sharpe_ratio, max_drawdown = _performance_kernel(equity)
+        returns = equity[1:] / equity[:-1] - 1
+        assert total_return == pytest.approx(0.15)
+        assert volatility == pytest.approx(returns.std() * np.sqrt(252))
+        assert sharpe_ratio == pytest.approx(total_return / volatility)
+        assert max_drawdown == pytest.approx(0.1)
+        assert _performance_kernel(np.array([100.0])) == (0.0, 0.0, 0.0, 0.0)
+
+
+class TestPositionArrays:
+    def test_trades_update_positions_and_cost_basis(self, engine):
+        engine._execute_trade("NIFTY", SIDE_BUY, 10, 100.0, 1.0)
+        engine._execute_trade("NIFTY", SIDE_BUY, 30, 120.0, 1.0)
+        engine._execute_trade("NIFTY", SIDE_SELL, 20, 130.0, 1.0)
+        position = engine.positions["NIFTY"]
+        assert position.quantity == 20
+        assert position.avg_price == pytest.approx(115.0)
+        assert position.realized_pnl == pytest.approx(300.0)
+        assert engine.total_pnl == pytest.approx(300.0)
+        assert engine._cost_basis_sum == pytest.approx(20 * 115.0)
+
+    def test_flat_position_keeps_slot(self, engine):
+        engine._execute_trade("NIFTY", SIDE_BUY, 5, 100.0, 0.0)
+        engine._execute_trade("NIFTY", SIDE_SELL, 5, 101.0, 0.0)
+        assert "NIFTY" not in engine.positions
+        assert engine._sym_idx["NIFTY"] == 0
+        assert engine._cost_basis_sum == pytest.approx(0.0)
+
+    def test_symbol_arrays_grow(self, engine):
+        symbols = [f"SYM{i}" for i in range(INITIAL_SYMBOL_CAPACITY + 5)]
+        for i, symbol in enumerate(symbols):
+            engine._execute_trade(symbol, SIDE_BUY, i + 1, 10.0, 0.0)
+        assert engine._qty.size >= len(symbols)
+        assert [engine.positions[s].quantity for s in symbols] == list(range(1, len(symbols) + 1))
+        assert engine._cost_basis_sum == pytest.approx(10.0 * sum(range(1, len(symbols) + 1)))
+
+    def test_fill_buffer_grows_and_exports(self, engine):
+        idx = engine._symbol_id("NIFTY")
+        n = INITIAL_FILL_CAPACITY + 3
+        for i in range(n):
+            engine._record_fill(i, idx, i % 2, i + 1, 100.0 + i, 0.5)
+        fills = engine.get_fills_df()
+        assert len(fills) == n
+        assert fills['quantity'].iloc[-1] == n
+        assert fills['side'].iloc[:2].tolist() == ['BUY', 'SELL']
+        assert (fills['symbol'] == "NIFTY").all()
+        assert fills['order_id'].is_monotonic_increasing
+
+
+class TestEquityPersistence:
+    def test_chunks_round_trip(self, engine, config):
+        values = np.arange(2 * EQUITY_CHUNK_SIZE + 3, dtype=np.float64)
+        for value in values[:EQUITY_CHUNK_SIZE + 1]:
+            engine._append_equity(value)
+        engine._save_state(force=True)
+        for value in values[EQUITY_CHUNK_SIZE + 1:]:
+            engine._append_equity(value)
+        engine._save_state(force=True)
+        np.testing.assert_array_equal(engine.equity_curve, values)
+
+        reloaded = PaperTradingEngine(config)
+        np.testing.assert_array_equal(reloaded.equity_curve, values)
+        reloaded._append_equity(-1.0)
+        assert reloaded.equity_curve[-1] == -1.0
+
+    def test_legacy_equity_curve_is_migrated(self, config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("data")
+        curve = [1e6 + i for i in range(EQUITY_CHUNK_SIZE + 10)]
+        with open("data/paper_trading_state.json", "w") as f:
+            json.dump({'positions': {}, 'cash': 5.0, 'equity_curve': curve}, f)
+
+        engine = PaperTradingEngine(config)
+        np.testing.assert_array_equal(engine.equity_curve, curve)
+        with open("data/paper_trading_state.json") as f:
+            state = json.load(f)
+        assert 'equity_curve' not in state and state['equity_n'] == len(curve)
+        np.testing.assert_array_equal(np.fromfile(engine.equity_file), curve)
+
+        reloaded = PaperTradingEngine(config)
+        assert reloaded.cash == 5.0
+        np.testing.assert_array_equal(reloaded.equity_curve, curve)
@@ -0,0 +1,193 @@
+import dataclasses
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.governance.scorer import BACKTEST_COLUMNS, StrategyScorer
+from src.governance.selector import StrategySelector
+from src.governance.validator import BacktestMetrics, MetricsBatch, StrategyValidator
+
+_CHECK_VALUES = (None, math.nan, 0.0, 0.05, 0.1, 0.15, 0.18, 0.27, 0.3, 0.4, 0.44,
+                 1.0, 1.1, 1.25, 1.4, 100, 119, 120, -0.16, -0.05)
+
+_METRIC_SCALES = {
+    'annualized_return': 0.5, 'total_return': 1.0, 'sharpe_ratio': 3.0,
+    'volatility': 0.3, 'max_drawdown': 0.15, 'var_95': 0.05, 'cvar_95': 0.1,
+    'total_trades': 800, 'win_rate': 1.0, 'profit_factor': 3.0, 'avg_win': 2.0,
+    'avg_loss': 2.0, 'theta_harvest': 2000, 'vega_exposure': 1000,
+    'gamma_exposure': 100, 'delta_exposure': 500
+}
+
+
+@pytest.fixture
+def validator():
+    return StrategyValidator({})
+
+
+@pytest.fixture
+def backtest_rows(validator):
+    rng = np.random.default_rng(3)
+    return [
+        {key: _CHECK_VALUES[rng.integers(len(_CHECK_VALUES))] for key in validator._bt_keys}
+        for _ in range(500)
+    ]
+
+
+def _entries(n, seed=5):
+    rng = np.random.default_rng(seed)
+    entries = []
+    for i in range(n):
+        backtest = {k: float(abs(rng.normal()) * v) for k, v in _METRIC_SCALES.items()}
+        walk_forward = [
+            {k: float(abs(rng.normal()) * 0.1 + 1) for k in ('annualized_return', 'sharpe_ratio', 'max_drawdown')}
+            for _ in range(5)
+        ]
+        entries.append((f"S{i}", backtest, walk_forward))
+    return entries
+
+
+class TestValidateMany:
+    def test_matches_scalar_checks(self, validator, backtest_rows):
+        batch = validator.validate_many(pd.DataFrame(backtest_rows))
+        for row, (_, result) in zip(backtest_rows, batch.iterrows()):
+            violations, warnings = [], []
+            validator._validate_backtest_results(row, violations, warnings)
+            assert result.violation_count == len(violations)
+            assert result.warning_count == len(warnings)
+            assert result.is_valid == (not violations)
+
+    def test_none_and_nan_metrics_fail_their_check(self, validator):
+        batch = validator.validate_many(pd.DataFrame([
+            {'annualized_return': None, 'sharpe_ratio': 2.0},
+            {'annualized_return': math.nan, 'sharpe_ratio': 2.0},
+            {'annualized_return': 0.5, 'sharpe_ratio': 2.0},
+        ]))
+        bit = 1 << validator._bt_keys.index('annualized_return')
+        assert (batch.violation_fingerprint.to_numpy() & bit).tolist() == [bit, bit, 0]
+        for value in (None, math.nan):
+            violations, warnings = [], []
+            validator._validate_backtest_results({'annualized_return': value}, violations, warnings)
+            assert any(v.startswith("Annual return") for v in violations)
+
+    def test_missing_columns_take_defaults(self, validator):
+        frame = validator.validate_many(pd.DataFrame({'sharpe_ratio': [0.5, 2.0]}))
+        for sharpe, (_, result) in zip((0.5, 2.0), frame.iterrows()):
+            violations, warnings = [], []
+            validator._validate_backtest_results({'sharpe_ratio': sharpe}, violations, warnings)
+            assert result.violation_count == len(violations)
+
+    def test_structured_array_matches_frame(self, validator, backtest_rows):
+        rows = [{k: math.nan if v is None else v for k, v in row.items()} for row in backtest_rows]
+        batch = np.zeros(len(rows), dtype=MetricsBatch)
+        for name in validator._bt_keys:
+            batch[name] = [row[name] for row in rows]
+        from_array = validator.validate_many(batch)
+        from_frame = validator.validate_many(pd.DataFrame(rows))
+        pd.testing.assert_frame_equal(from_array, from_frame.reset_index(drop=True))
+
+    def test_backtest_metrics_matches_dict(self, validator):
+        metrics = BacktestMetrics(annualized_return=0.1, sharpe_ratio=1.05, total_trades=110)
+        a = validator.validate_strategy("x", metrics, [], {})
+        b = validator.validate_strategy("x", metrics._asdict(), [], {})
+        assert (a.violations, a.warnings, a.score) == (b.violations, b.warnings, b.score)
+
+
+class TestValidatorCache:
+    def test_from_config_shares_and_bounds_instances(self, monkeypatch):
+        monkeypatch.setattr(StrategyValidator, '_INSTANCES', type(StrategyValidator._INSTANCES)())
+        first = StrategyValidator.from_config({'min_sharpe_ratio': 0})
+        assert StrategyValidator.from_config({'min_sharpe_ratio': 0}) is first
+        for i in range(1, StrategyValidator._MAX_INSTANCES + 1):
+            StrategyValidator.from_config({'min_sharpe_ratio': i})
+        assert len(StrategyValidator._INSTANCES) == StrategyValidator._MAX_INSTANCES
+        assert StrategyValidator.from_config({'min_sharpe_ratio': 0}) is not first
+
+    def test_unhashable_config_is_not_cached(self):
+        config = {'symbols': ['NIFTY']}
+        assert StrategyValidator.from_config(config) is not StrategyValidator.from_config(config)
+
+
+class TestScorerBatch:
+    def test_calculate_batch_matches_scalar(self):
+        scorer = StrategyScorer({})
+        entries = _entries(200)
+        metrics = np.array([[b[name] for name in BACKTEST_COLUMNS] for _, b, _ in entries])
+        stability = np.array([scorer.calculate_stability_score(w) for _, _, w in entries])
+        batch = scorer.calculate_batch(metrics, stability)
+        for row, (_, backtest, walk_forward) in zip(batch, entries):
+            expected = [
+                scorer.calculate_return_score(backtest),
+                scorer.calculate_risk_score(backtest),
+                scorer.calculate_stability_score(walk_forward),
+                scorer.calculate_capacity_score(backtest),
+                scorer.calculate_greek_score(backtest),
+            ]
+            expected.append(scorer.calculate_composite_score(*expected))
+            assert row.tolist() == pytest.approx(expected, abs=1e-12)
+
+    def test_none_and_nan_metrics_count_as_zero(self):
+        scorer = StrategyScorer({})
+        _, backtest, _ = _entries(1)[0]
+        zeroed = dict(backtest, sharpe_ratio=0.0, win_rate=0.0)
+        for missing in (None, math.nan):
+            results = dict(backtest, sharpe_ratio=missing, win_rate=missing)
+            assert scorer.calculate_return_score(results) == scorer.calculate_return_score(zeroed)
+            assert scorer.calculate_capacity_score(results) == scorer.calculate_capacity_score(zeroed)
+
+    def test_infinite_metrics_take_full_credit(self):
+        scorer = StrategyScorer({})
+        _, backtest, _ = _entries(1)[0]
+        # A run with no losing trades reports an infinite profit factor
+        results = dict(backtest, profit_factor=math.inf, sharpe_ratio=math.inf)
+        saturated = dict(backtest, profit_factor=1e12, sharpe_ratio=1e12)
+        capacity = scorer.calculate_capacity_score(results)
+        assert math.isfinite(capacity)
+        assert capacity == scorer.calculate_capacity_score(saturated)
+        assert scorer.calculate_return_score(results) == scorer.calculate_return_score(saturated)
+
+
+class TestSelectorBatch:
+    @staticmethod
+    def _astuple(score):
+        return dataclasses.astuple(score)
+
+    def test_batch_matches_evaluate_strategy(self):
+        entries = _entries(300)
+        scalar = StrategySelector({})
+        expected = [scalar.evaluate_strategy(name, b, w, {}) for name, b, w in entries]
+        for max_workers in (None, 1):
+            selector = StrategySelector({})
+            scores = selector.evaluate_strategies_batch(entries, max_workers=max_workers)
+            for got, want in zip(scores, expected):
+                assert got.strategy_name == want.strategy_name
+                assert got.suitability == want.suitability
+                assert self._astuple(got)[1:7] == pytest.approx(self._astuple(want)[1:7], abs=1e-12)
+            names = [name for name, _, _ in entries]
+            assert selector.select_strategies(names, 10) == scalar.select_strategies(names, 10)
+
+    def test_none_and_nan_metrics_match_scalar(self):
+        entries = [
+            (name, dict(b, sharpe_ratio=None, var_95=math.nan), w)
+            for name, b, w in _entries(20, seed=11)
+        ]
+        scalar = StrategySelector({})
+        expected = [scalar.evaluate_strategy(name, b, w, {}) for name, b, w in entries]
+        scores = StrategySelector({}).evaluate_strategies_batch(entries)
+        for got, want in zip(scores, expected):
+            assert self._astuple(got)[1:7] == pytest.approx(self._astuple(want)[1:7], abs=1e-12)
+            assert got.suitability == want.suitability
+
+    def test_unscorable_entry_gets_placeholder(self):
+        entries = _entries(3)
+        entries[1] = ("broken", None, [])
+        selector = StrategySelector({})
+        scores = selector.evaluate_strategies_batch(entries)
+        expected = StrategySelector({}).evaluate_strategy("broken", None, [], {})
+        assert self._astuple(scores[1]) == self._astuple(expected)
+        assert "broken" not in selector.strategy_scores
+        assert set(selector.strategy_scores) == {"S0", "S2"}
+
+    def test_empty_batch(self):
+        assert StrategySelector({}).evaluate_strategies_batch([]) == []
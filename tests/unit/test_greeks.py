@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.options.greeks import Greeks, GreeksCalculator, PositionBook
+
+
+@pytest.fixture
+def calculator():
+    GreeksCalculator.clear_cache()
+    return GreeksCalculator()
+
+
+@pytest.fixture
+def option_grid():
+    # Values already on the scalar cache's rounding grid, so both paths see
+    # identical inputs
+    rng = np.random.default_rng(7)
+    n = 200
+    return {
+        "spot_price": np.round(rng.uniform(80, 120, n), 2),
+        "strike_price": np.round(rng.uniform(80, 120, n), 2),
+        "time_to_expiry": np.round(rng.uniform(1 / 365, 1.0, n), 6),
+        "risk_free_rate": np.round(rng.uniform(0.0, 0.08, n), 5),
+        "volatility": np.round(rng.uniform(0.05, 0.8, n), 4),
+        "is_call": rng.random(n) < 0.5,
+    }
+
+
+class TestGreeksBatch:
+    def test_batch_matches_scalar(self, calculator, option_grid):
+        batch = calculator.calculate_greeks_batch(**option_grid)
+        for i in range(option_grid["is_call"].size):
+            scalar = calculator.calculate_greeks(
+                float(option_grid["spot_price"][i]),
+                float(option_grid["strike_price"][i]),
+                float(option_grid["time_to_expiry"][i]),
+                float(option_grid["risk_free_rate"][i]),
+                float(option_grid["volatility"][i]),
+                "CALL" if option_grid["is_call"][i] else "PUT",
+            )
+            for name in ("delta", "gamma", "theta", "vega", "rho"):
+                assert getattr(scalar, name) == pytest.approx(batch[name][i], rel=1e-9, abs=1e-12)
+
+    def test_array_inputs_use_batch_path(self, calculator, option_grid):
+        calls = option_grid["is_call"]
+        args = [option_grid[k][calls] for k in
+                ("spot_price", "strike_price", "time_to_expiry", "risk_free_rate", "volatility")]
+        greeks = calculator.calculate_greeks(*args, "CALL")
+        batch = calculator.calculate_greeks_batch(*args, True)
+        np.testing.assert_allclose(greeks.delta, batch["delta"])
+        np.testing.assert_allclose(greeks.rho, batch["rho"])
+
+    def test_expired_option_keeps_limits(self, calculator):
+        call = calculator.calculate_greeks(110.0, 100.0, 0.0, 0.05, 0.2, "CALL")
+        put = calculator.calculate_greeks(110.0, 100.0, 0.0, 0.05, 0.2, "PUT")
+        batch = calculator.calculate_greeks_batch(110.0, 100.0, 0.0, 0.05, 0.2, [True, False])
+        assert call.theta == put.theta == 0.0
+        assert call.delta == pytest.approx(batch["delta"][0])
+        assert put.delta == pytest.approx(batch["delta"][1])
+
+    def test_put_call_probabilities_sum_to_one(self, calculator):
+        itm = calculator.calculate_probability_itm(100.0, 140.0, 0.25, 0.05, 0.2, "CALL")
+        otm = calculator.calculate_probability_otm(100.0, 140.0, 0.25, 0.05, 0.2, "CALL")
+        assert itm + otm == pytest.approx(1.0)
+        assert otm == calculator.calculate_probability_itm(100.0, 140.0, 0.25, 0.05, 0.2, "PUT")
+
+
+def _position(underlying, side, quantity, delta, gamma, theta, vega, rho):
+    return SimpleNamespace(
+        underlying=underlying, side=side, quantity=quantity,
+        greeks=Greeks(delta, gamma, theta, vega, rho)
+    )
+
+
+class TestPositionBook:
+    @pytest.fixture
+    def positions(self):
+        return [
+            _position("NIFTY", "BUY", 50, 0.5, 0.01, -2.0, 0.1, 0.05),
+            _position("NIFTY", "SELL", 25, 0.3, 0.02, -1.0, 0.2, 0.02),
+            _position("BANKNIFTY", "BUY", 15, -0.4, 0.03, -3.0, 0.3, -0.04),
+            SimpleNamespace(underlying="NIFTY", side="BUY", quantity=10, greeks=None),
+        ]
+
+    def test_portfolio_greeks_match_loop(self, calculator, positions):
+        expected = dict.fromkeys(PositionBook.GREEK_NAMES, 0.0)
+        for p in positions:
+            if p.greeks is None:
+                continue
+            sign = 1 if p.side == "BUY" else -1
+            for name in expected:
+                expected[name] += getattr(p.greeks, name) * p.quantity * sign
+
+        book = PositionBook.from_positions(positions)
+        assert len(book.qty) == 3
+        assert book.portfolio_greeks() == pytest.approx(expected)
+        assert calculator.calculate_portfolio_greeks(positions) == pytest.approx(expected)
+
+    def test_risk_metrics_list_and_book_agree(self, calculator, positions):
+        spot_prices = {"NIFTY": 20000.0, "BANKNIFTY": 45000.0}
+        from_list = calculator.calculate_risk_metrics(positions, spot_prices)
+        from_book = calculator.calculate_risk_metrics(PositionBook.from_positions(positions), spot_prices)
+        assert from_list == pytest.approx(from_book)
+        assert from_list["dollar_delta"] == pytest.approx(
+            0.5 * 50 * 20000 - 0.3 * 25 * 20000 - 0.4 * 15 * 45000
+        )
+
+    def test_unpriced_underlying_drops_out_of_dollar_delta(self, positions):
+        book = PositionBook.from_positions(positions, {"NIFTY": 20000.0})
+        assert book.dollar_delta() == pytest.approx(0.5 * 50 * 20000 - 0.3 * 25 * 20000)
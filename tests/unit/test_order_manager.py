@@ -0,0 +1,373 @@
+import csv
+import importlib.util
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+# src.engine's __init__ imports both engines and the global config; load the
+# order manager on its own, it has no package-relative imports
+_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "src", "engine", "order_manager.py")
+_spec = importlib.util.spec_from_file_location("order_manager", _PATH)
+om = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(om)
+
+
+def _fill_args(seq):
+    return (f"F{seq}", f"O{seq % 3}", "L", "NIFTY", "BUY", seq + 1, 100.0 + seq, 0.5, seq)
+
+
+@pytest.fixture
+def manager():
+    return om.OrderManager()
+
+
+def _order(manager, quantity=100):
+    return manager.create_order(
+        om.OrderType.LIMIT, [om.OrderLeg("NIFTY", "BUY", quantity, price=100.0)]
+    )
+
+
+class TestFillRing:
+    def test_append_and_row(self):
+        ring = om.FillRing(capacity=8)
+        seq = ring.append(*_fill_args(0))
+        fill = ring.row(seq)
+        assert seq == 0 and len(ring) == 1
+        assert fill.fill_id == "F0"
+        assert fill.quantity == 1
+        assert fill.price == 100.0
+
+    def test_wrap_drops_oldest_block(self):
+        ring = om.FillRing(capacity=8, flush_block=2)
+        for seq in range(11):
+            ring.append(*_fill_args(seq))
+        assert (ring.tail, ring.head) == (4, 11)
+        assert 3 not in ring and 4 in ring
+        with pytest.raises(IndexError):
+            ring.row(3)
+        columns = ring.columns()
+        assert columns["fill_id"].tolist() == [f"F{seq}" for seq in range(4, 11)]
+        assert columns["quantity"].tolist() == list(range(5, 12))
+
+    def test_extend_matches_append(self):
+        a = om.FillRing(capacity=8, flush_block=3)
+        b = om.FillRing(capacity=8, flush_block=3)
+        for seq in range(20):
+            a.append(*_fill_args(seq)[:-1], 7)
+        rows = b.extend(
+            [f"F{seq}" for seq in range(20)],
+            [f"O{seq % 3}" for seq in range(20)],
+            "L", "NIFTY", "BUY",
+            np.arange(1, 21), 100.0 + np.arange(20), np.full(20, 0.5), 7
+        )
+        assert rows == range(0, 20)
+        assert a.head == b.head == 20
+        # Blocks spill in different steps; the rows both still hold must agree
+        held = min(len(a), len(b))
+        for name, values in a.columns().items():
+            assert values[-held:].tolist() == b.columns()[name][-held:].tolist()
+
+    def test_spill_writes_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        ring = om.FillRing(capacity=4, flush_block=2, spill_dir=str(tmp_path))
+        for seq in range(6):
+            ring.append(*_fill_args(seq))
+        ring.write_spills()
+        spilled = sorted(os.listdir(tmp_path))
+        assert len(spilled) == 1 and spilled[0].endswith("_000000000000.parquet")
+        table = pq.read_table(tmp_path / spilled[0])
+        assert table.column("fill_id").to_pylist() == ["F0", "F1"]
+        # Spilled slots no longer pin their strings
+        assert ring.fill_id[0] == "F4"
+
+    def test_sessions_do_not_overwrite_spills(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        managers = [om.OrderManager(max_fills=4, fill_spill_dir=str(tmp_path)) for _ in range(2)]
+        for i, manager in enumerate(managers):
+            order_id = _order(manager)
+            manager.add_fills(
+                order_id, [1] * 6, [100.0 + i] * 6, [0.0] * 6, "L", "BUY", "NIFTY"
+            )
+        # Each manager spills its first two fills as blocks 0 and 1
+        spilled = os.listdir(tmp_path)
+        assert len(spilled) == 4
+        assert sorted(name[-20:] for name in spilled) == [
+            "000000000000.parquet", "000000000000.parquet",
+            "000000000001.parquet", "000000000001.parquet"
+        ]
+        prices = sorted(pq.read_table(tmp_path / name).column("price")[0].as_py() for name in spilled)
+        assert prices == [100.0, 100.0, 101.0, 101.0]
+
+    def test_no_spill_without_directory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        ring = om.FillRing(capacity=4, flush_block=2)
+        for seq in range(6):
+            ring.append(*_fill_args(seq))
+        assert os.listdir(tmp_path) == []
+        assert len(ring) == 4
+
+    def test_spilled_fills_leave_order_lookup(self):
+        manager = om.OrderManager(max_fills=4)
+        order_id = _order(manager)
+        manager.add_fills(order_id, [1] * 6, [100.0] * 6, [0.0] * 6, "L", "BUY", "NIFTY")
+        fills = manager.get_fills_for_order(order_id)
+        assert [f.fill_id for f in fills] == [f"FILL_{i:06d}" for i in range(2, 6)]
+        assert manager.get_order(order_id).filled_quantity == 6
+
+
+class TestOrderStore:
+    def test_grow_keeps_rows(self):
+        store = om.OrderStore(capacity=2)
+        for i in range(5):
+            store.add(f"O{i}", om.OrderType.MARKET, [om.OrderLeg("X", "BUY", i + 1)], None, i)
+        assert store.status.size >= 5
+        assert store.remaining_quantity[:5].tolist() == [1, 2, 3, 4, 5]
+        assert store.view(store.index["O3"]).remaining_quantity == 4
+
+    def test_compacted_renumbers_live_rows(self):
+        store = om.OrderStore(capacity=4)
+        for i in range(6):
+            store.add(f"O{i}", om.OrderType.MARKET, [om.OrderLeg("X", "BUY", i + 1)], None, i)
+        for order_id in ("O0", "O2", "O3"):
+            store.remove(order_id)
+        assert store.dead == 3
+        compact = store.compacted()
+        assert compact.n == 3 and compact.dead == 0
+        assert compact.index == {"O1": 0, "O4": 1, "O5": 2}
+        assert compact.remaining_quantity[:3].tolist() == [2, 5, 6]
+        assert compact.view(1).order_id == "O4"
+
+
+class TestOrdersView:
+    def test_read_only_snapshots(self, manager):
+        order_id = _order(manager)
+        view = manager.orders
+        assert len(view) == 1 and order_id in view
+        assert list(view) == [order_id]
+        with pytest.raises(TypeError):
+            view[order_id] = None
+        snapshot = view[order_id]
+        snapshot.filled_quantity = 99
+        assert manager.get_order(order_id).filled_quantity == 0
+
+
+class TestAddFills:
+    def test_add_fills_matches_add_fill(self):
+        quantities = [10, 20, 30]
+        prices = [101.0, 102.5, 99.75]
+        commissions = [1.0, 2.0, 0.5]
+
+        scalar = om.OrderManager()
+        a = _order(scalar)
+        for q, p, c in zip(quantities, prices, commissions):
+            scalar.add_fill(a, "L", "NIFTY", "BUY", q, p, c)
+
+        batch = om.OrderManager()
+        b = _order(batch)
+        fill_ids = batch.add_fills(b, quantities, prices, commissions, "L", "BUY", "NIFTY")
+
+        assert fill_ids == ["FILL_000000", "FILL_000001", "FILL_000002"]
+        x, y = scalar.get_order(a), batch.get_order(b)
+        assert x.status == y.status == om.OrderStatus.PARTIALLY_FILLED
+        assert x.filled_quantity == y.filled_quantity == 60
+        assert x.remaining_quantity == y.remaining_quantity == 40
+        assert x.notional_value == pytest.approx(y.notional_value)
+        assert x.total_commission == pytest.approx(y.total_commission)
+        assert x.fill_percentage == y.fill_percentage == 0.6
+        assert [f.quantity for f in batch.get_fills_for_order(b)] == quantities
+
+
+class TestFillStatus:
+    def test_fill_completes_order(self, manager):
+        order_id = _order(manager, quantity=5)
+        manager.add_fills(order_id, [2, 3], [100.0, 100.0], [0.0, 0.0], "L", "BUY", "NIFTY")
+        order = manager.get_order(order_id)
+        assert order.status == om.OrderStatus.FILLED
+        assert order.fill_percentage == 1.0
+        assert order_id not in {o.order_id for o in manager.get_active_orders()}
+
+
+class TestAddFillsForOrders:
+    def test_matches_add_fills(self):
+        rng = np.random.default_rng(0)
+        order_index = rng.integers(0, 4, size=40)
+        quantities = rng.integers(1, 5, size=40)
+        prices = rng.uniform(90, 110, size=40)
+        commissions = rng.uniform(0, 1, size=40)
+
+        per_order = om.OrderManager()
+        ids_a = [_order(per_order) for _ in range(4)]
+        for i, order_id in enumerate(ids_a):
+            mask = order_index == i
+            per_order.add_fills(
+                order_id, quantities[mask], prices[mask], commissions[mask], "L", "BUY", "NIFTY"
+            )
+
+        mixed = om.OrderManager()
+        ids_b = [_order(mixed) for _ in range(4)]
+        mixed.add_fills_for_orders(
+            [ids_b[i] for i in order_index], quantities, prices, commissions, "L", "BUY", "NIFTY"
+        )
+
+        for a, b in zip(ids_a, ids_b):
+            x, y = per_order.get_order(a), mixed.get_order(b)
+            assert x.status == y.status
+            assert x.filled_quantity == y.filled_quantity
+            assert x.remaining_quantity == y.remaining_quantity
+            assert x.notional_value == pytest.approx(y.notional_value)
+            assert x.total_commission == pytest.approx(y.total_commission)
+            assert x.fill_percentage == pytest.approx(y.fill_percentage)
+            assert len(mixed.get_fills_for_order(b)) == len(per_order.get_fills_for_order(a))
+
+    def test_unknown_order_rejects_burst(self, manager):
+        order_id = _order(manager)
+        fill_ids = manager.add_fills_for_orders(
+            [order_id, "ORD_missing"], [1, 1], [100.0, 100.0], [0.0, 0.0], "L", "BUY", "NIFTY"
+        )
+        assert fill_ids == []
+        assert len(manager.fills) == 0
+        assert manager.get_order(order_id).filled_quantity == 0
+
+
+class TestCleanup:
+    def test_cleanup_compacts_store(self, manager):
+        ids = [_order(manager) for _ in range(4)]
+        for order_id in ids[:3]:
+            manager.cancel_order(order_id)
+        manager.cleanup_old_orders(days=-1)
+        assert list(manager.orders) == ids[3:]
+        assert manager._store.n == 1
+        assert manager.get_order(ids[3]).status == om.OrderStatus.PENDING
+
+
+class TestFillIndex:
+    def test_cleanup_drops_fill_index(self, manager):
+        ids = [_order(manager, quantity=1) for _ in range(3)]
+        for order_id in ids:
+            manager.add_fill(order_id, "L", "NIFTY", "BUY", 1, 100.0, 0.0)
+        manager.cleanup_old_orders(days=-1)
+        assert manager._fills_by_order == {}
+        assert manager.get_fills_for_order(ids[0]) == []
+
+
+class _BlockingManager(om.OrderManager):
+    """Order manager whose broker calls wait until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_call = threading.Event()
+        self.release = threading.Event()
+        self.submits = 0
+
+    def _submit_to_broker(self, order):
+        self.submits += 1
+        self.in_call.set()
+        assert self.release.wait(5)
+        return True
+
+    def _cancel_with_broker(self, order):
+        self.in_call.set()
+        assert self.release.wait(5)
+        return True
+
+
+def _in_background(fn, *args):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(fn(*args)))
+    thread.start()
+    return thread, results
+
+
+class TestBrokerCallRaces:
+    def test_cancel_during_submit_does_not_resurrect(self):
+        manager = _BlockingManager()
+        order_id = _order(manager)
+        thread, results = _in_background(manager.submit_order, order_id)
+        assert manager.in_call.wait(5)
+
+        assert manager.get_order(order_id).status == om.OrderStatus.SUBMITTING
+        assert not manager.submit_order(order_id)
+        assert not manager.cancel_order(order_id)
+
+        manager.release.set()
+        thread.join()
+        assert results == [True]
+        assert manager.submits == 1
+        assert manager.get_order(order_id).status == om.OrderStatus.SUBMITTED
+        assert manager.cancel_order(order_id)
+        assert manager.get_order(order_id).status == om.OrderStatus.CANCELLED
+        assert not manager.submit_order(order_id)
+
+    def test_fill_during_cancel_is_kept(self):
+        manager = _BlockingManager()
+        order_id = _order(manager, quantity=5)
+        thread, results = _in_background(manager.cancel_order, order_id)
+        assert manager.in_call.wait(5)
+
+        manager.add_fills(order_id, [5], [100.0], [0.0], "L", "BUY", "NIFTY")
+        manager.release.set()
+        thread.join()
+        assert results == [True]
+        assert manager.get_order(order_id).status == om.OrderStatus.FILLED
+
+    def test_spill_io_runs_outside_lock(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow.parquet")
+        manager = om.OrderManager(max_fills=4, fill_spill_dir=str(tmp_path))
+        write_spills = manager.fills.write_spills
+        queued = []
+
+        def checked_write():
+            assert not manager._lock.locked()
+            queued.append(len(manager.fills._pending_spills))
+            write_spills()
+
+        monkeypatch.setattr(manager.fills, "write_spills", checked_write)
+        order_id = _order(manager)
+        manager.add_fills(order_id, [1] * 6, [100.0] * 6, [0.0] * 6, "L", "BUY", "NIFTY")
+        # Six fills into a four-slot ring spill two one-row blocks
+        assert queued == [2]
+        assert len(os.listdir(tmp_path)) == 2
+
+    def test_failed_cancel_restores_status(self, manager, monkeypatch):
+        order_id = _order(manager)
+        monkeypatch.setattr(manager, "_cancel_with_broker", lambda order: False)
+        assert not manager.cancel_order(order_id)
+        assert manager.get_order(order_id).status == om.OrderStatus.PENDING
+        assert order_id in {o.order_id for o in manager.get_active_orders()}
+
+
+@pytest.fixture
+def ist_local_time(monkeypatch):
+    # A non-UTC zone so a UTC export cannot match local snapshots by accident
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    monkeypatch.setenv("TZ", "Asia/Kolkata")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestExportTimestamps:
+    def test_exported_times_match_order_snapshot(self, ist_local_time, tmp_path):
+        manager = om.OrderManager()
+        order_id = _order(manager)
+        manager.add_fill(order_id, "L", "NIFTY", "BUY", 1, 100.0, 0.0)
+        manager.export_orders(str(tmp_path / "orders.csv"))
+        manager.export_fills(str(tmp_path / "fills.csv"))
+
+        with open(tmp_path / "orders.csv", newline="") as f:
+            row = next(csv.DictReader(f))
+        with open(tmp_path / "fills.csv", newline="") as f:
+            fill_row = next(csv.DictReader(f))
+
+        order = manager.orders[order_id]
+        fill = manager.get_fills_for_order(order_id)[0]
+        exported = datetime.fromisoformat(row["created_time"])
+        assert abs((exported - order.created_time).total_seconds()) < 1e-5
+        exported = datetime.fromisoformat(fill_row["timestamp"])
+        assert abs((exported - fill.timestamp).total_seconds()) < 1e-5